@@ -23,11 +23,19 @@ from a2a.types import AgentCapabilities, AgentCard, AgentSkill, TaskState, TextP
 from a2a.utils import new_agent_text_message, new_task
 
 from starlette.middleware.authentication import AuthenticationMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
 
+from git_issue_agent.agents import GitAgents
 from git_issue_agent.auth import on_auth_error, BearerAuthBackend, auth_headers
+from git_issue_agent.cache import CACHEABLE_TOOLS, ToolResultCache, credential_scope
 from git_issue_agent.config import settings, Settings
 from git_issue_agent.event import Event
+from git_issue_agent.issue_index import IssueIndex, IssueIndexTool
 from git_issue_agent.main import GitIssueAgent
+from git_issue_agent.metrics import metrics
+from git_issue_agent.tools import CachedTool
+from git_issue_agent.webhooks import WEBHOOK_PATH, GithubWebhookHandler
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=settings.LOG_LEVEL, stream=sys.stdout, format='%(levelname)s: %(message)s')
@@ -67,6 +75,11 @@ def get_agent_card(host: str, port: int):
     )
 
 
+async def metrics_endpoint(request: Request) -> JSONResponse:
+    """Returns the in-process agent metrics, e.g. the fast path extractor and tool cache hit rates."""
+    return JSONResponse(metrics.snapshot())
+
+
 class A2AEvent(Event):
     """
     A class to handle events for A2A Agent.
@@ -113,16 +126,45 @@ class GithubExecutor(AgentExecutor):
     """
     A class to handle research execution for A2A Agent.
     """
+    def __init__(self):
+        # Build the crew templates once; every request works on its own copy
+        self.agents = GitAgents(settings)
+        # webhooks invalidate cached issue data, so it can be kept for much longer
+        freshness_ttl = settings.WEBHOOK_FRESHNESS_TTL if settings.GITHUB_WEBHOOK_SECRET else None
+        self.tool_cache = None
+        if settings.TOOL_CACHE_TTL:
+            self.tool_cache = ToolResultCache(
+                ttl=freshness_ttl or settings.TOOL_CACHE_TTL,
+                max_entries=settings.TOOL_CACHE_MAX_ENTRIES,
+            )
+        self.issue_index = None
+        # The index is shared by all callers, so it is only synced with the service token,
+        # which every request uses when it is set; per-user tokens could leak private issues
+        if settings.ISSUE_INDEX_PATH and not settings.GITHUB_TOKEN:
+            logging.warning("ISSUE_INDEX_PATH is set but GITHUB_TOKEN is not; the issue index is disabled")
+        elif settings.ISSUE_INDEX_PATH:
+            logging.info("Using local issue index at %s", settings.ISSUE_INDEX_PATH)
+            self.issue_index = IssueIndex(
+                settings.ISSUE_INDEX_PATH,
+                api_url=settings.GITHUB_API_URL,
+                sync_interval=freshness_ttl or settings.ISSUE_INDEX_SYNC_INTERVAL,
+                max_pages=settings.ISSUE_INDEX_MAX_PAGES,
+            )
+
     async def _run_agent(self,
         messages: dict,
         settings: Settings,
         event_emitter: Event,
         toolkit: ToolCollection):
 
+        if self.issue_index is not None:
+            toolkit = list(toolkit or []) + [IssueIndexTool(index=self.issue_index, token=settings.GITHUB_TOKEN)]
+
         git_issue_agent = GitIssueAgent(
             config=settings,
             eventer=event_emitter,
             mcp_toolkit=toolkit,
+            agents=self.agents,
         )
         result = await git_issue_agent.execute(messages)
         await event_emitter.emit_event(result, True)
@@ -190,6 +232,12 @@ class GithubExecutor(AgentExecutor):
                             "No issue-related tools found from the GitHub MCP server. "
                             "Ensure your PAT scopes allow issue access and the server is reachable."
                         )
+                    if self.tool_cache is not None:
+                        scope = credential_scope(headers)
+                        issue_tools = [
+                            CachedTool(tool, cache=self.tool_cache, scope=scope) if tool.name in CACHEABLE_TOOLS else tool
+                            for tool in issue_tools
+                        ]
                     await self._run_agent(messages, settings, event_emitter, issue_tools)
             else:
                 await self._run_agent(messages, settings,
@@ -213,8 +261,9 @@ def run():
     """
     agent_card = get_agent_card(host="0.0.0.0", port=settings.SERVICE_PORT)
 
+    executor = GithubExecutor()
     request_handler = DefaultRequestHandler(
-        agent_executor=GithubExecutor(),
+        agent_executor=executor,
         task_store=InMemoryTaskStore(),
     )
 
@@ -224,6 +273,15 @@ def run():
     )
 
     app = server.build()  # this returns a Starlette app
+    app.add_route("/metrics", metrics_endpoint, methods=["GET"])
+    if settings.GITHUB_WEBHOOK_SECRET:
+        logging.info("GITHUB_WEBHOOK_SECRET is set - accepting GitHub webhooks at %s", WEBHOOK_PATH)
+        webhook_handler = GithubWebhookHandler(
+            settings.GITHUB_WEBHOOK_SECRET,
+            tool_cache=executor.tool_cache,
+            issue_index=executor.issue_index,
+        )
+        app.add_route(WEBHOOK_PATH, webhook_handler.handle, methods=["POST"])
     if settings.JWKS_URI:
         logging.info("JWKS_URI is set - using JWT Validation middleware")
         app.add_middleware(AuthenticationMiddleware, backend=BearerAuthBackend(), on_error=on_auth_error)
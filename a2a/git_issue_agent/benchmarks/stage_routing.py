@@ -0,0 +1,144 @@
+"""
+Benchmark for per-stage model routing (STAGE_MODEL_OVERRIDES).
+
+Runs GitIssueAgent end to end on a two-repository query against a stub
+OpenAI-compatible LLM server and reports the end-to-end latency of each routing
+profile. The stub answers each crew with a canned ReAct "Final Answer" after a
+fixed, per-model delay, so the numbers reflect which stages wait on the slow model,
+not model quality. Fast path extraction is disabled so the pre-requisite crew runs.
+
+Usage (from a2a/git_issue_agent):
+
+    OTEL_SDK_DISABLED=true uv run python -m benchmarks.stage_routing --runs 3 --small-latency 0.3 --large-latency 2.0
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from collections import Counter
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from git_issue_agent.agents import GitAgents
+from git_issue_agent.config import Settings
+from git_issue_agent.main import GitIssueAgent
+
+SMALL_MODEL = "stub-small"
+LARGE_MODEL = "stub-large"
+
+PROFILES = {
+    "single-model": {},
+    "small-extractor": {"prereq_identifier": {"model": f"openai/{SMALL_MODEL}"}},
+    "large-synthesis-only": {
+        "prereq_identifier": {"model": f"openai/{SMALL_MODEL}"},
+        "issue_researcher": {"model": f"openai/{SMALL_MODEL}"},
+    },
+}
+
+QUERY = "Compare the open bugs in kagenti/kagenti and kagenti/agent-examples"
+TARGETS = {"targets": [
+    {"owner": "kagenti", "repo": "kagenti", "issue_numbers": None},
+    {"owner": "kagenti", "repo": "agent-examples", "issue_numbers": None},
+]}
+
+############
+# Stub LLM
+############
+
+class StubLLM:
+    def __init__(self, latencies: dict[str, float]):
+        self.latencies = latencies
+        self.calls = Counter()
+        self.lock = threading.Lock()
+
+    def respond(self, body: dict) -> str:
+        """Picks a canned final answer for the crew, recognised by the agent role in the system prompt."""
+        system = next((m.get("content") or "" for m in body.get("messages", []) if m.get("role") == "system"), "")
+        if "Pre-requisite Extractor" in system:
+            answer = json.dumps(TARGETS)
+        elif "Report Synthesizer" in system:
+            answer = "Both repositories have a handful of open bugs; kagenti/kagenti has more in the UI area."
+        else:
+            answer = "There are 4 open bugs, mostly about deployment."
+        return f"Thought: I now can give a great answer\nFinal Answer: {answer}"
+
+    async def chat_completions(self, request: Request) -> JSONResponse:
+        body = await request.json()
+        model = body.get("model", "")
+        with self.lock:
+            self.calls[model] += 1
+        await asyncio.sleep(self.latencies.get(model, 0))
+        return JSONResponse({
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": self.respond(body)}}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        })
+
+
+def start_stub_server(stub: StubLLM, port: int) -> uvicorn.Server:
+    app = Starlette()
+    app.add_route("/v1/chat/completions", stub.chat_completions, methods=["POST"])
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+############
+# Benchmark
+############
+
+async def run_profile(config: Settings, runs: int) -> list[float]:
+    # Crew templates are built once, as in the A2A executor
+    agents = GitAgents(config)
+    latencies = []
+    for _ in range(runs):
+        agent = GitIssueAgent(config=config, mcp_toolkit=[], agents=agents)
+        start = time.monotonic()
+        await agent.execute([{"role": "User", "content": QUERY}])
+        latencies.append(time.monotonic() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--port", type=int, default=18090)
+    parser.add_argument("--small-latency", type=float, default=0.3, help="Seconds per call to the small model")
+    parser.add_argument("--large-latency", type=float, default=2.0, help="Seconds per call to the large model")
+    args = parser.parse_args()
+
+    stub = StubLLM({SMALL_MODEL: args.small_latency, LARGE_MODEL: args.large_latency})
+    server = start_stub_server(stub, args.port)
+
+    print(f"{'profile':<22} {'mean s':>8} {'p50 s':>8} {'small calls':>12} {'large calls':>12}")
+    for name, overrides in PROFILES.items():
+        config = Settings(
+            TASK_MODEL_ID=f"openai/{LARGE_MODEL}",
+            LLM_API_BASE=f"http://127.0.0.1:{args.port}/v1",
+            LLM_API_KEY="stub",
+            STAGE_MODEL_OVERRIDES=overrides,
+            FAST_PATH_EXTRACTION=False,
+            LLM_STREAMING=False,
+            LOG_LEVEL="WARNING",
+        )
+        stub.calls.clear()
+        latencies = asyncio.run(run_profile(config, args.runs))
+        print(f"{name:<22} {statistics.mean(latencies):>8.2f} {statistics.median(latencies):>8.2f} "
+              f"{stub.calls[SMALL_MODEL] / args.runs:>12.1f} {stub.calls[LARGE_MODEL] / args.runs:>12.1f}")
+
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
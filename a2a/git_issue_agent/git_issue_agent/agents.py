@@ -1,12 +1,23 @@
 from crewai import Agent, Crew, Process, Task
 from git_issue_agent.config import Settings
-from git_issue_agent.data_types import IssueSearchInfo
+from git_issue_agent.data_types import IssueSearchTargets
 from git_issue_agent.llm import CrewLLM
-from git_issue_agent.prompts import TOOL_CALL_PROMPT, INFO_PARSER_PROMPT
+from git_issue_agent.prompts import TOOL_CALL_PROMPT, INFO_PARSER_PROMPT, SYNTHESIS_PROMPT
+from git_issue_agent.tools import CallMemo, DigestTool, MemoizedTool, MemoizingToolsHandler
 class GitAgents():
-    
-    def __init__(self, config: Settings, issue_tools):
-        self.llm = CrewLLM(config)
+    """
+    Crew templates for the git issue agent.
+
+    The agents, tasks and crews are built once (typically at startup) and are never
+    kicked off directly. Each request gets its own copy through `prereq_crew()`,
+    `issue_crew()` and `synthesis_crew()`, so concurrent requests never share task inputs or outputs.
+    """
+
+    def __init__(self, config: Settings):
+        self.prereq_llm = CrewLLM(config, "prereq_identifier")
+        self.llm = CrewLLM(config, "issue_researcher")
+        self.synthesis_llm = CrewLLM(config, "report_synthesizer")
+        self.tool_output_token_budget = config.TOOL_OUTPUT_TOKEN_BUDGET
 
         ###################
         # Pre-requisite validator
@@ -16,7 +27,7 @@ class GitAgents():
             goal="To extract the information about github artifacts that a user is looking for",
             backstory=INFO_PARSER_PROMPT,
             verbose=True,
-            llm=self.llm.llm
+            llm=self.prereq_llm.llm
         )
 
         self.prereq_identifier_task = Task(
@@ -24,7 +35,7 @@ class GitAgents():
                 "User query: {request}"
             ),
             agent=self.prereq_identifier,
-            output_pydantic=IssueSearchInfo,
+            output_pydantic=IssueSearchTargets,
             expected_output=(
                 "A pydantic object representing the extracted relevant information."
             ),
@@ -34,7 +45,7 @@ class GitAgents():
             agents=[self.prereq_identifier],
             tasks=[self.prereq_identifier_task],
             process=Process.sequential,
-            verbose=True,           
+            verbose=True,
         )
 
         ###################
@@ -47,13 +58,12 @@ class GitAgents():
                 "Prefer read-only operations. When querying, be explicit about repo owner/name and filters."
             ),
             backstory=TOOL_CALL_PROMPT,
-            tools=issue_tools,
             verbose=True,
             llm=self.llm.llm,
             inject_date=True,
             max_iter=6
         )
-            
+
         # --- A generic task template -------------------------------------------------
         # The agent will use MCP tools to fulfill natural-language queries.
         self.issue_query_task = Task(
@@ -75,4 +85,56 @@ class GitAgents():
             tasks=[self.issue_query_task],
             process=Process.sequential,
             verbose=True,
-        )
\ No newline at end of file
+        )
+
+        ###################
+        # Multi-repository synthesis
+        # ##################
+        self.report_synthesizer = Agent(
+            role="GitHub Issue Report Synthesizer",
+            goal="Merge per-repository issue findings into a single answer to the user's query",
+            backstory=SYNTHESIS_PROMPT,
+            verbose=True,
+            llm=self.synthesis_llm.llm,
+        )
+
+        self.synthesis_task = Task(
+            description=(
+                "User query: {request}\n"
+                "Findings per repository:\n{findings}"
+            ),
+            agent=self.report_synthesizer,
+            expected_output=(
+                "A well formatted report directly answering the user's query across all repositories, citing the findings."
+            ),
+        )
+
+        self.synthesizer_crew = Crew(
+            agents=[self.report_synthesizer],
+            tasks=[self.synthesis_task],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    def prereq_crew(self) -> Crew:
+        """Returns an isolated copy of the pre-requisite extraction crew."""
+        return self.prereq_id_crew.copy()
+
+    def synthesis_crew(self) -> Crew:
+        """Returns an isolated copy of the multi-repository synthesis crew."""
+        return self.synthesizer_crew.copy()
+
+    def issue_crew(self, issue_tools, query: str = None) -> Crew:
+        """Returns an isolated copy of the issue research crew bound to this request's tools."""
+        crew = self.crew.copy()
+        memo = CallMemo()
+        tools = []
+        for tool in issue_tools or []:
+            if self.tool_output_token_budget:
+                tool = DigestTool(tool, query=query, token_budget=self.tool_output_token_budget)
+            tools.append(MemoizedTool(tool, memo=memo))
+        for agent in crew.agents:
+            agent.tools = tools
+            # so repeated calls reach MemoizedTool, which also nudges the agent to finish
+            agent.tools_handler = MemoizingToolsHandler({tool.name for tool in tools}, cache=agent.tools_handler.cache)
+        return crew
@@ -81,6 +81,11 @@ class BearerAuthBackend(AuthenticationBackend):
         if conn.scope.get("path") == "/.well-known/agent.json":
             logger.debug("Bypassing authentication for public agent card path")
             return None
+
+        # GitHub webhooks are authenticated with their HMAC signature instead
+        if settings.GITHUB_WEBHOOK_SECRET and conn.scope.get("path") == settings.WEBHOOK_PATH:
+            logger.debug("Bypassing authentication for signed GitHub webhook path")
+            return None
         
         # extract token
         token = await self.get_token(conn)
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from git_issue_agent.metrics import metrics
+
+# Only read-only tools whose results are safe to share between identical calls
+CACHEABLE_TOOLS = {"list_issues", "search_issues"}
+
+# "repo:owner/name" qualifiers inside a search query
+SEARCH_REPO_PATTERN = re.compile(r"\brepo:([\w.-]+)/([\w.-]+)", re.IGNORECASE)
+SEARCH_OWNER_PATTERN = re.compile(r"\b(?:org|user):([\w.-]+)", re.IGNORECASE)
+
+
+def credential_scope(headers: Optional[dict]) -> str:
+    """Returns an opaque identifier of the credentials used for the MCP session."""
+    authorization = (headers or {}).get("Authorization", "")
+    return hashlib.sha256(authorization.encode()).hexdigest()[:16]
+
+
+def canonical_arguments(arguments: dict) -> str:
+    """Serializes tool arguments so that equivalent calls produce the same string."""
+    canonical = {}
+    for key, value in arguments.items():
+        if value is None or value == "" or value == []:
+            continue
+        if key in ("owner", "repo") and isinstance(value, str):
+            # GitHub owner and repository names are case-insensitive
+            value = value.lower()
+        canonical[key] = value
+    return json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def repo_tag(arguments: dict) -> tuple[Optional[str], Optional[str]]:
+    """Returns the (owner, repo) a tool call is about, as far as it can be told from its arguments."""
+    owner = arguments.get("owner")
+    repo = arguments.get("repo")
+    query = arguments.get("query") or ""
+    if not repo and isinstance(query, str):
+        match = SEARCH_REPO_PATTERN.search(query)
+        if match:
+            owner, repo = match.groups()
+        elif not owner:
+            match = SEARCH_OWNER_PATTERN.search(query)
+            owner = match.group(1) if match else None
+    return (owner.lower() if owner else None, repo.lower() if repo else None)
+
+
+def is_cacheable_result(result: Any) -> bool:
+    """
+    Whether a tool result is a successful listing worth caching.
+
+    The GitHub MCP server reports failures such as rate limits or unknown repositories as
+    plain text (or JSON with an "error" key) instead of the JSON listing, and those must
+    not be served again for the whole TTL.
+    """
+    if not isinstance(result, str):
+        return False
+    try:
+        parsed = json.loads(result)
+    except json.JSONDecodeError:
+        return False
+    return not (isinstance(parsed, dict) and ("error" in parsed or "errors" in parsed))
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    expires_at: float
+    latency: float
+    tag: tuple[Optional[str], Optional[str]]
+
+
+class ToolResultCache:
+    """
+    An in-memory, thread-safe LRU cache of MCP tool results with a per-entry TTL.
+
+    Entries are keyed by (tool name, canonicalized arguments, credential scope), so
+    results fetched with one user's credentials are never served to another user.
+    Entries are also tagged with the repository they concern so that they can be
+    invalidated per repository.
+    """
+
+    def __init__(self, ttl: float = 60, max_entries: int = 512):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, CacheEntry] = OrderedDict()
+
+    @staticmethod
+    def key(tool_name: str, arguments: dict, scope: str) -> tuple:
+        return (tool_name, canonical_arguments(arguments), scope)
+
+    def get(self, key: tuple) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, value: Any, latency: float, tag: tuple[Optional[str], Optional[str]]) -> None:
+        with self._lock:
+            self._entries[key] = CacheEntry(value, time.monotonic() + self.ttl, latency, tag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_repo(self, owner: str, repo: Optional[str] = None) -> int:
+        """
+        Drops the entries about the given repository, including searches that are only
+        scoped to its owner or not scoped at all, since they may contain its issues too.
+        """
+        owner = owner.lower()
+        repo = repo.lower() if repo else None
+        with self._lock:
+            stale = [
+                key for key, entry in self._entries.items()
+                if entry.tag[0] is None
+                or (entry.tag[0] == owner and (repo is None or entry.tag[1] in (None, repo)))
+            ]
+            for key in stale:
+                del self._entries[key]
+        metrics.incr("cache.invalidations", len(stale))
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -49,6 +49,9 @@ def get_client_secret_from_svid(secret_file_path) -> Optional[str]:
         print(f"Error reading CLIENT_SECRET file: {e}")
         return None
 
+# Stages whose LLM can be configured separately through STAGE_MODEL_OVERRIDES
+LLM_STAGES = {"prereq_identifier", "issue_researcher", "report_synthesizer"}
+
 class Settings(BaseSettings):
     # static path for client secret file
     secret_file_path: str = "/shared/secret.txt"
@@ -72,9 +75,85 @@ class Settings(BaseSettings):
         description="The temperature for the model",
         ge=0,
     )
+    STAGE_MODEL_OVERRIDES: dict = Field(
+        {},
+        description="Per-stage LLM overrides as JSON, e.g. {\"prereq_identifier\": {\"model\": \"ollama/granite4:micro\"}}",
+    )
+    LLM_STREAMING: bool = Field(
+        os.getenv("LLM_STREAMING", False),
+        description="Stream LLM tokens as status events, for providers that support streaming",
+    )
+    STATUS_EVENTS_PER_SECOND: float = Field(
+        os.getenv("STATUS_EVENTS_PER_SECOND", 2),
+        description="Maximum number of status events per second; faster updates are coalesced",
+        gt=0,
+    )
     MCP_URL: str = Field(os.getenv("MCP_URL", "https://api.githubcopilot.com/mcp/"), description="Endpoint for an option MCP server")
     SERVICE_PORT: int = Field(os.getenv("SERVICE_PORT", 8000), description="Port on which the service will run.")
     GITHUB_TOKEN: Optional[str] = Field(os.getenv("GITHUB_TOKEN", None), description="If not using agent with authorization, the default Github token to use")
+    FAST_PATH_EXTRACTION: bool = Field(
+        os.getenv("FAST_PATH_EXTRACTION", True),
+        description="Extract owner/repo/issue numbers with rules and only call the LLM when they are ambiguous",
+    )
+    MAX_CONCURRENT_TARGETS: int = Field(
+        os.getenv("MAX_CONCURRENT_TARGETS", 4),
+        description="Maximum number of repositories researched concurrently for multi-repository queries",
+        ge=1,
+    )
+
+    # read-through cache of MCP issue tool results
+    TOOL_CACHE_TTL: int = Field(
+        os.getenv("TOOL_CACHE_TTL", 60),
+        description="Seconds for which list_issues/search_issues results are cached. 0 disables the cache",
+        ge=0,
+    )
+    TOOL_CACHE_MAX_ENTRIES: int = Field(
+        os.getenv("TOOL_CACHE_MAX_ENTRIES", 512),
+        description="Maximum number of cached tool results",
+        ge=1,
+    )
+
+    TOOL_OUTPUT_TOKEN_BUDGET: int = Field(
+        os.getenv("TOOL_OUTPUT_TOKEN_BUDGET", 3000),
+        description="Approximate token budget of a single issue tool observation. Larger issue listings are "
+                    "replaced by a digest of counts, groupings and the most relevant rows. 0 disables digests",
+        ge=0,
+    )
+
+    # optional local issue index for aggregate queries
+    ISSUE_INDEX_PATH: Optional[str] = Field(
+        os.getenv("ISSUE_INDEX_PATH", None),
+        description="Path of the SQLite issue index. The index tool is disabled if not set, or if GITHUB_TOKEN is not set",
+    )
+    GITHUB_API_URL: str = Field(
+        os.getenv("GITHUB_API_URL", "https://api.github.com"),
+        description="GitHub REST API endpoint used to sync the issue index",
+    )
+    ISSUE_INDEX_SYNC_INTERVAL: int = Field(
+        os.getenv("ISSUE_INDEX_SYNC_INTERVAL", 300),
+        description="Minimum number of seconds between two incremental syncs of the same repository",
+        ge=0,
+    )
+    ISSUE_INDEX_MAX_PAGES: int = Field(
+        os.getenv("ISSUE_INDEX_MAX_PAGES", 10),
+        description="Maximum number of 100-issue pages fetched by a single sync",
+        ge=1,
+    )
+
+    # GitHub webhooks keeping cached issue data fresh
+    WEBHOOK_PATH: str = Field(
+        os.getenv("WEBHOOK_PATH", "/webhooks/github"),
+        description="Path at which signed GitHub webhooks are accepted",
+    )
+    GITHUB_WEBHOOK_SECRET: Optional[str] = Field(
+        os.getenv("GITHUB_WEBHOOK_SECRET", None),
+        description="Secret used to verify GitHub webhook signatures. The webhook endpoint is disabled if not set",
+    )
+    WEBHOOK_FRESHNESS_TTL: int = Field(
+        os.getenv("WEBHOOK_FRESHNESS_TTL", 3600),
+        description="Cache TTL and issue index sync interval used instead of the short defaults when webhooks are enabled",
+        ge=1,
+    )
 
     # auth variables for token validation
     ISSUER: Optional[str] = Field(
@@ -126,4 +205,19 @@ class Settings(BaseSettings):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_stage_model_overrides(self) -> "Settings":
+        if os.getenv("STAGE_MODEL_OVERRIDES"):
+            try:
+                self.STAGE_MODEL_OVERRIDES = json.loads(os.getenv("STAGE_MODEL_OVERRIDES"))
+            except json.JSONDecodeError:
+                raise ValueError("STAGE_MODEL_OVERRIDES must be a valid JSON string")
+
+        for stage, overrides in self.STAGE_MODEL_OVERRIDES.items():
+            if stage not in LLM_STAGES:
+                raise ValueError(f"Unknown stage {stage} in STAGE_MODEL_OVERRIDES, expected one of {sorted(LLM_STAGES)}")
+            if not isinstance(overrides, dict):
+                raise ValueError(f"STAGE_MODEL_OVERRIDES for {stage} must be a JSON object")
+        return self
+
 settings = Settings()  # type: ignore[call-arg]
@@ -6,6 +6,9 @@ from typing import Literal, Optional
 ############
 
 class IssueSearchInfo(BaseModel):
-    owner: str = Field(None, description="The issue owner or organization.")
-    repo: str = Field(None, description="The specified repository. Leave blank if none specified.")
-    issue_numbers: list[int] = Field(None, description="Specific issue number(s) mentioned by the user. If none mentioned leave blank.")
\ No newline at end of file
+    owner: Optional[str] = Field(None, description="The issue owner or organization.")
+    repo: Optional[str] = Field(None, description="The specified repository. Leave blank if none specified.")
+    issue_numbers: Optional[list[int]] = Field(None, description="Specific issue number(s) mentioned by the user. If none mentioned leave blank.")
+
+class IssueSearchTargets(BaseModel):
+    targets: list[IssueSearchInfo] = Field(default_factory=list, description="One entry per repository or owner the user asks about. Leave empty if none specified.")
@@ -0,0 +1,156 @@
+import json
+import re
+from collections import Counter
+from typing import Any, Optional
+
+############
+# Deterministic aggregation of large issue tool outputs
+############
+
+# Rough token estimate used for budgeting; good enough for English text and JSON
+CHARS_PER_TOKEN = 4
+# Issues per page of the GitHub APIs when the call doesn't ask for a page size
+DEFAULT_PAGE_SIZE = 30
+
+STOPWORDS = {
+    "a", "an", "and", "are", "all", "any", "by", "for", "from", "in", "is", "me", "most", "my", "of",
+    "on", "or", "show", "the", "to", "what", "which", "with", "find", "list", "issue", "issues", "repo",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _names(value: Any, key: str) -> list[str]:
+    """Flattens REST (list of objects), GraphQL ({"nodes": [...]}) and plain string lists."""
+    if isinstance(value, dict):
+        value = value.get("nodes", [])
+    names = []
+    for item in value or []:
+        if isinstance(item, str):
+            names.append(item)
+        elif isinstance(item, dict) and item.get(key):
+            names.append(item[key])
+    return names
+
+
+def _count(value: Any) -> int:
+    if isinstance(value, dict):
+        return value.get("totalCount", 0)
+    return value if isinstance(value, int) else 0
+
+
+def normalize_issue(issue: dict) -> dict:
+    """Maps an issue from the GitHub REST or GraphQL format onto a compact, flat row."""
+    author = issue.get("user") or issue.get("author") or {}
+    return {
+        "number": issue.get("number"),
+        "title": issue.get("title"),
+        "state": str(issue.get("state", "")).lower(),
+        "comments": _count(issue.get("comments")),
+        "labels": _names(issue.get("labels"), "name"),
+        "assignees": _names(issue.get("assignees"), "login"),
+        "author": author.get("login") if isinstance(author, dict) else author,
+        "updated_at": issue.get("updated_at") or issue.get("updatedAt"),
+        "url": issue.get("html_url") or issue.get("url"),
+    }
+
+
+def parse_issues(tool_output: Any) -> Optional[list[dict]]:
+    """Returns the issues contained in a tool result, or None if it is not an issue listing."""
+    data = tool_output
+    if isinstance(tool_output, str):
+        try:
+            data = json.loads(tool_output)
+        except json.JSONDecodeError:
+            return None
+    if isinstance(data, dict):
+        for key in ("items", "issues", "nodes"):
+            if isinstance(data.get(key), list):
+                data = data[key]
+                break
+    if not isinstance(data, list) or not data:
+        return None
+    if not all(isinstance(issue, dict) and "number" in issue for issue in data):
+        return None
+    return [normalize_issue(issue) for issue in data]
+
+
+def has_more_pages(tool_output: Any, arguments: dict, issue_count: int) -> bool:
+    """
+    Tells whether more issues exist beyond this page of results: from the GraphQL pageInfo
+    if the output carries one, otherwise because the page is full.
+    """
+    data = tool_output
+    if isinstance(tool_output, str):
+        try:
+            data = json.loads(tool_output)
+        except json.JSONDecodeError:
+            data = None
+    if isinstance(data, dict) and isinstance(data.get("pageInfo"), dict) and "hasNextPage" in data["pageInfo"]:
+        return bool(data["pageInfo"]["hasNextPage"])
+    page_size = arguments.get("perPage") or arguments.get("per_page") or DEFAULT_PAGE_SIZE
+    return issue_count >= page_size
+
+
+def _query_terms(query: Optional[str]) -> set[str]:
+    terms = re.findall(r"[a-z0-9][a-z0-9_-]+", (query or "").lower())
+    return {term for term in terms if term not in STOPWORDS}
+
+
+def _relevance(row: dict, terms: set[str]) -> int:
+    if not terms:
+        return 0
+    text = " ".join([row["title"] or "", *row["labels"], *row["assignees"], row["author"] or ""]).lower()
+    return sum(1 for term in terms if term in text)
+
+
+def build_digest(issues: list[dict], query: Optional[str] = None, token_budget: int = 2000, top_n: int = 10,
+                 more_pages: bool = False) -> str:
+    """
+    Summarizes an issue listing into counts, groupings and top-N rankings, followed by
+    as many of the most relevant rows as fit in the token budget.
+
+    The listing is one page of results, so the counts are labelled as such, and
+    `more_pages` says whether the repository has issues beyond it.
+    """
+    labels = Counter(label for row in issues for label in row["labels"])
+    assignees = Counter(assignee for row in issues for assignee in row["assignees"])
+    summary = {
+        "issues_in_page": len(issues),
+        "more_pages": more_pages,
+        "by_state": dict(Counter(row["state"] for row in issues).most_common()),
+        "top_labels": dict(labels.most_common(top_n)),
+        "top_assignees": dict(assignees.most_common(top_n)),
+        "unassigned": sum(1 for row in issues if not row["assignees"]),
+        "most_commented": [
+            {"number": row["number"], "title": row["title"], "comments": row["comments"]}
+            for row in sorted(issues, key=lambda row: row["comments"], reverse=True)[:top_n]
+        ],
+    }
+    header = (
+        "The tool returned a large list of issues. Counts and rankings below were computed "
+        "over ALL issues in this page of results; rely on them instead of counting rows yourself. "
+        + ("More issues exist on further pages, so these are NOT repository totals.\n" if more_pages
+           else "There are no further pages.\n")
+        + f"SUMMARY: {json.dumps(summary)}\n"
+    )
+
+    terms = _query_terms(query)
+    ranked = sorted(issues, key=lambda row: (_relevance(row, terms), row["comments"]), reverse=True)
+    remaining = token_budget - estimate_tokens(header)
+    rows = []
+    for row in ranked:
+        line = json.dumps({key: value for key, value in row.items() if value not in (None, [], "")})
+        cost = estimate_tokens(line)
+        if cost > remaining:
+            break
+        rows.append(line)
+        remaining -= cost
+
+    return (
+        header
+        + f"ROWS ({len(rows)} of {len(issues)}, most relevant to the user query first):\n"
+        + "\n".join(rows)
+    )
@@ -0,0 +1,139 @@
+import re
+from typing import Optional
+
+from git_issue_agent.data_types import IssueSearchInfo, IssueSearchTargets
+
+############
+# Rule-based extraction of owner/repo/issue identifiers
+############
+
+# github.com/<owner>/<repo>[/issues/<number>]
+GITHUB_URL_PATTERN = re.compile(
+    r"github\.com/(?P<owner>[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?)/(?P<repo>[A-Za-z0-9._-]+)"
+    r"(?:/(?:issues|pull)/(?P<number>\d+))?"
+)
+
+# <owner>/<repo>[#<number>], not preceded by another path segment or URL scheme, and only
+# as a whole: the repo may not stop short of a further path segment or name character
+OWNER_REPO_PATTERN = re.compile(
+    r"(?<![\w./:-])(?P<owner>[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?)/(?P<repo>[A-Za-z0-9._-]+)"
+    r"(?:#(?P<number>\d+))?(?![\w/-]|\.\w)"
+)
+
+# Words right before or after a bare owner/repo that mark it as a repository rather than
+# prose such as "async/await" or "CI/CD"
+REPO_CUE_BEFORE = re.compile(r"(?:\b(?:repo|repos|repository|repositories|in|on|from)\s+|`)$", re.IGNORECASE)
+REPO_CUE_AFTER = re.compile(r"^(?:`|\s+(?:repo|repository)\b)", re.IGNORECASE)
+# Between two repositories of a list, so a cue carries over to the following ones
+LIST_SEPARATOR = re.compile(r"`?\s*(?:,|,?\s*and|&|vs\.?|versus)\s*`?", re.IGNORECASE)
+
+# "#87" or "issue 87" / "issues 87, 88 and 90" / "issue no. 87"
+HASH_NUMBER_PATTERN = re.compile(r"(?<![\w/])#(\d+)\b")
+ISSUE_NUMBER_PATTERN = re.compile(
+    r"\bissues?\s+(?:(?:number|num|no\.?)\s*)?#?(\d+(?:\s*(?:,|and|&)\s*#?\d+)*)\b",
+    re.IGNORECASE,
+)
+
+# Slash-separated words that look like owner/repo but almost never are
+AMBIGUOUS_SEGMENTS = {
+    "and", "or", "open", "closed", "read", "write", "yes", "no", "true", "false",
+    "issue", "issues", "pr", "prs", "bug", "bugs", "feature", "features", "label", "labels",
+}
+
+
+def _looks_like_prose(owner: str, repo: str) -> bool:
+    if owner.lower() in AMBIGUOUS_SEGMENTS or repo.lower() in AMBIGUOUS_SEGMENTS:
+        return True
+    # dates and fractions such as 10/19
+    return owner.isdigit() and repo.isdigit()
+
+
+def _has_repo_cue(query: str, match: re.Match, certain_ends: list[int]) -> bool:
+    return bool(
+        match.group("number")
+        or REPO_CUE_BEFORE.search(query[:match.start()])
+        or REPO_CUE_AFTER.match(query[match.end():])
+        or any(LIST_SEPARATOR.fullmatch(query[end:match.start()]) for end in certain_ends if end <= match.start())
+    )
+
+
+def _owner_repo_candidates(query: str) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """
+    Returns (certain, weak) owner/repo pairs: github.com URLs and bare pairs next to a repo
+    cue ("in", "repo", a #N suffix, backticks) are certain, other bare pairs are weak.
+
+    >>> _owner_repo_candidates("Show open issues about async/await handling")
+    ([], [('async', 'await')])
+    >>> _owner_repo_candidates("list CI/CD bugs")
+    ([], [('CI', 'CD')])
+    >>> _owner_repo_candidates("TCP/IP issues")
+    ([], [('TCP', 'IP')])
+    >>> _owner_repo_candidates("see kagenti/agent-examples/issues")
+    ([], [])
+    >>> _owner_repo_candidates("issues about async/await in kagenti/agent-examples")
+    ([('kagenti', 'agent-examples')], [('async', 'await')])
+    >>> _owner_repo_candidates("https://github.com/kagenti/kagenti/issues/87")
+    ([('kagenti', 'kagenti')], [])
+    >>> _owner_repo_candidates("what is kagenti/kagenti#87 about?")
+    ([('kagenti', 'kagenti')], [])
+    >>> _owner_repo_candidates("open bugs in the `kagenti/agent-examples` repo.")
+    ([('kagenti', 'agent-examples')], [])
+    >>> _owner_repo_candidates("Compare the open bugs in kagenti/kagenti and kagenti/agent-examples")
+    ([('kagenti', 'kagenti'), ('kagenti', 'agent-examples')], [])
+    """
+    # dicts keep the pairs in the order in which they were mentioned
+    certain, weak = {}, {}
+    certain_ends = []
+    for pattern in (GITHUB_URL_PATTERN, OWNER_REPO_PATTERN):
+        for match in pattern.finditer(query):
+            owner = match.group("owner")
+            # a trailing period is sentence punctuation, not part of the repo name
+            repo = match.group("repo").rstrip(".")
+            if repo.endswith(".git"):
+                repo = repo[: -len(".git")]
+            if not repo or _looks_like_prose(owner, repo):
+                continue
+            if pattern is GITHUB_URL_PATTERN or _has_repo_cue(query, match, certain_ends):
+                certain.setdefault((owner, repo), None)
+                certain_ends.append(match.end())
+            else:
+                weak.setdefault((owner, repo), None)
+    return list(certain), [pair for pair in weak if pair not in certain]
+
+
+def _issue_numbers(query: str) -> list[int]:
+    numbers = []
+    for pattern in (GITHUB_URL_PATTERN, OWNER_REPO_PATTERN):
+        for match in pattern.finditer(query):
+            if match.group("number"):
+                numbers.append(int(match.group("number")))
+    numbers.extend(int(n) for n in HASH_NUMBER_PATTERN.findall(query))
+    for match in ISSUE_NUMBER_PATTERN.finditer(query):
+        numbers.extend(int(n) for n in re.findall(r"\d+", match.group(1)))
+    # de-duplicate while preserving the order in which they were mentioned
+    return list(dict.fromkeys(numbers))
+
+
+def extract_issue_search_targets(query: str) -> Optional[IssueSearchTargets]:
+    """
+    Extracts owner, repo and issue numbers from the query without calling an LLM.
+
+    Every owner/repo pair given as a github.com URL or next to a repo cue becomes a target;
+    other slash-separated words ("async/await", "CI/CD") are only tolerated alongside them
+    as prose. Returns None whenever the answer is not unambiguous, in which case the caller
+    should fall back to the LLM extractor: when no such pair is found, when more than one
+    uncued pair remains, or when issue numbers are mentioned alongside several
+    repositories, since they cannot be attributed to one of them.
+    """
+    candidates, weak = _owner_repo_candidates(query)
+    if not candidates or len(weak) > 1:
+        return None
+
+    issue_numbers = _issue_numbers(query)
+    if issue_numbers and len(candidates) > 1:
+        return None
+
+    return IssueSearchTargets(targets=[
+        IssueSearchInfo(owner=owner, repo=repo, issue_numbers=issue_numbers or None)
+        for owner, repo in candidates
+    ])
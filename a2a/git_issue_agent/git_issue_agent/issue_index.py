@@ -0,0 +1,304 @@
+import json
+import logging
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+from typing import Literal, Optional, Type
+
+import httpx
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from git_issue_agent.config import settings
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=settings.LOG_LEVEL, stream=sys.stdout, format='%(levelname)s: %(message)s')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    title TEXT,
+    state TEXT,
+    comments INTEGER,
+    author TEXT,
+    html_url TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    closed_at TEXT,
+    PRIMARY KEY (owner, repo, number)
+);
+CREATE TABLE IF NOT EXISTS issue_labels (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    label TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issue_labels_idx ON issue_labels (owner, repo, number);
+CREATE TABLE IF NOT EXISTS issue_assignees (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    assignee TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issue_assignees_idx ON issue_assignees (owner, repo, number);
+CREATE TABLE IF NOT EXISTS sync_state (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    last_updated_at TEXT,
+    last_synced REAL,
+    complete INTEGER DEFAULT 0,
+    PRIMARY KEY (owner, repo)
+);
+"""
+
+
+class IssueIndex:
+    """
+    A local SQLite index of the issues in a set of GitHub repositories.
+
+    Repositories are indexed lazily the first time they are queried and then kept
+    up to date incrementally with the `since=<last updated_at>` filter of the GitHub
+    REST API, so an aggregate query only has to fetch the issues changed since the
+    previous sync.
+
+    Rows are not scoped per credential: the index is shared by every caller, so it must
+    only ever be synced with one service token, and only covers the repositories that
+    token can read.
+
+    `transport` replaces the HTTP transport of the GitHub client, e.g. with a fake API.
+    """
+
+    def __init__(self, db_path: str, api_url: str = "https://api.github.com",
+                 sync_interval: int = 300, max_pages: int = 10, transport: httpx.BaseTransport = None):
+        self.db_path = db_path
+        self.api_url = api_url.rstrip("/")
+        self.sync_interval = sync_interval
+        self.max_pages = max_pages
+        self.transport = transport
+        self._locks: dict[tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation keeps the index usable from CrewAI's worker threads
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _repo_lock(self, owner: str, repo: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault((owner.lower(), repo.lower()), threading.Lock())
+
+    def sync_state(self, owner: str, repo: str) -> Optional[sqlite3.Row]:
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT * FROM sync_state WHERE owner = ? AND repo = ?", (owner.lower(), repo.lower())
+            ).fetchone()
+
+    def upsert_issue(self, owner: str, repo: str, issue: dict, conn: sqlite3.Connection = None) -> None:
+        """
+        Inserts or updates a single issue given in the GitHub REST API format.
+
+        An issue older than the indexed one, e.g. from a webhook delivered out of order,
+        is ignored.
+        """
+        if conn is None:
+            with closing(self._connect()) as conn, conn:
+                return self.upsert_issue(owner, repo, issue, conn)
+
+        key = (owner.lower(), repo.lower(), issue["number"])
+        cursor = conn.execute(
+            "INSERT INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (owner, repo, number) DO UPDATE SET title = excluded.title, state = excluded.state, "
+            "comments = excluded.comments, author = excluded.author, html_url = excluded.html_url, "
+            "created_at = excluded.created_at, updated_at = excluded.updated_at, closed_at = excluded.closed_at "
+            "WHERE excluded.updated_at >= issues.updated_at OR issues.updated_at IS NULL",
+            (
+                *key,
+                issue.get("title"),
+                issue.get("state"),
+                issue.get("comments", 0),
+                (issue.get("user") or {}).get("login"),
+                issue.get("html_url"),
+                issue.get("created_at"),
+                issue.get("updated_at"),
+                issue.get("closed_at"),
+            ),
+        )
+        if cursor.rowcount == 0:
+            return
+        conn.execute("DELETE FROM issue_labels WHERE owner = ? AND repo = ? AND number = ?", key)
+        conn.executemany(
+            "INSERT INTO issue_labels VALUES (?, ?, ?, ?)",
+            [(*key, label["name"]) for label in issue.get("labels", []) if isinstance(label, dict)],
+        )
+        conn.execute("DELETE FROM issue_assignees WHERE owner = ? AND repo = ? AND number = ?", key)
+        conn.executemany(
+            "INSERT INTO issue_assignees VALUES (?, ?, ?, ?)",
+            [(*key, assignee["login"]) for assignee in issue.get("assignees", []) if assignee],
+        )
+
+    def delete_issue(self, owner: str, repo: str, number: int) -> None:
+        key = (owner.lower(), repo.lower(), number)
+        with closing(self._connect()) as conn, conn:
+            for table in ("issues", "issue_labels", "issue_assignees"):
+                conn.execute(f"DELETE FROM {table} WHERE owner = ? AND repo = ? AND number = ?", key)
+
+    def sync(self, owner: str, repo: str, token: str, force: bool = False) -> None:
+        """
+        Fetches the issues updated since the last sync, authenticated with `token`.
+
+        Syncs are skipped when the previous one is younger than `sync_interval`, unless
+        the index for this repo is still incomplete. At most `max_pages` pages are fetched
+        per call; a large repository simply continues from where it left off next time.
+        Unauthenticated syncs are refused: at 60 requests an hour they would exhaust the
+        rate limit after a few repositories.
+        """
+        if not token:
+            raise ValueError("Syncing the issue index requires a GitHub token")
+        with self._repo_lock(owner, repo):
+            state = self.sync_state(owner, repo)
+            if (
+                not force
+                and state is not None
+                and state["complete"]
+                and time.time() - state["last_synced"] < self.sync_interval
+            ):
+                return
+
+            headers = {"Accept": "application/vnd.github+json", "Authorization": f"Bearer {token}"}
+            params = {"state": "all", "sort": "updated", "direction": "asc", "per_page": 100}
+            last_updated_at = state["last_updated_at"] if state is not None else None
+            if last_updated_at:
+                params["since"] = last_updated_at
+
+            url = f"{self.api_url}/repos/{owner}/{repo}/issues"
+            complete = False
+            with httpx.Client(headers=headers, timeout=30, transport=self.transport) as client:
+                for _ in range(self.max_pages):
+                    response = client.get(url, params=params)
+                    response.raise_for_status()
+                    page = response.json()
+                    with closing(self._connect()) as conn, conn:
+                        for issue in page:
+                            # the issues endpoint also returns pull requests
+                            if "pull_request" in issue:
+                                continue
+                            self.upsert_issue(owner, repo, issue, conn)
+                        if page:
+                            last_updated_at = max(last_updated_at or "", *(i["updated_at"] for i in page))
+                        conn.execute(
+                            "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?)",
+                            (owner.lower(), repo.lower(), last_updated_at, time.time(), 0),
+                        )
+                    next_url = response.links.get("next", {}).get("url")
+                    if not next_url:
+                        complete = True
+                        break
+                    url, params = next_url, None
+
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "UPDATE sync_state SET complete = ?, last_synced = ? WHERE owner = ? AND repo = ?",
+                    (int(complete), time.time(), owner.lower(), repo.lower()),
+                )
+            logger.info(f"Synced issue index for {owner}/{repo} (complete: {complete})")
+
+    def query(self, owner: str, repo: str, query: str, state: str = "open",
+              label: Optional[str] = None, assignee: Optional[str] = None, limit: int = 10) -> dict:
+        """Runs one of the supported read-only aggregate queries against the index."""
+        where = ["i.owner = ?", "i.repo = ?"]
+        params: list = [owner.lower(), repo.lower()]
+        if state != "all":
+            where.append("i.state = ?")
+            params.append(state)
+        if label:
+            where.append(
+                "EXISTS (SELECT 1 FROM issue_labels l WHERE l.owner = i.owner AND l.repo = i.repo "
+                "AND l.number = i.number AND lower(l.label) = lower(?))"
+            )
+            params.append(label)
+        if assignee:
+            where.append(
+                "EXISTS (SELECT 1 FROM issue_assignees a WHERE a.owner = i.owner AND a.repo = i.repo "
+                "AND a.number = i.number AND lower(a.assignee) = lower(?))"
+            )
+            params.append(assignee)
+        where_clause = " AND ".join(where)
+
+        issue_columns = "i.number, i.title, i.state, i.comments, i.author, i.html_url, i.updated_at"
+        statements = {
+            "count": f"SELECT count(*) AS count FROM issues i WHERE {where_clause}",
+            "top_commented": f"SELECT {issue_columns} FROM issues i WHERE {where_clause} "
+                             "ORDER BY i.comments DESC LIMIT ?",
+            "recently_updated": f"SELECT {issue_columns} FROM issues i WHERE {where_clause} "
+                                "ORDER BY i.updated_at DESC LIMIT ?",
+            "group_by_state": f"SELECT i.state AS state, count(*) AS count FROM issues i WHERE {where_clause} "
+                              "GROUP BY i.state ORDER BY count DESC LIMIT ?",
+            "group_by_label": "SELECT l.label AS label, count(*) AS count FROM issues i JOIN issue_labels l "
+                              "ON l.owner = i.owner AND l.repo = i.repo AND l.number = i.number "
+                              f"WHERE {where_clause} GROUP BY l.label ORDER BY count DESC LIMIT ?",
+            "group_by_assignee": "SELECT a.assignee AS assignee, count(*) AS count FROM issues i "
+                                 "JOIN issue_assignees a ON a.owner = i.owner AND a.repo = i.repo "
+                                 f"AND a.number = i.number WHERE {where_clause} "
+                                 "GROUP BY a.assignee ORDER BY count DESC LIMIT ?",
+        }
+        if query not in statements:
+            raise ValueError(f"Unsupported issue index query '{query}'")
+        if query != "count":
+            params.append(limit)
+
+        with closing(self._connect()) as conn:
+            rows = [dict(row) for row in conn.execute(statements[query], params).fetchall()]
+        sync = self.sync_state(owner, repo)
+        return {
+            "repository": f"{owner}/{repo}",
+            "query": query,
+            "filters": {"state": state, "label": label, "assignee": assignee},
+            "index_complete": bool(sync and sync["complete"]),
+            "results": rows,
+        }
+
+
+class IssueIndexQuery(BaseModel):
+    owner: str = Field(description="The repository owner or organization.")
+    repo: str = Field(description="The repository name.")
+    query: Literal[
+        "count", "top_commented", "recently_updated", "group_by_state", "group_by_label", "group_by_assignee"
+    ] = Field(description="The aggregate to compute over the repository's issues.")
+    state: Literal["open", "closed", "all"] = Field("open", description="Only consider issues in this state.")
+    label: Optional[str] = Field(None, description="Only consider issues with this label.")
+    assignee: Optional[str] = Field(None, description="Only consider issues assigned to this user login.")
+    limit: int = Field(10, ge=1, le=100, description="Maximum number of rows to return.")
+
+
+class IssueIndexTool(BaseTool):
+    """A read-only CrewAI tool answering aggregate issue questions from the local index."""
+
+    name: str = "query_issue_index"
+    description: str = (
+        "Answers aggregate questions about the issues of a single repository from a local index: "
+        "issue counts, the most commented or most recently updated issues, and issue counts grouped "
+        "by state, label or assignee. Requires both owner and repo."
+    )
+    args_schema: Type[BaseModel] = IssueIndexQuery
+    index: IssueIndex
+    # the service token; every sync of the shared index must use the same one
+    token: str
+
+    def _run(self, owner: str, repo: str, query: str, state: str = "open",
+             label: Optional[str] = None, assignee: Optional[str] = None, limit: int = 10) -> str:
+        try:
+            self.index.sync(owner, repo, token=self.token)
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to sync issue index for {owner}/{repo}: {e}")
+            if self.index.sync_state(owner, repo) is None:
+                return f"Unable to index issues for {owner}/{repo}: {e}"
+        return json.dumps(self.index.query(owner, repo, query, state, label, assignee, limit))
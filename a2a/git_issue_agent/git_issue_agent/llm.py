@@ -2,11 +2,24 @@ from crewai import LLM
 from git_issue_agent.config import Settings
 
 class CrewLLM():
-    def __init__(self, config: Settings):
-
-        self.llm = LLM(
-            model=config.TASK_MODEL_ID,
-            base_url=config.LLM_API_BASE,
-            api_key=config.LLM_API_KEY,
-            **({'extra_headers': config.EXTRA_HEADERS} if config.EXTRA_HEADERS is not None and None not in config.EXTRA_HEADERS else {})
-        )
\ No newline at end of file
+    """
+    The LLM for one stage of the agent.
+
+    Every stage uses TASK_MODEL_ID at LLM_API_BASE unless STAGE_MODEL_OVERRIDES has an
+    entry for it. Override keys are passed to crewai.LLM as is, so an entry may change
+    the model, base_url and api_key as well as parameters such as temperature or max_tokens.
+    """
+
+    def __init__(self, config: Settings, stage: str = None):
+        params = {
+            "model": config.TASK_MODEL_ID,
+            "base_url": config.LLM_API_BASE,
+            "api_key": config.LLM_API_KEY,
+            "stream": config.LLM_STREAMING,
+            **({'extra_headers': config.EXTRA_HEADERS} if config.EXTRA_HEADERS is not None and None not in config.EXTRA_HEADERS else {}),
+        }
+        params.update(config.STAGE_MODEL_OVERRIDES.get(stage, {}))
+
+        self.stage = stage
+        self.model = params["model"]
+        self.llm = LLM(**params)
@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from crewai_tools import MCPServerAdapter
 from crewai_tools.adapters.tool_collection import ToolCollection
@@ -9,6 +10,10 @@ import sys
 from git_issue_agent.config import Settings, settings
 from git_issue_agent.event import Event
 from git_issue_agent.agents import GitAgents
+from git_issue_agent.data_types import IssueSearchInfo, IssueSearchTargets
+from git_issue_agent.extractor import extract_issue_search_targets
+from git_issue_agent.metrics import metrics
+from git_issue_agent.streaming import EventBatcher, register_token_sink, unregister_token_sink
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=settings.LOG_LEVEL, stream=sys.stdout, format='%(levelname)s: %(message)s')
@@ -18,19 +23,44 @@ class GitIssueAgent:
     def __init__(self, config: Settings,
         eventer: Event = None,
         mcp_toolkit: ToolCollection = None,
+        agents: GitAgents = None,
         logger=None,):
 
-        self.agents = GitAgents(settings, mcp_toolkit)
+        # Crew templates are expensive to build, so callers should pass in a shared instance
+        self.agents = agents or GitAgents(config)
+        self.config = config
+        self.mcp_toolkit = mcp_toolkit
         self.eventer = eventer
+        self.batcher: EventBatcher = None
         self.logger = logger or logging.getLogger(__name__)
 
     async def _send_event(self, message: str, final: bool = False):
         logger.info(message)
-        if self.eventer:
+        if self.batcher and not final:
+            # keep status updates ordered with the streamed crew steps
+            self.batcher.submit(message)
+        elif self.eventer:
             await self.eventer.emit_event(message, final)
         else:
             logger.warning("No event handler registered")
-    
+
+    async def _kickoff(self, crew, inputs: dict):
+        """Kicks off a crew copy, streaming its steps (and LLM tokens, if enabled) as status events."""
+        if self.batcher is None:
+            return await crew.kickoff_async(inputs=inputs)
+
+        crew.step_callback = self.batcher.step_callback
+        crew.task_callback = self.batcher.task_callback
+        agent_ids = [str(agent.id) for agent in crew.agents]
+        if self.config.LLM_STREAMING:
+            for agent_id in agent_ids:
+                register_token_sink(agent_id, self.batcher.submit_token)
+        try:
+            return await crew.kickoff_async(inputs=inputs)
+        finally:
+            for agent_id in agent_ids:
+                unregister_token_sink(agent_id)
+
     def extract_user_input(self, body):
         content = body[-1]["content"]
         latest_content = ""
@@ -46,22 +76,92 @@ class GitIssueAgent:
 
         return latest_content
 
-    async def execute(self, user_input):
-        query = self.extract_user_input(user_input)
-        await self._send_event("🧐 Evaluating requirements...")
-        await self.agents.prereq_id_crew.kickoff_async(
-            inputs={"request": query, "repo": "", "owner": "", "issues": []}
+    async def identify_prerequisites(self, query: str) -> IssueSearchTargets:
+        """Extracts owner/repo/issue number targets, only calling the LLM when the rule-based extractor is unsure."""
+        if self.config.FAST_PATH_EXTRACTION:
+            search_targets = extract_issue_search_targets(query)
+            if search_targets is not None:
+                metrics.incr("extractor.hits")
+                self.logger.info(f"Fast path extraction: {search_targets} (hit rate {metrics.hit_rate('extractor'):.2f})")
+                return search_targets
+            metrics.incr("extractor.misses")
+
+        prereq_output = await self._kickoff(
+            self.agents.prereq_crew(),
+            {"request": query, "repo": "", "owner": "", "issues": []},
         )
-        repo_id_task_output = self.agents.prereq_identifier_task.output.pydantic
-        
-        if repo_id_task_output.issue_numbers:
-            if not repo_id_task_output.owner or not repo_id_task_output.repo:
+        return prereq_output.pydantic
+
+    def validate_target(self, target: IssueSearchInfo):
+        if target.issue_numbers:
+            if not target.owner or not target.repo:
                 return "When supplying issue numbers, you must provide both a repository name and owner."
-        if repo_id_task_output.repo:
-            if not repo_id_task_output.owner:
+        if target.repo:
+            if not target.owner:
                 return "When supplying a repository name, you must also provide an owner of the repo."
+        return None
+
+    async def research(self, query: str, target: IssueSearchInfo) -> str:
+        crew_output = await self._kickoff(
+            self.agents.issue_crew(self.mcp_toolkit, query),
+            {"request": query, "owner": target.owner, "repo": target.repo, "issues": target.issue_numbers},
+        )
+        return crew_output.raw
+
+    async def research_targets(self, query: str, targets: list[IssueSearchInfo]) -> str:
+        """
+        Researches each target in its own concurrent crew run, bounded by MAX_CONCURRENT_TARGETS,
+        and merges the findings in a single synthesis step.
+        """
+        semaphore = asyncio.Semaphore(self.config.MAX_CONCURRENT_TARGETS)
+
+        async def research_target(target: IssueSearchInfo) -> str:
+            name = f"{target.owner}/{target.repo}" if target.repo else target.owner
+            async with semaphore:
+                try:
+                    findings = await self.research(
+                        f"{query}\n(Only research {name}; the other repositories are researched separately.)",
+                        target,
+                    )
+                except Exception as e:
+                    self.logger.error(f"Research for {name} failed: {e}")
+                    findings = f"Research failed: {e}"
+            await self._send_event(f"✅ Finished researching {name}")
+            return f"### {name}\n{findings}"
+
+        findings = await asyncio.gather(*(research_target(target) for target in targets))
+
+        await self._send_event("📄 Merging findings...")
+        synthesis_output = await self._kickoff(
+            self.agents.synthesis_crew(),
+            {"request": query, "findings": "\n\n".join(findings)},
+        )
+        return synthesis_output.raw
+
+    async def execute(self, user_input):
+        if self.eventer is None:
+            return await self._execute(user_input)
+
+        async with EventBatcher(self.eventer, self.config.STATUS_EVENTS_PER_SECOND) as batcher:
+            self.batcher = batcher
+            try:
+                return await self._execute(user_input)
+            finally:
+                self.batcher = None
+
+    async def _execute(self, user_input):
+        query = self.extract_user_input(user_input)
+        await self._send_event("🧐 Evaluating requirements...")
+        targets = (await self.identify_prerequisites(query)).targets
+
+        for target in targets:
+            error = self.validate_target(target)
+            if error:
+                return error
+
+        if len(targets) > 1:
+            await self._send_event(f"🔎 Searching for issues in {len(targets)} repositories...")
+            return await self.research_targets(query, targets)
 
         await self._send_event("🔎 Searching for issues...")
-        await self.agents.crew.kickoff_async(inputs={"request": query, "owner": repo_id_task_output.owner, "repo": repo_id_task_output.repo, "issues": repo_id_task_output.issue_numbers})
-        return self.agents.issue_query_task.output.raw
-    
+        return await self.research(query, targets[0] if targets else IssueSearchInfo())
@@ -0,0 +1,43 @@
+import threading
+from collections import defaultdict
+from typing import Optional
+
+
+class Metrics:
+    """
+    Minimal thread-safe, in-process counters.
+
+    CrewAI runs crews in worker threads, so every update takes a lock. Hit rates are
+    derived from `<prefix>.hits` / `<prefix>.misses` counter pairs.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = defaultdict(float)
+
+    def incr(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] += value
+
+    def get(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def hit_rate(self, prefix: str) -> Optional[float]:
+        with self._lock:
+            hits = self._counters.get(f"{prefix}.hits", 0)
+            misses = self._counters.get(f"{prefix}.misses", 0)
+        total = hits + misses
+        return hits / total if total else None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            snapshot = dict(self._counters)
+        for name in list(snapshot):
+            if name.endswith(".hits"):
+                prefix = name[: -len(".hits")]
+                snapshot[f"{prefix}.hit_rate"] = self.hit_rate(prefix)
+        return snapshot
+
+
+metrics = Metrics()
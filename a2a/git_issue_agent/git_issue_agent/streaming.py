@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import sys
+import threading
+from typing import Any, Callable
+
+from crewai.events import LLMStreamChunkEvent, crewai_event_bus
+
+from git_issue_agent.config import settings
+from git_issue_agent.event import Event
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=settings.LOG_LEVEL, stream=sys.stdout, format='%(levelname)s: %(message)s')
+
+############
+# LLM token routing
+############
+
+# CrewAI publishes stream chunks on a process-wide event bus. A single handler routes
+# them to the request that owns the emitting agent, keyed by the (per-copy) agent id.
+_token_sinks: dict[str, Callable[[str], None]] = {}
+_token_sinks_lock = threading.Lock()
+_handler_registered = False
+
+
+def _dispatch_chunk(source: Any, event: LLMStreamChunkEvent) -> None:
+    if event.tool_call is not None or not event.chunk:
+        return
+    with _token_sinks_lock:
+        sink = _token_sinks.get(event.agent_id)
+    if sink is not None:
+        sink(event.chunk)
+
+
+def register_token_sink(agent_id: str, sink: Callable[[str], None]) -> None:
+    global _handler_registered
+    with _token_sinks_lock:
+        if not _handler_registered:
+            crewai_event_bus.register_handler(LLMStreamChunkEvent, _dispatch_chunk)
+            _handler_registered = True
+        _token_sinks[agent_id] = sink
+
+
+def unregister_token_sink(agent_id: str) -> None:
+    with _token_sinks_lock:
+        _token_sinks.pop(agent_id, None)
+
+
+############
+# Status event batching
+############
+
+def format_step(step: Any) -> str:
+    """Renders a CrewAI AgentAction/AgentFinish step as a short status line."""
+    tool = getattr(step, "tool", None)
+    if tool:
+        result = getattr(step, "result", None)
+        line = f"🛠️ Called {tool} with {getattr(step, 'tool_input', '')}"
+        if result:
+            line += f" ({len(str(result))} characters returned)"
+        return line
+    if hasattr(step, "output"):
+        return "✍️ Writing the answer"
+    thought = getattr(step, "thought", "")
+    return f"💭 {thought}" if thought else "💭 Thinking..."
+
+
+class EventBatcher:
+    """
+    Coalesces status updates into at most `max_events_per_second` A2A events.
+
+    CrewAI callbacks run in worker threads, so `submit` and `submit_token` may be called
+    from any thread. Messages submitted between two flushes are joined into one event,
+    capped at `max_event_chars`. Use as an async context manager; leaving the context
+    flushes whatever is still pending.
+    """
+
+    def __init__(self, eventer: Event, max_events_per_second: float = 2, max_event_chars: int = 2000):
+        self.eventer = eventer
+        self.interval = 1 / max_events_per_second
+        self.max_event_chars = max_event_chars
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+        self._streaming_tokens = False
+        self._loop: asyncio.AbstractEventLoop = None
+        self._wakeup: asyncio.Event = None
+        self._task: asyncio.Task = None
+
+    async def __aenter__(self) -> "EventBatcher":
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        await self._flush()
+
+    def _notify(self) -> None:
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def submit(self, message: str) -> None:
+        """Queues a status line."""
+        with self._lock:
+            self._pending.append("\n" + message if self._pending else message)
+            self._streaming_tokens = False
+        self._notify()
+
+    def submit_token(self, chunk: str) -> None:
+        """Queues a streamed LLM token, appended to the previous text without a line break."""
+        with self._lock:
+            if self._pending and not self._streaming_tokens:
+                chunk = "\n" + chunk
+            self._pending.append(chunk)
+            self._streaming_tokens = True
+        self._notify()
+
+    def step_callback(self, step: Any) -> None:
+        self.submit(format_step(step))
+
+    def task_callback(self, task_output: Any) -> None:
+        self.submit(f"✅ {getattr(task_output, 'agent', 'Agent')} finished its task")
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            await self._flush()
+            # the first update goes out immediately, later ones are rate limited
+            await asyncio.sleep(self.interval)
+
+    async def _flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        message = "".join(pending)
+        if len(message) > self.max_event_chars:
+            message = message[: self.max_event_chars] + "..."
+        try:
+            await self.eventer.emit_event(message)
+        except Exception as e:
+            logger.warning(f"Failed to emit status event: {e}")
@@ -0,0 +1,165 @@
+import logging
+import sys
+import threading
+import time
+from typing import Any, Optional
+
+from crewai.agents.cache.cache_handler import CacheHandler
+from crewai.agents.tools_handler import ToolsHandler
+from crewai.tools import BaseTool
+from crewai.tools.tool_calling import InstructorToolCalling, ToolCalling
+
+from git_issue_agent.cache import ToolResultCache, canonical_arguments, is_cacheable_result, repo_tag
+from git_issue_agent.config import settings
+from git_issue_agent.digest import build_digest, estimate_tokens, has_more_pages, parse_issues
+from git_issue_agent.metrics import metrics
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=settings.LOG_LEVEL, stream=sys.stdout, format='%(levelname)s: %(message)s')
+
+
+class DelegatingTool(BaseTool):
+    """
+    Base class for tools that wrap another CrewAI tool.
+
+    The wrapper exposes the wrapped tool's name, description and argument schema
+    unchanged, so the agent sees exactly the same tool catalog.
+    """
+
+    tool: BaseTool
+
+    def __init__(self, tool: BaseTool, **kwargs):
+        super().__init__(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            tool=tool,
+            **kwargs,
+        )
+
+    def _generate_description(self):
+        # The wrapped tool's description has already been formatted by CrewAI
+        pass
+
+    def _run(self, **kwargs: Any) -> Any:
+        return self.tool._run(**kwargs)
+
+
+class CachedTool(DelegatingTool):
+    """Serves repeated calls with the same arguments and credentials from a shared cache."""
+
+    cache: ToolResultCache
+    scope: str
+
+    def _run(self, **kwargs: Any) -> Any:
+        key = self.cache.key(self.name, kwargs, self.scope)
+        entry = self.cache.get(key)
+        if entry is not None:
+            metrics.incr("cache.hits")
+            metrics.incr("cache.saved_seconds", entry.latency)
+            logger.debug(f"Cache hit for {self.name} {key[1]}")
+            return entry.value
+
+        metrics.incr("cache.misses")
+        start = time.monotonic()
+        result = super()._run(**kwargs)
+        latency = time.monotonic() - start
+        if is_cacheable_result(result):
+            self.cache.put(key, result, latency, repo_tag(kwargs))
+        else:
+            metrics.incr("cache.uncacheable")
+            logger.debug(f"Not caching the result of {self.name} {key[1]}: not a successful listing")
+        return result
+
+
+class DigestTool(DelegatingTool):
+    """
+    Replaces issue listings that exceed the token budget with a deterministic digest.
+
+    Counts, groupings and top-N rankings are computed in Python over the whole
+    listing, and only the rows most relevant to the user query are passed on.
+    """
+
+    query: Optional[str] = None
+    token_budget: int = 3000
+
+    def _run(self, **kwargs: Any) -> Any:
+        result = super()._run(**kwargs)
+        if not isinstance(result, str) or estimate_tokens(result) <= self.token_budget:
+            return result
+        issues = parse_issues(result)
+        if issues is None:
+            return result
+
+        digest = build_digest(issues, query=self.query, token_budget=self.token_budget,
+                              more_pages=has_more_pages(result, kwargs, len(issues)))
+        metrics.incr("digest.applied")
+        metrics.incr("digest.tokens_saved", estimate_tokens(result) - estimate_tokens(digest))
+        logger.info(f"Digested {len(issues)} issues from {self.name} into ~{estimate_tokens(digest)} tokens")
+        return digest
+
+
+REPEATED_CALL_NOTICE = (
+    "\n\nNOTE: You already called {tool} with these exact arguments in this run and the observation "
+    "above is unchanged. Do not call the tool again. Proceed to your Final Answer using this observation."
+)
+
+
+class CallMemo:
+    """The observations of the tool calls made during a single crew run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._observations: dict[tuple[str, str], Any] = {}
+
+    def get(self, tool_name: str, arguments: dict) -> Optional[Any]:
+        with self._lock:
+            return self._observations.get((tool_name, canonical_arguments(arguments)))
+
+    def put(self, tool_name: str, arguments: dict, observation: Any) -> None:
+        with self._lock:
+            self._observations[(tool_name, canonical_arguments(arguments))] = observation
+
+
+class MemoizedTool(DelegatingTool):
+    """
+    Short-circuits repeated identical tool calls within one crew run.
+
+    Small models often repeat the same Action/Action Input after a successful
+    observation. Instead of running the tool again, the memoized observation is
+    returned immediately together with an instruction to write the final answer.
+    """
+
+    memo: CallMemo
+
+    def _run(self, **kwargs: Any) -> Any:
+        observation = self.memo.get(self.name, kwargs)
+        if observation is not None:
+            metrics.incr("repeated_calls.short_circuited")
+            logger.info(f"Short-circuiting repeated call to {self.name}")
+            return f"{observation}{REPEATED_CALL_NOTICE.format(tool=self.name)}"
+
+        observation = super()._run(**kwargs)
+        self.memo.put(self.name, kwargs, observation)
+        return observation
+
+
+class MemoizingToolsHandler(ToolsHandler):
+    """
+    CrewAI's tools handler, made to let repeated calls of memoized tools through.
+
+    CrewAI refuses an immediate repeat of the last call before the tool runs, and serves
+    other repeats from the crew cache, both without the nudge to finish. For the tools in
+    `memoized` the handler neither remembers the last call nor caches the output, so every
+    repeat reaches MemoizedTool. Other tools keep CrewAI's behaviour.
+    """
+
+    def __init__(self, memoized: set[str], cache: Optional[CacheHandler] = None):
+        super().__init__(cache=cache)
+        self.memoized = memoized
+
+    def on_tool_use(self, calling: ToolCalling | InstructorToolCalling, output: str, should_cache: bool = True) -> None:
+        if calling.tool_name not in self.memoized:
+            return super().on_tool_use(calling, output, should_cache)
+        super().on_tool_use(calling, output, should_cache=False)
+        self.last_used_tool = None
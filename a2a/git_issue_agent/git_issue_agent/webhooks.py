@@ -0,0 +1,87 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import sys
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from git_issue_agent.cache import ToolResultCache
+from git_issue_agent.config import settings
+from git_issue_agent.issue_index import IssueIndex
+from git_issue_agent.metrics import metrics
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=settings.LOG_LEVEL, stream=sys.stdout, format='%(levelname)s: %(message)s')
+
+WEBHOOK_PATH = settings.WEBHOOK_PATH
+HANDLED_EVENTS = {"issues", "issue_comment"}
+
+
+def verify_signature(secret: str, body: bytes, signature: str) -> bool:
+    """Checks the X-Hub-Signature-256 header GitHub computes over the raw request body."""
+    if not signature or not signature.startswith("sha256="):
+        return False
+    expected = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+class GithubWebhookHandler:
+    """
+    Receives GitHub `issues` and `issue_comment` webhooks and keeps cached issue data fresh.
+
+    Every delivery for a repository invalidates its cached tool results. If the
+    repository is in the local issue index, the issue carried by the payload is
+    written to (or, when deleted or transferred, removed from) the index directly.
+    """
+
+    def __init__(self, secret: str, tool_cache: ToolResultCache = None, issue_index: IssueIndex = None):
+        self.secret = secret
+        self.tool_cache = tool_cache
+        self.issue_index = issue_index
+
+    async def handle(self, request: Request) -> JSONResponse:
+        body = await request.body()
+        if not verify_signature(self.secret, body, request.headers.get("X-Hub-Signature-256")):
+            metrics.incr("webhooks.rejected")
+            return JSONResponse({"error": "Invalid signature"}, status_code=401)
+
+        event = request.headers.get("X-GitHub-Event")
+        if event == "ping":
+            return JSONResponse({"status": "pong"})
+        if event not in HANDLED_EVENTS:
+            return JSONResponse({"status": "ignored", "event": event}, status_code=202)
+
+        try:
+            payload = json.loads(body)
+            owner = payload["repository"]["owner"]["login"]
+            repo = payload["repository"]["name"]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            return JSONResponse({"error": f"Malformed {event} payload: {e}"}, status_code=400)
+
+        metrics.incr("webhooks.received")
+        invalidated = 0
+        if self.tool_cache is not None:
+            invalidated = self.tool_cache.invalidate_repo(owner, repo)
+
+        issue = payload.get("issue")
+        index_updated = False
+        if self.issue_index is not None and issue and "pull_request" not in issue:
+            index_updated = await asyncio.to_thread(
+                self._update_index, owner, repo, event, payload.get("action"), issue
+            )
+
+        logger.info(f"Processed {event} webhook for {owner}/{repo}: {invalidated} cache entries invalidated")
+        return JSONResponse({"status": "ok", "invalidated": invalidated, "index_updated": index_updated})
+
+    def _update_index(self, owner: str, repo: str, event: str, action: str, issue: dict) -> bool:
+        # Only maintain repositories that have been indexed; others are synced on first use
+        if self.issue_index.sync_state(owner, repo) is None:
+            return False
+        if event == "issues" and action in ("deleted", "transferred"):
+            self.issue_index.delete_issue(owner, repo, issue["number"])
+        else:
+            self.issue_index.upsert_issue(owner, repo, issue)
+        return True
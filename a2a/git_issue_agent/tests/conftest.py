@@ -0,0 +1,5 @@
+import os
+
+# the crews in these tests never talk to a real LLM, and shouldn't report telemetry either
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
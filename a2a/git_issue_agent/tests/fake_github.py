@@ -0,0 +1,54 @@
+import httpx
+
+API_URL = "https://api.github.test"
+
+
+def issue(number: int, updated_at: str, comments: int = 0, state: str = "open", labels: tuple = (),
+          title: str = None, pull_request: bool = False) -> dict:
+    """An issue in the format of the GitHub REST API."""
+    data = {
+        "number": number,
+        "title": title or f"Issue {number}",
+        "state": state,
+        "comments": comments,
+        "user": {"login": "octocat"},
+        "html_url": f"https://github.com/kagenti/kagenti/issues/{number}",
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": updated_at,
+        "closed_at": None,
+        "labels": [{"name": label} for label in labels],
+        "assignees": [],
+    }
+    if pull_request:
+        data["pull_request"] = {"url": f"{API_URL}/repos/kagenti/kagenti/pulls/{number}"}
+    return data
+
+
+class FakeGithub:
+    """
+    Serves the issues endpoint of one repository from `issues`, like GitHub does: sorted by
+    updated_at, filtered by `since`, and paginated with Link headers. Records every request.
+    """
+
+    def __init__(self, owner: str, repo: str, issues: list[dict], page_size: int = 2):
+        self.path = f"/repos/{owner}/{repo}/issues"
+        self.issues = issues
+        self.page_size = page_size
+        self.requests: list[httpx.Request] = []
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path != self.path:
+            return httpx.Response(404, json={"message": "Not Found"})
+        since = request.url.params.get("since")
+        matching = sorted((i for i in self.issues if not since or i["updated_at"] >= since), key=lambda i: i["updated_at"])
+        page = int(request.url.params.get("page", 1))
+        rows = matching[(page - 1) * self.page_size:page * self.page_size]
+        headers = {}
+        if page * self.page_size < len(matching):
+            next_params = {"state": "all", "page": page + 1, **({"since": since} if since else {})}
+            headers["Link"] = f'<{request.url.copy_with(params=next_params)}>; rel="next"'
+        return httpx.Response(200, json=rows, headers=headers)
@@ -0,0 +1,33 @@
+import json
+
+from git_issue_agent.digest import build_digest, has_more_pages, parse_issues
+from fake_github import issue
+
+
+def summary(digest: str) -> dict:
+    line = next(line for line in digest.splitlines() if line.startswith("SUMMARY: "))
+    return json.loads(line.removeprefix("SUMMARY: "))
+
+
+def test_counts_are_labelled_as_one_page():
+    issues = parse_issues(json.dumps([issue(number, "2025-03-01T00:00:00Z") for number in range(1, 31)]))
+
+    digest = build_digest(issues, more_pages=True)
+
+    assert summary(digest)["issues_in_page"] == 30
+    assert summary(digest)["more_pages"] is True
+    assert "NOT repository totals" in digest
+    assert "total_issues" not in digest
+
+
+def test_more_pages_from_a_full_page():
+    assert has_more_pages("[]", {"perPage": 10}, 10)
+    assert not has_more_pages("[]", {"perPage": 50}, 10)
+    assert has_more_pages("[]", {}, 30)
+
+
+def test_more_pages_from_page_info():
+    output = json.dumps({"issues": [], "pageInfo": {"hasNextPage": False}})
+    assert not has_more_pages(output, {"perPage": 10}, 10)
+    output = json.dumps({"issues": [], "pageInfo": {"hasNextPage": True}})
+    assert has_more_pages(output, {"perPage": 100}, 10)
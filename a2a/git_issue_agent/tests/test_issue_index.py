@@ -0,0 +1,69 @@
+import pytest
+
+from git_issue_agent.issue_index import IssueIndex
+from fake_github import API_URL, FakeGithub, issue
+
+
+@pytest.fixture
+def github():
+    return FakeGithub("kagenti", "kagenti", [
+        issue(1, "2025-03-01T00:00:00Z", comments=2, labels=("bug",)),
+        issue(2, "2025-03-02T00:00:00Z", comments=7),
+        issue(3, "2025-03-03T00:00:00Z", comments=1, state="closed"),
+        issue(4, "2025-03-04T00:00:00Z", comments=50, pull_request=True),
+        issue(5, "2025-03-05T00:00:00Z", comments=4, labels=("bug",)),
+    ])
+
+
+@pytest.fixture
+def index(tmp_path, github):
+    return IssueIndex(str(tmp_path / "issues.db"), api_url=API_URL, transport=github.transport())
+
+
+def numbers(result: dict) -> list[int]:
+    return [row["number"] for row in result["results"]]
+
+
+def test_first_sync_indexes_every_page_without_pull_requests(index, github):
+    index.sync("kagenti", "kagenti", token="service-token")
+
+    assert len(github.requests) == 3
+    assert all(request.headers["Authorization"] == "Bearer service-token" for request in github.requests)
+    assert "since" not in github.requests[0].url.params
+    assert index.query("kagenti", "kagenti", "count", state="all")["results"] == [{"count": 4}]
+    assert numbers(index.query("kagenti", "kagenti", "top_commented", state="all")) == [2, 5, 1, 3]
+    state = index.sync_state("kagenti", "kagenti")
+    assert state["complete"] and state["last_updated_at"] == "2025-03-05T00:00:00Z"
+
+
+def test_incremental_sync_fetches_only_changed_issues(index, github):
+    index.sync("kagenti", "kagenti", token="service-token")
+    github.requests.clear()
+    github.issues[0] = issue(1, "2025-04-01T00:00:00Z", comments=20, labels=("bug",), title="Renamed")
+    github.issues.append(issue(6, "2025-04-02T00:00:00Z", comments=3))
+
+    index.sync("kagenti", "kagenti", token="service-token", force=True)
+
+    # since is inclusive, so issue 5 comes back once more along with the two changed issues
+    assert len(github.requests) == 2
+    assert {request.url.params["since"] for request in github.requests} == {"2025-03-05T00:00:00Z"}
+    top = index.query("kagenti", "kagenti", "top_commented", limit=2)
+    assert numbers(top) == [1, 2]
+    assert top["results"][0]["title"] == "Renamed"
+    assert index.query("kagenti", "kagenti", "count")["results"] == [{"count": 4}]
+    assert index.query("kagenti", "kagenti", "group_by_label")["results"] == [{"label": "bug", "count": 2}]
+
+
+def test_recent_sync_is_skipped(index, github):
+    index.sync("kagenti", "kagenti", token="service-token")
+    github.requests.clear()
+
+    index.sync("kagenti", "kagenti", token="service-token")
+
+    assert github.requests == []
+
+
+def test_sync_requires_a_token(index, github):
+    with pytest.raises(ValueError):
+        index.sync("kagenti", "kagenti", token="")
+    assert github.requests == []
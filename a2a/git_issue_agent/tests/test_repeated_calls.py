@@ -0,0 +1,63 @@
+import json
+
+from crewai.llms.base_llm import BaseLLM
+from crewai.tools import BaseTool
+
+from git_issue_agent.agents import GitAgents
+from git_issue_agent.config import Settings
+
+LIST_ISSUES = 'Thought: I need the open issues\nAction: list_issues\nAction Input: {"owner": "kagenti", "repo": "kagenti"}'
+LIST_LABELS = 'Thought: I need the labels\nAction: list_labels\nAction Input: {"owner": "kagenti", "repo": "kagenti"}'
+FINAL_ANSWER = "Thought: I know the answer\nFinal Answer: There is one open issue."
+
+
+class ScriptedLLM(BaseLLM):
+    """Answers with the given responses in order and records the last message of each prompt."""
+
+    def __init__(self, responses: list[str]):
+        super().__init__(model="scripted")
+        self.responses = list(responses)
+        self.prompts: list[str] = []
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, from_task=None, from_agent=None):
+        self.prompts.append(messages[-1]["content"] if isinstance(messages, list) else messages)
+        return self.responses.pop(0) if self.responses else FINAL_ANSWER
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+
+class RecordingTool(BaseTool):
+    calls: list = []
+
+    def _run(self, owner: str, repo: str) -> str:
+        self.calls.append((owner, repo))
+        return json.dumps([{"number": 1, "title": f"Issue of {self.name}", "state": "open"}])
+
+
+def run_crew(responses: list[str]) -> tuple[ScriptedLLM, dict[str, RecordingTool]]:
+    tools = {name: RecordingTool(name=name, description=f"{name} of a repository", calls=[])
+             for name in ("list_issues", "list_labels")}
+    crew = GitAgents(Settings(TOOL_OUTPUT_TOKEN_BUDGET=0)).issue_crew(list(tools.values()), query="open issues")
+    llm = ScriptedLLM(responses)
+    for agent in crew.agents:
+        agent.llm = llm
+    crew.kickoff(inputs={"request": "What are the open issues?", "repo": "kagenti", "owner": "kagenti", "issues": []})
+    return llm, tools
+
+
+def test_immediate_repeat_gets_the_memoized_observation_and_a_nudge():
+    llm, tools = run_crew([LIST_ISSUES, LIST_ISSUES, FINAL_ANSWER])
+
+    assert len(tools["list_issues"].calls) == 1
+    assert "I tried reusing the same input" not in llm.prompts[2]
+    assert "Issue of list_issues" in llm.prompts[2]
+    assert "You already called list_issues with these exact arguments" in llm.prompts[2]
+
+
+def test_repeat_after_another_call_gets_the_memoized_observation_and_a_nudge():
+    llm, tools = run_crew([LIST_ISSUES, LIST_LABELS, LIST_ISSUES, FINAL_ANSWER])
+
+    assert len(tools["list_issues"].calls) == 1
+    assert len(tools["list_labels"].calls) == 1
+    assert "You already called list_issues with these exact arguments" in llm.prompts[3]
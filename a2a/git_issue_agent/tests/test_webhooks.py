@@ -0,0 +1,113 @@
+import hashlib
+import hmac
+import json
+
+import pytest
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from git_issue_agent.cache import ToolResultCache
+from git_issue_agent.issue_index import IssueIndex
+from git_issue_agent.webhooks import WEBHOOK_PATH, GithubWebhookHandler
+from fake_github import API_URL, FakeGithub, issue
+
+SECRET = "webhook-secret"
+REPOSITORY = {"name": "kagenti", "owner": {"login": "kagenti"}}
+
+
+@pytest.fixture
+def index(tmp_path):
+    github = FakeGithub("kagenti", "kagenti", [issue(1, "2025-03-01T00:00:00Z", comments=2), issue(2, "2025-03-02T00:00:00Z")])
+    index = IssueIndex(str(tmp_path / "issues.db"), api_url=API_URL, transport=github.transport())
+    index.sync("kagenti", "kagenti", token="service-token")
+    return index
+
+
+@pytest.fixture
+def tool_cache():
+    cache = ToolResultCache(ttl=600)
+    for owner, repo in (("kagenti", "kagenti"), ("other", "project")):
+        arguments = {"owner": owner, "repo": repo}
+        cache.put(cache.key("list_issues", arguments, "scope"), "[]", 0.5, (owner, repo))
+    return cache
+
+
+@pytest.fixture
+def client(index, tool_cache):
+    app = Starlette()
+    app.add_route(WEBHOOK_PATH, GithubWebhookHandler(SECRET, tool_cache=tool_cache, issue_index=index).handle, methods=["POST"])
+    return TestClient(app)
+
+
+def post(client: TestClient, event: str, payload: dict, secret: str = SECRET, signed: bool = True):
+    body = json.dumps(payload).encode()
+    headers = {"X-GitHub-Event": event, "Content-Type": "application/json"}
+    if signed:
+        headers["X-Hub-Signature-256"] = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return client.post(WEBHOOK_PATH, content=body, headers=headers)
+
+
+def cached(tool_cache: ToolResultCache, owner: str, repo: str) -> bool:
+    return tool_cache.get(tool_cache.key("list_issues", {"owner": owner, "repo": repo}, "scope")) is not None
+
+
+def indexed_issue(index: IssueIndex, number: int) -> dict:
+    rows = index.query("kagenti", "kagenti", "recently_updated", state="all", limit=100)["results"]
+    return next(row for row in rows if row["number"] == number)
+
+
+def test_issues_event_invalidates_the_repository_and_updates_the_index(client, index, tool_cache):
+    payload = {"action": "edited", "repository": REPOSITORY,
+               "issue": issue(1, "2025-04-01T00:00:00Z", comments=2, title="Renamed")}
+
+    response = post(client, "issues", payload)
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "invalidated": 1, "index_updated": True}
+    assert not cached(tool_cache, "kagenti", "kagenti")
+    assert cached(tool_cache, "other", "project")
+    assert indexed_issue(index, 1)["title"] == "Renamed"
+
+
+def test_issue_comment_event_updates_the_comment_count(client, index, tool_cache):
+    payload = {"action": "created", "repository": REPOSITORY, "comment": {"body": "Same here"},
+               "issue": issue(2, "2025-04-01T00:00:00Z", comments=1)}
+
+    response = post(client, "issue_comment", payload)
+
+    assert response.status_code == 200
+    assert not cached(tool_cache, "kagenti", "kagenti")
+    assert indexed_issue(index, 2)["comments"] == 1
+
+
+def test_deleted_issue_is_removed_from_the_index(client, index):
+    payload = {"action": "deleted", "repository": REPOSITORY, "issue": issue(2, "2025-04-01T00:00:00Z")}
+
+    assert post(client, "issues", payload).status_code == 200
+    assert index.query("kagenti", "kagenti", "count", state="all")["results"] == [{"count": 1}]
+
+
+@pytest.mark.parametrize("secret, signed", [("wrong-secret", True), (SECRET, False)])
+def test_bad_or_missing_signature_is_rejected(client, index, tool_cache, secret, signed):
+    payload = {"action": "edited", "repository": REPOSITORY,
+               "issue": issue(1, "2025-04-01T00:00:00Z", title="Renamed")}
+
+    response = post(client, "issues", payload, secret=secret, signed=signed)
+
+    assert response.status_code == 401
+    assert cached(tool_cache, "kagenti", "kagenti")
+    assert indexed_issue(index, 1)["title"] == "Issue 1"
+
+
+def test_out_of_order_update_is_ignored(client, index):
+    newer = {"action": "edited", "repository": REPOSITORY,
+             "issue": issue(1, "2025-04-02T00:00:00Z", comments=5, title="Newer title")}
+    older = {"action": "edited", "repository": REPOSITORY,
+             "issue": issue(1, "2025-04-01T00:00:00Z", comments=3, title="Older title", labels=("stale",))}
+
+    assert post(client, "issues", newer).status_code == 200
+    assert post(client, "issues", older).status_code == 200
+
+    row = indexed_issue(index, 1)
+    assert (row["title"], row["comments"], row["updated_at"]) == ("Newer title", 5, "2025-04-02T00:00:00Z")
+    assert index.query("kagenti", "kagenti", "group_by_label", state="all")["results"] == []
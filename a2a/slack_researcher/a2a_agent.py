@@ -5,6 +5,7 @@ Module for A2A Agent.
 import logging
 import sys
 import traceback
+import uuid
 from typing import Callable
 
 import uvicorn
@@ -25,6 +26,7 @@ from starlette.middleware.authentication import AuthenticationMiddleware
 from slack_researcher.config import settings, Settings
 from slack_researcher.event import Event
 from slack_researcher.main import SlackAgent
+from slack_researcher.agents import AgentPool
 from slack_researcher.auth import on_auth_error, BearerAuthBackend, auth_headers
 
 logger = logging.getLogger(__name__)
@@ -81,6 +83,25 @@ class A2AEvent(Event):
             task_updater (TaskUpdater): The task updater instance.
         """
         self.task_updater = task_updater
+        # Partial results and the final report are chunks of a single artifact
+        self.artifact_id = str(uuid.uuid4())
+        self.artifact_started = False
+
+    async def emit_artifact_chunk(self, message: str) -> None:
+        """
+        Appends partial output to the result artifact before the task completes.
+
+        Args:
+            message (str): The partial output.
+        """
+        await self.task_updater.add_artifact(
+            [TextPart(text=message)],
+            artifact_id=self.artifact_id,
+            name="report",
+            append=self.artifact_started,
+            last_chunk=False,
+        )
+        self.artifact_started = True
 
     async def emit_event(self, message: str, final: bool = False) -> None:
         """
@@ -94,7 +115,13 @@ class A2AEvent(Event):
 
         if final:
             parts = [TextPart(text=message)]
-            await self.task_updater.add_artifact(parts)
+            if self.artifact_started:
+                parts = [TextPart(text=f"## Report\n\n{message}")]
+                await self.task_updater.add_artifact(
+                    parts, artifact_id=self.artifact_id, name="report", append=True, last_chunk=True
+                )
+            else:
+                await self.task_updater.add_artifact(parts)
             await self.task_updater.complete()
         else:
             await self.task_updater.update_status(
@@ -111,20 +138,28 @@ class ResearchExecutor(AgentExecutor):
     """
     A class to handle research execution for A2A Agent.
     """
+    def __init__(self):
+        # Agent sets are reused across requests; each one serves a single request at a time
+        self.agent_pool = AgentPool(settings)
+
     async def _run_agent(self,
         messages: dict,
         settings: Settings,
         event_emitter: Event,
         assistant_tool_map: dict[str, Callable],
-        toolkit: Toolkit):
-
-        slack_agent = SlackAgent(
-            config=settings,
-            eventer=event_emitter,
-            assistant_tools=assistant_tool_map,
-            mcp_toolkit=toolkit,
-        )
-        result = await slack_agent.execute(messages)
+        toolkit: Toolkit,
+        session: ClientSession = None):
+
+        async with self.agent_pool.acquire(toolkit) as agents:
+            slack_agent = SlackAgent(
+                config=settings,
+                eventer=event_emitter,
+                assistant_tools=assistant_tool_map,
+                mcp_toolkit=toolkit,
+                mcp_session=session,
+                agents=agents,
+            )
+            result = await slack_agent.execute(messages)
         await event_emitter.emit_event(result, True)
 
     async def execute(self, context: RequestContext, event_queue: EventQueue):
@@ -184,7 +219,8 @@ class ResearchExecutor(AgentExecutor):
                     await self._run_agent(messages, settings,
                         event_emitter,
                         assistant_tool_map,
-                        toolkit,)
+                        toolkit,
+                        session,)
             else:
                 await self._run_agent(messages, settings,
                     event_emitter,
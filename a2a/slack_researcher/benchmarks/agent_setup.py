@@ -0,0 +1,58 @@
+"""
+Benchmark for per-request agent setup.
+
+Compares building a new agent set for every request (what ResearchExecutor used to
+do) with checking one out of an AgentPool, and reports the setup time per request.
+No LLM calls are made.
+
+Usage (from a2a/slack_researcher; like the agent itself, importing the settings
+requires the SVID token file, so run it where the agent runs):
+
+    uv run python -m benchmarks.agent_setup --requests 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from slack_researcher.agents import AgentPool, Agents
+from slack_researcher.config import settings
+
+
+async def pooled_setup(requests: int) -> list[float]:
+    pool = AgentPool(settings)
+    timings = []
+    for _ in range(requests):
+        start = time.monotonic()
+        async with pool.acquire():
+            timings.append(time.monotonic() - start)
+    return timings
+
+
+def fresh_setup(requests: int) -> list[float]:
+    timings = []
+    for _ in range(requests):
+        start = time.monotonic()
+        Agents(settings)
+        timings.append(time.monotonic() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    fresh = fresh_setup(args.requests)
+    pooled = asyncio.run(pooled_setup(args.requests))
+
+    print(f"{'setup':<10} {'mean ms':>10} {'p50 ms':>10} {'max ms':>10}")
+    for name, timings in (("fresh", fresh), ("pooled", pooled)):
+        print(f"{name:<10} {statistics.mean(timings) * 1000:>10.2f} {statistics.median(timings) * 1000:>10.2f} "
+              f"{max(timings) * 1000:>10.2f}")
+    print(f"Saved per request: {(statistics.mean(fresh) - statistics.mean(pooled)) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
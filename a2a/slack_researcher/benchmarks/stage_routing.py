@@ -0,0 +1,170 @@
+"""
+Benchmark for per-stage model routing (STAGE_MODEL_OVERRIDES).
+
+Runs SlackAgent end to end against a stub OpenAI-compatible LLM server and a fake
+Slack MCP session, and reports the end-to-end latency of each routing profile. The
+stub answers every stage with a canned response after a fixed, per-model delay, so
+the numbers reflect how many calls each profile sends to the slow model and how
+they overlap, not model quality.
+
+Usage (from a2a/slack_researcher; like the agent itself, importing the settings
+requires the SVID token file, so run it where the agent runs):
+
+    uv run python -m benchmarks.stage_routing --runs 3 --small-latency 0.3 --large-latency 2.0
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from slack_researcher.config import Settings
+from slack_researcher.main import SlackAgent
+
+SMALL_MODEL = "stub-small"
+LARGE_MODEL = "stub-large"
+CLASSIFICATION_STAGES = ["intent_classifier", "requirement_identifier", "channel_filter"]
+
+PROFILES = {
+    "single-model": {},
+    "small-classifiers": {stage: {"model": SMALL_MODEL} for stage in CLASSIFICATION_STAGES},
+    "small-all-but-report": {
+        stage: {"model": SMALL_MODEL}
+        for stage in [*CLASSIFICATION_STAGES, "slack_channel_assistant", "chunk_summarizer"]
+    },
+}
+
+QUERY = "What deployment incidents were discussed in the engineering channels this week?"
+
+############
+# Stub LLM
+############
+
+class StubLLM:
+    def __init__(self, latencies: dict[str, float]):
+        self.latencies = latencies
+        self.calls = Counter()
+        self.lock = threading.Lock()
+
+    def respond(self, body: dict) -> str:
+        """Picks a canned answer for the stage, recognised by response format or system prompt."""
+        schema = ((body.get("response_format") or {}).get("json_schema") or {}).get("name")
+        if schema == "UserIntent":
+            return json.dumps({"intent": "QUERY CHANNELS"})
+        if schema == "UserRequirement":
+            return json.dumps({
+                "specific_channel_names": None,
+                "types_of_channels": "engineering and deployment channels",
+                "types_of_information_to_search": "deployment incidents",
+            })
+        if schema == "ChannelList":
+            channels = [{"name": f"deploy-{i}", "id": f"C{i:04d}", "description": "Deployment incidents"} for i in range(3)]
+            return json.dumps({"channels": channels, "explanation": "Channels about deployments"})
+        system = next((m.get("content") or "" for m in body.get("messages", []) if m.get("role") == "system"), "")
+        if "condensing one part" in system:
+            return "- deploy-0: the 2.3 rollout failed on a missing secret and was rolled back (U0001)."
+        return "##ANSWER\nOne deployment incident: the 2.3 rollout failed on a missing secret and was rolled back."
+
+    async def chat_completions(self, request: Request) -> JSONResponse:
+        body = await request.json()
+        model = body.get("model", "")
+        with self.lock:
+            self.calls[model] += 1
+        await asyncio.sleep(self.latencies.get(model, 0))
+        content = self.respond(body)
+        return JSONResponse({
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        })
+
+
+def start_stub_server(stub: StubLLM, port: int) -> uvicorn.Server:
+    app = Starlette()
+    app.add_route("/v1/chat/completions", stub.chat_completions, methods=["POST"])
+    app.add_route("/chat/completions", stub.chat_completions, methods=["POST"])
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+############
+# Fake Slack MCP session
+############
+
+class FakeSlackSession:
+    """Answers get_channels/get_channel_history like the slack MCP tool, after a fixed delay."""
+
+    def __init__(self, channels: int = 40, latency: float = 0.05):
+        self.channels = channels
+        self.latency = latency
+
+    async def call_tool(self, name: str, arguments: dict):
+        await asyncio.sleep(self.latency)
+        if name == "get_channels":
+            items = [{"id": f"C{i:04d}", "name": f"deploy-{i}" if i < 3 else f"team-{i}", "purpose": "Deployment incidents" if i < 3 else "Team chat"}
+                     for i in range(self.channels)]
+        else:
+            now = time.time()
+            items = [{"user": f"U{i % 7:04d}", "ts": f"{now - i * 3600:.6f}", "text": f"Message {i} about lunch plans"}
+                     for i in range(arguments.get("limit", 20))]
+            items[len(items) // 2]["text"] = "The 2.3 deployment failed on a missing secret, rolled back"
+        return SimpleNamespace(isError=False, content=[SimpleNamespace(type="text", text=json.dumps(item)) for item in items])
+
+############
+# Benchmark
+############
+
+async def run_profile(config: Settings, runs: int) -> list[float]:
+    latencies = []
+    for _ in range(runs):
+        agent = SlackAgent(config=config, mcp_session=FakeSlackSession())
+        start = time.monotonic()
+        await agent.execute([{"role": "User", "content": QUERY}])
+        latencies.append(time.monotonic() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--small-latency", type=float, default=0.3, help="Seconds per call to the small model")
+    parser.add_argument("--large-latency", type=float, default=2.0, help="Seconds per call to the large model")
+    args = parser.parse_args()
+
+    stub = StubLLM({SMALL_MODEL: args.small_latency, LARGE_MODEL: args.large_latency})
+    server = start_stub_server(stub, args.port)
+
+    print(f"{'profile':<22} {'mean s':>8} {'p50 s':>8} {'small calls':>12} {'large calls':>12}")
+    for name, overrides in PROFILES.items():
+        config = Settings(
+            TASK_MODEL_ID=LARGE_MODEL,
+            LLM_API_BASE=f"http://127.0.0.1:{args.port}/v1",
+            LLM_API_KEY="stub",
+            STAGE_MODEL_OVERRIDES=overrides,
+            LOG_LEVEL="WARNING",
+        )
+        stub.calls.clear()
+        latencies = asyncio.run(run_profile(config, args.runs))
+        print(f"{name:<22} {statistics.mean(latencies):>8.2f} {statistics.median(latencies):>8.2f} "
+              f"{stub.calls[SMALL_MODEL] / args.runs:>12.1f} {stub.calls[LARGE_MODEL] / args.runs:>12.1f}")
+
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
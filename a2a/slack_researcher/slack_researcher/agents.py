@@ -1,5 +1,7 @@
 import logging
 import sys
+import time
+from contextlib import asynccontextmanager
 
 from typing import Callable
 from autogen import coding, ConversableAgent, register_function
@@ -11,6 +13,7 @@ from slack_researcher.prompts import (
     ASSISTANT_PROMPT,
     REQUIREMENT_IDENTIFIER_PROMPT,
     CHANNEL_FILTER_PROMPT,
+    CHUNK_SUMMARIZER_PROMPT,
     SUMMARIZER_PROMPT
 )
 
@@ -32,13 +35,10 @@ class Agents:
 
         llm_config = LLMConfig(config)
 
-        self.slack_channel_assistant = ConversableAgent(
-            system_message=ASSISTANT_PROMPT,
-            name="Slack_Channel_Assistant",
-            llm_config=llm_config.openai_llm_config,
-            code_execution_config=False,
-            human_input_mode="NEVER",
-        )
+        self.llm_config = llm_config
+        self.mcp_toolkit = mcp_toolkit
+
+        self.slack_channel_assistant = self._slack_channel_assistant()
 
         self.intent_classifier = ConversableAgent(
             name="Intent_Classifier",
@@ -66,26 +66,13 @@ class Agents:
         self.report_generator = ConversableAgent(
             name="Report_Generator",
             system_message=SUMMARIZER_PROMPT,
-            llm_config=llm_config.openai_llm_config,
+            llm_config=llm_config.report_llm_config,
             code_execution_config=False,
             human_input_mode="NEVER",
         )
 
         # User Proxy chats with assistant on behalf of user and executes tools
-        self.user_proxy = ConversableAgent(
-            name="User",
-            human_input_mode="NEVER",
-            code_execution_config=False,
-            is_termination_msg=lambda msg: msg
-            and "content" in msg
-            and msg["content"] is not None
-            and (
-                "##ANSWER" in msg["content"]
-                or "## Answer" in msg["content"]
-                or "##TERMINATE##" in msg["content"]
-                or ("tool_calls" not in msg and msg["content"] == "")
-            ),
-        )
+        self.user_proxy = self._user_proxy()
 
         tool_descriptions = ""
 
@@ -104,8 +91,7 @@ class Agents:
         if mcp_toolkit is not None:
             logging.info("Registering MCP tool")
             logging.info(mcp_toolkit)
-            mcp_toolkit.register_for_execution(self.user_proxy)
-            mcp_toolkit.register_for_llm(self.slack_channel_assistant)
+            self._register_toolkit(self.user_proxy, self.slack_channel_assistant)
             tool_descriptions = []
             for tool in mcp_toolkit.tools:
                 tool_descriptions.append({tool.name : tool.description})
@@ -113,3 +99,99 @@ class Agents:
             logging.info("Tool descriptions: %s", tool_descriptions)
         else:
             logging.info("No MCP tools to register")
+
+    def _slack_channel_assistant(self) -> ConversableAgent:
+        return ConversableAgent(
+            system_message=ASSISTANT_PROMPT,
+            name="Slack_Channel_Assistant",
+            llm_config=self.llm_config.openai_llm_config,
+            code_execution_config=False,
+            human_input_mode="NEVER",
+        )
+
+    def _user_proxy(self) -> ConversableAgent:
+        return ConversableAgent(
+            name="User",
+            human_input_mode="NEVER",
+            code_execution_config=False,
+            is_termination_msg=lambda msg: msg
+            and "content" in msg
+            and msg["content"] is not None
+            and (
+                "##ANSWER" in msg["content"]
+                or "## Answer" in msg["content"]
+                or "##TERMINATE##" in msg["content"]
+                or ("tool_calls" not in msg and msg["content"] == "")
+            ),
+        )
+
+    def _register_toolkit(self, executor: ConversableAgent, caller: ConversableAgent):
+        self.mcp_toolkit.register_for_execution(executor)
+        self.mcp_toolkit.register_for_llm(caller)
+
+    def slack_tool_agents(self) -> tuple[ConversableAgent, ConversableAgent]:
+        """
+        Returns a new (user proxy, slack channel assistant) pair with the current MCP tools registered.
+
+        An autogen agent keeps one chat history per peer, so concurrent chats between
+        the same two agents would interleave. Each tool-calling chat gets its own pair, which
+        also keeps the request-bound MCP tools off the long-lived agents.
+        """
+        user_proxy = self._user_proxy()
+        assistant = self._slack_channel_assistant()
+        if self.mcp_toolkit is not None:
+            self._register_toolkit(user_proxy, assistant)
+        return user_proxy, assistant
+
+    def chunk_summarizer_agents(self) -> tuple[ConversableAgent, ConversableAgent]:
+        """Returns a new (user proxy, chunk summarizer) pair for one map step of the report."""
+        chunk_summarizer = ConversableAgent(
+            name="Chunk_Summarizer",
+            system_message=CHUNK_SUMMARIZER_PROMPT,
+            llm_config=self.llm_config.chunk_summarizer_llm_config,
+            code_execution_config=False,
+            human_input_mode="NEVER",
+        )
+        return self._user_proxy(), chunk_summarizer
+
+    def reset(self):
+        """Clears the chat histories and reply counters of all long-lived agents."""
+        for agent in (self.slack_channel_assistant, self.intent_classifier, self.requirement_identifier,
+                      self.channel_assistant_no_tools, self.report_generator, self.user_proxy):
+            agent.reset()
+
+
+class AgentPool:
+    """
+    Reuses agent sets across requests instead of building them (and their LLM configs) per request.
+
+    A set serves one request at a time, so concurrent requests never share chat histories;
+    the pool grows to the peak number of concurrent requests. Sets in the pool carry no MCP
+    tools: the request's toolkit is attached while the set is checked out and used only by
+    the per-chat agent pairs from `slack_tool_agents()`.
+    """
+
+    def __init__(self, config: Settings = None, assistant_tools: dict[str, Callable] = None):
+        self.config = config or settings
+        self.assistant_tools = assistant_tools
+        self._idle: list[Agents] = []
+        self.created = 0
+
+    @asynccontextmanager
+    async def acquire(self, mcp_toolkit: Toolkit = None):
+        start = time.monotonic()
+        # no await between checking and popping, so this is safe on a single event loop
+        agents = self._idle.pop() if self._idle else None
+        reused = agents is not None
+        if not reused:
+            agents = Agents(self.config, self.assistant_tools)
+            self.created += 1
+        agents.mcp_toolkit = mcp_toolkit
+        logger.info(f"{'Reused' if reused else 'Built'} agent set in {(time.monotonic() - start) * 1000:.1f} ms "
+                    f"({self.created} built, {len(self._idle)} idle)")
+        try:
+            yield agents
+        finally:
+            agents.mcp_toolkit = None
+            agents.reset()
+            self._idle.append(agents)
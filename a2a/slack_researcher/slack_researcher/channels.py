@@ -0,0 +1,122 @@
+import ast
+import json
+import re
+from typing import Any, Optional
+
+from slack_researcher.data_types import ChannelInfo
+from slack_researcher.lexical import BM25, similarity, tokenize
+
+############
+# Local channel matching over the channel catalog returned by get_channels
+############
+
+NAME_SEPARATORS = re.compile(r",|;|&|\+|/|\band\b|\bor\b", re.IGNORECASE)
+NAME_NOISE = re.compile(r"^(the\s+)|(\s+channels?)$", re.IGNORECASE)
+# Words that, together with "all"/"every", mean the user did not restrict the channel list
+GENERIC_CHANNEL_WORDS = {"channel", "slack", "available", "every", "public", "existing", "current"}
+EMPTY_VALUES = {"", "none", "null", "n/a"}
+
+
+def parse_json_objects(text: str) -> list[Any]:
+    """
+    Extracts every JSON object from free text, e.g. several concatenated tool outputs.
+    Python dict reprs are accepted as well, since some tool responses are stringified with str().
+    """
+    decoder = json.JSONDecoder()
+    objects = []
+    index = text.find("{")
+    while index != -1:
+        try:
+            obj, end = decoder.raw_decode(text, index)
+        except json.JSONDecodeError:
+            end = index + 1
+        else:
+            objects.append(obj)
+        index = text.find("{", end)
+    if objects:
+        return objects
+
+    for match in re.finditer(r"\{[^{}]*\}", text):
+        try:
+            objects.append(ast.literal_eval(match.group(0)))
+        except (ValueError, SyntaxError):
+            continue
+    return objects
+
+
+def parse_channel_catalog(text: str) -> list[ChannelInfo]:
+    """Returns the channels listed in get_channels output, skipping error entries and duplicates."""
+    channels: dict[str, ChannelInfo] = {}
+    for obj in parse_json_objects(text or ""):
+        if not isinstance(obj, dict) or not obj.get("id") or not obj.get("name"):
+            continue
+        channels.setdefault(obj["id"], ChannelInfo(
+            name=str(obj["name"]),
+            id=str(obj["id"]),
+            description=str(obj.get("purpose") or obj.get("description") or ""),
+        ))
+    return list(channels.values())
+
+
+def is_empty(value: Optional[str]) -> bool:
+    return value is None or value.strip().lower() in EMPTY_VALUES
+
+
+def wants_all_channels(description: Optional[str]) -> bool:
+    """True for descriptions such as "all channels" or "every slack channel"."""
+    if is_empty(description):
+        return False
+    words = set(re.findall(r"[a-z]+", description.lower()))
+    return bool(words & {"all", "every"}) and set(tokenize(description)) <= GENERIC_CHANNEL_WORDS
+
+
+def split_channel_names(names: str) -> list[str]:
+    """Splits "the announcement and #general channels" into ["announcement", "general"]."""
+    phrases = []
+    for phrase in NAME_SEPARATORS.split(names or ""):
+        phrase = NAME_NOISE.sub("", phrase.strip().lstrip("#")).strip().lstrip("#")
+        if phrase:
+            phrases.append(re.sub(r"[\s_]+", "-", phrase.lower()))
+    return phrases
+
+
+def resolve_channel_names(
+    names: str, catalog: list[ChannelInfo], threshold: float = 0.85
+) -> tuple[list[ChannelInfo], list[str]]:
+    """
+    Fuzzy matches explicitly named channels against the catalog.
+    Returns the matched channels and the names that could not be resolved unambiguously.
+    """
+    resolved: list[ChannelInfo] = []
+    unresolved: list[str] = []
+    for phrase in split_channel_names(names):
+        ranked = sorted(((similarity(phrase, channel.name), channel) for channel in catalog),
+                        key=lambda item: item[0], reverse=True)
+        if not ranked or ranked[0][0] < threshold:
+            unresolved.append(phrase)
+            continue
+        best_score, best = ranked[0]
+        # two near-identical candidates (e.g. "dev-ops" vs "devops-2") need the LLM to decide
+        if best_score < 1 and len(ranked) > 1 and ranked[1][0] >= threshold and best_score - ranked[1][0] < 0.05:
+            unresolved.append(phrase)
+            continue
+        if best not in resolved:
+            resolved.append(best)
+    return resolved, unresolved
+
+
+def shortlist_channels(catalog: list[ChannelInfo], names: Optional[str], criteria: Optional[str], size: int) -> list[ChannelInfo]:
+    """The `size` channels most likely to match, by fuzzy name match plus BM25 over names and purposes."""
+    if len(catalog) <= size:
+        return catalog
+    phrases = [] if is_empty(names) else split_channel_names(names)
+    query = " ".join(part for part in (names, criteria) if not is_empty(part))
+    bm25 = BM25([f"{channel.name.replace('-', ' ')} {channel.description}" for channel in catalog])
+    scores = bm25.scores(query)
+    for index, channel in enumerate(catalog):
+        name_score = max((similarity(phrase, channel.name) for phrase in phrases), default=0)
+        if name_score >= 0.6:
+            # a close name match outranks purpose matches
+            scores[index] += 10 * name_score
+    ranked = sorted(range(len(catalog)), key=lambda index: scores[index], reverse=True)
+    return [catalog[index] for index in ranked[:size]]
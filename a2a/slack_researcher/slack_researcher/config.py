@@ -45,6 +45,12 @@ def get_client_secret_from_svid(secret_file_path) -> Optional[str]:
         print(f"Error reading CLIENT_SECRET file: {e}")
         return None
 
+# Stages whose LLM can be configured separately through STAGE_MODEL_OVERRIDES
+LLM_STAGES = {
+    "slack_channel_assistant", "intent_classifier", "requirement_identifier",
+    "channel_filter", "chunk_summarizer", "report_generator",
+}
+
 class Settings(BaseSettings):
     # static path for client secret file
     secret_file_path: str = "/shared/secret.txt"
@@ -63,6 +69,10 @@ class Settings(BaseSettings):
     )
     LLM_API_KEY: str = Field(os.getenv("LLM_API_KEY", "my_api_key"), description="The key for OpenAI API")
     EXTRA_HEADERS: dict = Field({}, description="Extra headers for the OpenAI API")
+    STAGE_MODEL_OVERRIDES: dict = Field(
+        {},
+        description="Per-stage LLM overrides as JSON, e.g. {\"intent_classifier\": {\"model\": \"granite3.3:2b\"}}",
+    )
     MODEL_TEMPERATURE: float = Field(
         os.getenv("MODEL_TEMPERATURE", 0),
         description="The temperature for the model",
@@ -73,6 +83,81 @@ class Settings(BaseSettings):
         description="The maximum number of plan steps",
         ge=1,
     )
+    DIRECT_TOOL_CALLS: bool = Field(
+        os.getenv("DIRECT_TOOL_CALLS", True),
+        description="Call MCP tools whose arguments are already known directly instead of through the LLM",
+    )
+    CHANNEL_NAME_MATCH_THRESHOLD: float = Field(
+        os.getenv("CHANNEL_NAME_MATCH_THRESHOLD", 0.85),
+        description="Minimum fuzzy similarity for resolving a channel the user named without the LLM",
+        ge=0,
+        le=1,
+    )
+    CHANNEL_SHORTLIST_SIZE: int = Field(
+        os.getenv("CHANNEL_SHORTLIST_SIZE", 20),
+        description="The number of best matching channels passed to the LLM channel filter",
+        ge=1,
+    )
+    STRUCTURED_OUTPUT_RETRIES: int = Field(
+        os.getenv("STRUCTURED_OUTPUT_RETRIES", 1),
+        description="How often a stage is re-prompted when its structured output cannot be parsed or repaired",
+        ge=0,
+    )
+    MAX_CONCURRENT_CHANNELS: int = Field(
+        os.getenv("MAX_CONCURRENT_CHANNELS", 4),
+        description="The maximum number of slack channels queried at the same time",
+        ge=1,
+    )
+    CHANNEL_QUERY_TIMEOUT: float = Field(
+        os.getenv("CHANNEL_QUERY_TIMEOUT", 120),
+        description="Seconds after which querying a single slack channel is abandoned",
+        gt=0,
+    )
+    CHANNEL_HISTORY_LIMIT: int = Field(
+        os.getenv("CHANNEL_HISTORY_LIMIT", 100),
+        description="The number of recent messages fetched per channel before selecting the relevant ones",
+        ge=1,
+    )
+    MESSAGES_PER_CHANNEL: int = Field(
+        os.getenv("MESSAGES_PER_CHANNEL", 15),
+        description="The maximum number of messages per channel passed on to the report",
+        ge=1,
+    )
+    MESSAGE_TOKEN_BUDGET: int = Field(
+        os.getenv("MESSAGE_TOKEN_BUDGET", 1500),
+        description="Estimated tokens of messages per channel passed on to the report",
+        ge=100,
+    )
+    MESSAGE_RECENCY_WEIGHT: float = Field(
+        os.getenv("MESSAGE_RECENCY_WEIGHT", 0.3),
+        description="Weight of recency versus query relevance when ranking messages",
+        ge=0,
+        le=1,
+    )
+    MESSAGE_RECENCY_HALF_LIFE_HOURS: float = Field(
+        os.getenv("MESSAGE_RECENCY_HALF_LIFE_HOURS", 72),
+        description="Age difference in hours after which a message's recency bonus halves",
+        gt=0,
+    )
+    STREAM_CHANNEL_FINDINGS: bool = Field(
+        os.getenv("STREAM_CHANNEL_FINDINGS", True),
+        description="Condense each channel's findings as soon as it is queried and stream them as partial results",
+    )
+    SUMMARY_TOKEN_BUDGET: int = Field(
+        os.getenv("SUMMARY_TOKEN_BUDGET", 6000),
+        description="Estimated tokens of gathered data above which the report is produced with map-reduce summarization",
+        ge=500,
+    )
+    SUMMARY_CHUNK_TOKENS: int = Field(
+        os.getenv("SUMMARY_CHUNK_TOKENS", 3000),
+        description="Target size in estimated tokens of each chunk summarized in the map step",
+        ge=200,
+    )
+    SUMMARY_MAX_MAP_CALLS: int = Field(
+        os.getenv("SUMMARY_MAX_MAP_CALLS", 8),
+        description="The maximum number of concurrent LLM calls in each map step; chunks grow to stay within it",
+        ge=1,
+    )
     MCP_URL: str = Field(os.getenv("MCP_URL", "http://slack-tool:8000"), description="Endpoint for an option MCP server")
     SERVICE_PORT: int = Field(os.getenv("SERVICE_URL", 8000), description="Port on which the service will run.")
 
@@ -121,4 +206,18 @@ class Settings(BaseSettings):
                 raise ValueError("EXTRA_HEADERS must be a valid JSON string")
         return self
 
+    @model_validator(mode="after")
+    def validate_stage_model_overrides(self) -> "Settings":
+        if os.getenv("STAGE_MODEL_OVERRIDES"):
+            try:
+                self.STAGE_MODEL_OVERRIDES = json.loads(os.getenv("STAGE_MODEL_OVERRIDES"))
+            except json.JSONDecodeError:
+                raise ValueError("STAGE_MODEL_OVERRIDES must be a valid JSON string")
+        for stage, overrides in self.STAGE_MODEL_OVERRIDES.items():
+            if stage not in LLM_STAGES:
+                raise ValueError(f"Unknown stage {stage} in STAGE_MODEL_OVERRIDES, expected one of {sorted(LLM_STAGES)}")
+            if not isinstance(overrides, dict):
+                raise ValueError(f"STAGE_MODEL_OVERRIDES for {stage} must be a JSON object")
+        return self
+
 settings = Settings()  # type: ignore[call-arg]
\ No newline at end of file
@@ -6,3 +6,7 @@ class Event(ABC):
     async def emit_event(self, message: str, final: bool = False) -> None:
         """Emit Event"""
         pass
+
+    async def emit_artifact_chunk(self, message: str) -> None:
+        """Emit partial output ahead of the final result. Ignored unless the event handler supports it."""
+        pass
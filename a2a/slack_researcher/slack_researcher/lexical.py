@@ -0,0 +1,63 @@
+import math
+import re
+from collections import Counter
+from difflib import SequenceMatcher
+
+############
+# Lexical scoring helpers (no LLM, no external dependencies)
+############
+
+STOPWORDS = {
+    "a", "about", "all", "an", "and", "any", "are", "as", "at", "be", "by", "for", "from", "i", "in", "is",
+    "it", "me", "my", "of", "on", "or", "our", "that", "the", "their", "this", "to", "what", "with",
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercases and splits text into word tokens, dropping stopwords and a trailing plural 's'."""
+    tokens = []
+    for token in TOKEN_PATTERN.findall((text or "").lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def similarity(a: str, b: str) -> float:
+    """Fuzzy similarity in [0, 1] between two short strings such as channel names."""
+    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+
+
+class BM25:
+    """Okapi BM25 over a fixed list of documents."""
+
+    def __init__(self, documents: list[str], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.documents = [Counter(tokenize(document)) for document in documents]
+        self.lengths = [sum(document.values()) for document in self.documents]
+        self.average_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0
+        document_frequency = Counter(token for document in self.documents for token in document)
+        total = len(self.documents)
+        self.idf = {
+            token: math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            for token, frequency in document_frequency.items()
+        }
+
+    def score(self, query: str, index: int) -> float:
+        document = self.documents[index]
+        length_norm = 1 - self.b + self.b * (self.lengths[index] / self.average_length if self.average_length else 0)
+        score = 0.0
+        for token in set(tokenize(query)):
+            frequency = document.get(token)
+            if not frequency:
+                continue
+            score += self.idf[token] * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+        return score
+
+    def scores(self, query: str) -> list[float]:
+        return [self.score(query, index) for index in range(len(self.documents))]
@@ -1,6 +1,9 @@
 from slack_researcher.config import Settings
 from slack_researcher.data_types import ChannelList, UserIntent, UserRequirement
 
+# Override keys that belong to the top level of an autogen llm_config rather than its config_list entry
+TOP_LEVEL_LLM_KEYS = {"temperature", "cache_seed", "timeout"}
+
 
 class LLMConfig:
     def __init__(self, config: Settings):
@@ -11,12 +14,17 @@ class LLMConfig:
             "api_key": config.LLM_API_KEY,
         }
 
-        self.openai_llm_config = self._create_llm_config(config, None)
-        self.channel_llm_config = self._create_llm_config(config, ChannelList)
-        self.intent_classifier_llm_config = self._create_llm_config(config, UserIntent)
-        self.user_requirement_llm_config = self._create_llm_config(config, UserRequirement)
+        self.openai_llm_config = self._create_llm_config(config, None, "slack_channel_assistant")
+        self.channel_llm_config = self._create_llm_config(config, ChannelList, "channel_filter")
+        self.intent_classifier_llm_config = self._create_llm_config(config, UserIntent, "intent_classifier")
+        self.user_requirement_llm_config = self._create_llm_config(config, UserRequirement, "requirement_identifier")
+        self.chunk_summarizer_llm_config = self._create_llm_config(config, None, "chunk_summarizer")
+        self.report_llm_config = self._create_llm_config(config, None, "report_generator")
 
-    def _create_llm_config(self, config, response_format):
+    def _create_llm_config(self, config, response_format, stage=None):
+        # STAGE_MODEL_OVERRIDES lets e.g. classification run on a small, fast model
+        overrides = dict(config.STAGE_MODEL_OVERRIDES.get(stage, {}))
+        top_level = {key: overrides.pop(key) for key in list(overrides) if key in TOP_LEVEL_LLM_KEYS}
         return {
             "config_list": [
                 {
@@ -31,7 +39,9 @@ class LLMConfig:
                         if config.EXTRA_HEADERS
                         else {}
                     ),
+                    **overrides,
                 }
             ],
             "temperature": config.MODEL_TEMPERATURE,
+            **top_level,
         }
@@ -1,13 +1,22 @@
 import asyncio
 import json
 import logging
+import math
 import sys
 from typing import Callable
 from autogen.mcp.mcp_client import Toolkit
+from mcp import ClientSession
+from pydantic import BaseModel
 from slack_researcher.agents import Agents
+from slack_researcher.channels import is_empty, parse_channel_catalog, resolve_channel_names, shortlist_channels, wants_all_channels
 from slack_researcher.config import settings, Settings
 from slack_researcher.data_types import ChannelInfo, ChannelList, UserIntent, UserRequirement
 from slack_researcher.event import Event
+from slack_researcher.parsing import parse_model
+from slack_researcher.pipeline import Pipeline, Stage
+from slack_researcher.ranking import select_messages
+from slack_researcher.summarize import estimate_tokens, format_channel_list, format_channel_output, pack_chunks
+from slack_researcher.tools import GET_CHANNEL_HISTORY_TOOL, GET_CHANNELS_TOOL, call_mcp_tool
 
 
 logger = logging.getLogger(__name__)
@@ -18,10 +27,16 @@ class SlackAgent:
         eventer: Event = None,
         assistant_tools: dict[str, Callable] = None,
         mcp_toolkit: Toolkit = None,
+        mcp_session: ClientSession = None,
+        agents: Agents = None,
         logger=None,):
 
-        self.agents = Agents(settings, assistant_tools, mcp_toolkit)
+        self.config = config
+        # Agent sets are expensive to build, so callers should pass one in from an AgentPool
+        self.agents = agents or Agents(config, assistant_tools, mcp_toolkit)
         self.eventer = eventer
+        # Steps that only call a tool with known arguments skip the LLM when a session is available
+        self.mcp_session = mcp_session if config.DIRECT_TOOL_CALLS else None
         self.logger = logger or logging.getLogger(__name__)
 
         # State
@@ -40,16 +55,28 @@ class SlackAgent:
             
     async def execute(self, user_query):
         self.user_query = self.extract_user_input(user_query)
-        await self.classify_intent()
-        await self.list_all_channels()
-        await self.identify_requirements()
-        await self.get_relevant_channels()
 
-        if self.user_intent.intent == "LIST_CHANNELS":
-            return await self.summarize_data(str(self.relevant_channels))
+        # Intent, requirements and the channel listing are independent of each other;
+        # only channel selection needs both the requirements and the listing.
+        pipeline = Pipeline([
+            Stage("classify_intent", self.classify_intent),
+            Stage("list_all_channels", self.list_all_channels),
+            Stage("identify_requirements", self.identify_requirements),
+            Stage("get_relevant_channels", self.get_relevant_channels,
+                  depends_on=("list_all_channels", "identify_requirements")),
+        ])
+        try:
+            await pipeline.run()
 
-        await self.query_channels()
-        return await self.summarize_data(str(self.channel_outputs))
+            if self.user_intent.intent == "LIST_CHANNELS":
+                return await pipeline.run_stage("summarize_data", lambda: self.summarize_data(
+                    format_channel_list(self.relevant_channels)))
+
+            await pipeline.run_stage("query_channels", self.query_channels)
+            return await pipeline.run_stage("summarize_data", lambda: self.summarize_data(
+                [format_channel_output(output) for output in self.channel_outputs]))
+        finally:
+            self.logger.info(f"⏱️ Timing breakdown:\n{pipeline.breakdown()}")
 
     def extract_user_input(self, body):
         content = body[-1]["content"]
@@ -66,30 +93,87 @@ class SlackAgent:
 
         return latest_content
     
+    async def _structured_chat(self, message: str, recipient, model: type[BaseModel]):
+        """
+        Asks a structured-output agent for a reply and parses it into `model`, tolerating code
+        fences, preambles and small JSON defects. Re-prompts only if nothing usable comes back.
+        """
+        prompt = message
+        for attempt in range(self.config.STRUCTURED_OUTPUT_RETRIES + 1):
+            response = await self.agents.user_proxy.a_initiate_chat(message=prompt, recipient=recipient, max_turns=1)
+            content = response.chat_history[-1]["content"]
+            parsed = parse_model(content, model)
+            if parsed is not None:
+                return parsed
+            self.logger.warning(f"Could not parse {model.__name__} from {recipient.name} (attempt {attempt + 1}): {content!r}")
+            prompt = (
+                f"{message}\n\nYour previous reply could not be parsed as a {model.__name__}. "
+                f"Reply with ONLY a JSON object matching this schema, without any other text:\n"
+                f"{json.dumps(model.model_json_schema())}"
+            )
+        raise ValueError(f"{recipient.name} did not return a valid {model.__name__}")
+
     async def classify_intent(self):
         prompt = f"Classify the intent of the user as either simply needing to list slack channel information or if their intent is querying the content of slack channels themselves. User query: {self.user_query}"
-        response = await self.agents.user_proxy.a_initiate_chat(message=prompt, recipient=self.agents.intent_classifier, max_turns=1)
-        self.user_intent = UserIntent(**json.loads(response.chat_history[-1]["content"]))
+        self.user_intent = await self._structured_chat(prompt, self.agents.intent_classifier, UserIntent)
         await self._send_event(f"🧐 Identified user intent: {self.user_intent.intent}")
 
     async def identify_requirements(self):
-        response = await self.agents.user_proxy.a_initiate_chat(message=self.user_query, recipient=self.agents.requirement_identifier, max_turns=1)
-        self.requirements = UserRequirement(**json.loads(response.chat_history[-1]["content"]))
+        self.requirements = await self._structured_chat(self.user_query, self.agents.requirement_identifier, UserRequirement)
         await self._send_event(f"📇 Identified channel requirements. Channel names: {self.requirements.specific_channel_names}, Channel types: {self.requirements.types_of_channels}")
 
+    async def _call_tool_directly(self, name: str, arguments: dict = None):
+        """Returns the tool output, or None if the caller should fall back to an LLM conversation."""
+        if self.mcp_session is None:
+            return None
+        try:
+            return await call_mcp_tool(self.mcp_session, name, arguments)
+        except Exception as e:
+            self.logger.warning(f"Direct call to {name} failed, falling back to the LLM: {e}")
+            return None
+
     async def list_all_channels(self):
         await self._send_event("🔎 Fetching all channels")
-        response = await self.agents.user_proxy.a_initiate_chat(message="Retrieve all slack channels that are found on my slack server. Use the slack tool to find it.",
-                                                        recipient=self.agents.slack_channel_assistant,
-                                                        max_turns=3)
+        channels = await self._call_tool_directly(GET_CHANNELS_TOOL)
+        if channels is not None:
+            self.all_channels += channels
+            return channels
+
+        user_proxy, slack_channel_assistant = self.agents.slack_tool_agents()
+        response = await user_proxy.a_initiate_chat(message="Retrieve all slack channels that are found on my slack server. Use the slack tool to find it.",
+                                                    recipient=slack_channel_assistant,
+                                                    max_turns=3)
         for item in response.chat_history:
             if item.get("tool_responses"):
                 for tool_response in item["tool_responses"]:
                     self.all_channels += tool_response.get("content")
         return response
     
+    def match_channels_locally(self, catalog: list[ChannelInfo]) -> ChannelList:
+        """Resolves the relevant channels without an LLM when the requirements allow it, else returns None."""
+        names = self.requirements.specific_channel_names
+        criteria = self.requirements.types_of_channels
+        if not is_empty(names) and is_empty(criteria):
+            resolved, unresolved = resolve_channel_names(names, catalog, self.config.CHANNEL_NAME_MATCH_THRESHOLD)
+            if resolved and not unresolved:
+                return ChannelList(channels=resolved, explanation=f"Matched the requested channel names: {names}")
+        elif is_empty(names) and wants_all_channels(criteria):
+            return ChannelList(channels=catalog, explanation="The user asked for all channels")
+        return None
+
     async def get_relevant_channels(self):
-        self._send_event("👀 Identifying relevant channels")
+        await self._send_event("👀 Identifying relevant channels")
+        channel_list = self.all_channels
+        catalog = parse_channel_catalog(self.all_channels)
+        if catalog:
+            self.relevant_channels = self.match_channels_locally(catalog)
+            if self.relevant_channels is not None:
+                return await self._report_relevant_channels()
+            # Only a shortlist reaches the LLM, so the prompt does not grow with the workspace
+            shortlist = shortlist_channels(catalog, self.requirements.specific_channel_names,
+                                           self.requirements.types_of_channels, self.config.CHANNEL_SHORTLIST_SIZE)
+            channel_list = json.dumps([channel.model_dump() for channel in shortlist])
+
         prompt = ""
         if self.requirements.specific_channel_names:
             prompt += f"User is looking for channels with specific names: {self.requirements.specific_channel_names}"
@@ -97,19 +181,27 @@ class SlackAgent:
                 prompt += f"\n User is also looking for channels of any name that meet the following criteria: {self.requirements.types_of_channels}"
         else:
             prompt += f"User is looking for channels of any name that meet the following criteria: {self.requirements.types_of_channels}"
-        prompt += f"\n The list of slack channels is as follows: {self.all_channels}"
+        prompt += f"\n The list of slack channels is as follows: {channel_list}"
 
-        response = await self.agents.user_proxy.a_initiate_chat(message=prompt, recipient=self.agents.channel_assistant_no_tools, max_turns=1)
-        self.relevant_channels = ChannelList(**json.loads(response.chat_history[-1]["content"]))
+        self.relevant_channels = await self._structured_chat(prompt, self.agents.channel_assistant_no_tools, ChannelList)
+        await self._report_relevant_channels()
 
+    async def _report_relevant_channels(self):
         channel_names = [channel.name for channel in self.relevant_channels.channels]
         await self._send_event(f"🎯 Relevant channels identified: {channel_names}. Reason: {self.relevant_channels.explanation}")
 
 
     async def query_channel(self, channel: ChannelInfo):
         await self._send_event(f"📖 Querying channel {channel.name}")
+        channel_data = await self._call_tool_directly(GET_CHANNEL_HISTORY_TOOL,
+                                                      {"channel_id": channel.id, "limit": self.config.CHANNEL_HISTORY_LIMIT})
+        if channel_data is not None:
+            return {"channel_name": channel.name, "channel_id": channel.id, "output": self.select_relevant_messages(channel, channel_data)}
+
         prompt = f"Retrieve the history from the slack channel with ID \"{channel.id}\" using the Slack tool available to you. The data retrieved will be used to answer the following user query/instruction: {self.user_query}"
-        response = await self.agents.user_proxy.a_initiate_chat(message=prompt, recipient=self.agents.slack_channel_assistant, max_turns=3)
+        # A dedicated agent pair per channel, so concurrent channel chats do not share history
+        user_proxy, slack_channel_assistant = self.agents.slack_tool_agents()
+        response = await user_proxy.a_initiate_chat(message=prompt, recipient=slack_channel_assistant, max_turns=3)
 
         # We're going to capture the raw channel data for analysis later
         channel_data = ""
@@ -120,15 +212,106 @@ class SlackAgent:
         # If no tool output exists, just take the agent's response
         if channel_data == "":
             channel_data = response.chat_history[-1]["content"]
-        data = {"channel_name": channel.name, "channel_id": channel.id, "output": channel_data}
+        data = {"channel_name": channel.name, "channel_id": channel.id, "output": self.select_relevant_messages(channel, channel_data)}
         return data
 
+    def select_relevant_messages(self, channel: ChannelInfo, channel_data: str) -> str:
+        """Narrows a channel history down to the messages most relevant to the query."""
+        query = self.user_query
+        if self.requirements and not is_empty(self.requirements.types_of_information_to_search):
+            query += f" {self.requirements.types_of_information_to_search}"
+        selection = select_messages(
+            channel_data,
+            query,
+            top_k=self.config.MESSAGES_PER_CHANNEL,
+            token_budget=self.config.MESSAGE_TOKEN_BUDGET,
+            recency_weight=self.config.MESSAGE_RECENCY_WEIGHT,
+            half_life_hours=self.config.MESSAGE_RECENCY_HALF_LIFE_HOURS,
+        )
+        if selection is None:
+            return channel_data
+        messages, kept, total = selection
+        self.logger.info(f"Kept {kept} of {total} messages from channel {channel.name}")
+        return f"{kept} most relevant of {total} messages retrieved:\n{messages}"
+
     async def query_channels(self):
-        for channel in self.relevant_channels.channels:
-            self.channel_outputs.append(await self.query_channel(channel))
-    
+        semaphore = asyncio.Semaphore(self.config.MAX_CONCURRENT_CHANNELS)
+
+        async def bounded_query(channel: ChannelInfo):
+            async with semaphore:
+                try:
+                    output = await asyncio.wait_for(self.query_channel(channel), timeout=self.config.CHANNEL_QUERY_TIMEOUT)
+                except asyncio.TimeoutError:
+                    output = {"error": f"Timed out after {self.config.CHANNEL_QUERY_TIMEOUT:g} seconds"}
+                except Exception as e:
+                    self.logger.exception(f"Failed to query channel {channel.name}")
+                    output = {"error": str(e)}
+                # the condensing LLM call counts towards MAX_CONCURRENT_CHANNELS as well
+                if "error" not in output and self.config.STREAM_CHANNEL_FINDINGS:
+                    await self.stream_channel_findings(output)
+            if "error" in output:
+                await self._send_event(f"⚠️ Could not query channel {channel.name}: {output['error']}")
+                return {"channel_name": channel.name, "channel_id": channel.id, **output}
+            return output
+
+        # Results are collected in channel order and stored once, rather than appended to from each task
+        outputs = await asyncio.gather(*(bounded_query(channel) for channel in self.relevant_channels.channels))
+        self.channel_outputs.extend(outputs)
+
+    async def stream_channel_findings(self, output: dict):
+        """
+        Condenses one channel's output and emits it as a partial result right away.
+        The condensed findings are kept on the output and reused by the final report.
+        """
+        try:
+            output["summary"] = await self.summarize_chunk(format_channel_output(output), 1, 1)
+        except Exception as e:
+            self.logger.warning(f"Failed to condense findings for channel {output['channel_name']}: {e}")
+            return
+        if self.eventer:
+            await self.eventer.emit_artifact_chunk(f"### #{output['channel_name']}\n{output['summary']}\n\n")
+
     async def summarize_data(self, data_to_summarize):
+        """Writes the final report. Accepts a string or a list of sections (e.g. one per channel)."""
         await self._send_event(f"📄 Generating a final report")
-        prompt = f"User query: {self.user_query}. \n Information gathered: {data_to_summarize}"
+        sections = data_to_summarize if isinstance(data_to_summarize, list) else [data_to_summarize]
+        data = "\n\n".join(sections)
+        if estimate_tokens(data) > self.config.SUMMARY_TOKEN_BUDGET:
+            data = await self.map_summaries(sections)
+        prompt = f"User query: {self.user_query}. \n Information gathered: {data}"
         response = await self.agents.user_proxy.a_initiate_chat(message=prompt, recipient=self.agents.report_generator, max_turns=1)
         return response.chat_history[-1]["content"]
+
+    async def map_summaries(self, sections: list[str], max_rounds: int = 3) -> str:
+        """Condenses sections chunk by chunk, concurrently, until they fit the summary token budget."""
+        for _ in range(max_rounds):
+            total_tokens = sum(estimate_tokens(section) for section in sections)
+            # Grow the chunks when needed so a round never exceeds SUMMARY_MAX_MAP_CALLS calls
+            chunk_tokens = max(self.config.SUMMARY_CHUNK_TOKENS, math.ceil(total_tokens / self.config.SUMMARY_MAX_MAP_CALLS))
+            chunks = pack_chunks(sections, chunk_tokens)
+            while len(chunks) > self.config.SUMMARY_MAX_MAP_CALLS:
+                chunk_tokens = math.ceil(chunk_tokens * 1.25)
+                chunks = pack_chunks(sections, chunk_tokens)
+
+            await self._send_event(f"🗜️ Condensing ~{total_tokens} tokens of channel data in {len(chunks)} parts")
+            results = await asyncio.gather(
+                *(self.summarize_chunk(chunk, number, len(chunks)) for number, chunk in enumerate(chunks, 1)),
+                return_exceptions=True,
+            )
+            sections = []
+            for number, result in enumerate(results, 1):
+                if isinstance(result, BaseException):
+                    self.logger.warning(f"Failed to summarize part {number} of {len(chunks)}: {result}")
+                    sections.append(f"Part {number} of the gathered data could not be summarized: {result}")
+                else:
+                    sections.append(result)
+            data = "\n\n".join(sections)
+            if estimate_tokens(data) <= self.config.SUMMARY_TOKEN_BUDGET or len(sections) == 1:
+                return data
+        return data
+
+    async def summarize_chunk(self, chunk: str, number: int, total: int) -> str:
+        user_proxy, chunk_summarizer = self.agents.chunk_summarizer_agents()
+        prompt = f"User query: {self.user_query}. \n Slack data (part {number} of {total}): {chunk}"
+        response = await user_proxy.a_initiate_chat(message=prompt, recipient=chunk_summarizer, max_turns=1)
+        return response.chat_history[-1]["content"]
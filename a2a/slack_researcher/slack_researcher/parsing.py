@@ -0,0 +1,127 @@
+import ast
+import json
+import re
+from typing import Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+############
+# Tolerant parsing of structured LLM output
+############
+
+Model = TypeVar("Model", bound=BaseModel)
+
+CODE_FENCE = re.compile(r"```(?:json|JSON)?\s*(.*?)```", re.DOTALL)
+TRAILING_COMMA = re.compile(r",\s*([}\]])")
+SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+PYTHON_LITERALS = [(re.compile(r"\bNone\b"), "null"), (re.compile(r"\bTrue\b"), "true"), (re.compile(r"\bFalse\b"), "false")]
+# Repairs only close a few unbalanced brackets; anything worse is re-prompted
+MAX_MISSING_CLOSERS = 3
+
+
+def _validate(obj, model: type[Model]) -> Optional[Model]:
+    if not isinstance(obj, dict):
+        return None
+    try:
+        return model.model_validate(obj)
+    except ValidationError:
+        return None
+
+
+def _json_objects(text: str):
+    """Yields every JSON object that decodes cleanly from some '{' in the text, outermost first."""
+    decoder = json.JSONDecoder()
+    index = text.find("{")
+    while index != -1:
+        try:
+            obj, _ = decoder.raw_decode(text, index)
+            yield obj
+        except json.JSONDecodeError:
+            pass
+        index = text.find("{", index + 1)
+
+
+def _close_brackets(text: str) -> Optional[str]:
+    """Appends the closers missing at the end of a truncated object, ignoring brackets inside strings."""
+    stack = []
+    in_string = escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            if not stack or stack.pop() != char:
+                return None
+    if len(stack) > MAX_MISSING_CLOSERS:
+        return None
+    return text + ('"' if in_string else "") + "".join(reversed(stack))
+
+
+def _repair(text: str) -> list[str]:
+    """Bounded repairs of the text from the first '{' up to the last '}', or to the end if truncated."""
+    start = text.find("{")
+    if start == -1:
+        return []
+    end = text.rfind("}")
+    # a truncated reply is best repaired as a whole, so the full remainder goes first
+    spans = [text[start:].rstrip()]
+    if end > start and text[start:end + 1] != spans[0]:
+        spans.append(text[start:end + 1])
+
+    candidates = []
+    for span in spans:
+        span = TRAILING_COMMA.sub(r"\1", span.translate(SMART_QUOTES))
+        candidates.append(span)
+        closed = _close_brackets(span)
+        if closed and closed != span:
+            candidates.append(closed)
+        pythonic = span
+        for pattern, replacement in PYTHON_LITERALS:
+            pythonic = pattern.sub(replacement, pythonic)
+        if pythonic != span:
+            candidates.append(pythonic)
+    return candidates
+
+
+def parse_model(text: str, model: type[Model]) -> Optional[Model]:
+    """
+    Extracts the first JSON object in an LLM reply that validates against `model`.
+
+    Handles code fences, preambles and trailing text, and as a last step tries a few
+    bounded repairs (trailing commas, smart quotes, Python literals, single quotes and
+    missing closing brackets). Returns None if nothing validates.
+    """
+    text = (text or "").strip()
+    try:
+        return model.model_validate_json(text)
+    except ValidationError:
+        pass
+
+    sources = [match.group(1) for match in CODE_FENCE.finditer(text)] + [text]
+    for source in sources:
+        for obj in _json_objects(source):
+            parsed = _validate(obj, model)
+            if parsed is not None:
+                return parsed
+
+    for source in sources:
+        for candidate in _repair(source):
+            try:
+                obj = json.loads(candidate)
+            except json.JSONDecodeError:
+                try:
+                    obj = ast.literal_eval(candidate)
+                except (ValueError, SyntaxError, MemoryError, RecursionError):
+                    continue
+            parsed = _validate(obj, model)
+            if parsed is not None:
+                return parsed
+    return None
@@ -0,0 +1,100 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+############
+# Dependency-ordered execution of pipeline stages
+############
+
+@dataclass
+class Stage:
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+
+
+class Pipeline:
+    """
+    Runs async stages concurrently, starting each one as soon as the stages it
+    depends on have finished, and records when every stage started and ended.
+
+    Stages that must run after the graph (e.g. because they branch on its results)
+    can be timed with `run_stage` so they show up in the same breakdown.
+    """
+
+    def __init__(self, stages: list[Stage]):
+        self.stages = {stage.name: stage for stage in stages}
+        self._check_graph()
+        self.timings: dict[str, tuple[float, float]] = {}
+        self._start: float = None
+
+    def _check_graph(self) -> None:
+        for stage in self.stages.values():
+            for dependency in stage.depends_on:
+                if dependency not in self.stages:
+                    raise ValueError(f"Stage {stage.name} depends on unknown stage {dependency}")
+
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle detected at stage {name}")
+            visiting.add(name)
+            for dependency in self.stages[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def _elapsed(self) -> float:
+        return time.monotonic() - self._start
+
+    async def run_stage(self, name: str, run: Callable[[], Awaitable[Any]]) -> Any:
+        if self._start is None:
+            self._start = time.monotonic()
+        start = self._elapsed()
+        try:
+            return await run()
+        finally:
+            self.timings[name] = (start, self._elapsed())
+
+    async def run(self) -> dict[str, Any]:
+        """Runs the stage graph and returns each stage's result by name."""
+        if self._start is None:
+            self._start = time.monotonic()
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run_when_ready(stage: Stage) -> Any:
+            if stage.depends_on:
+                await asyncio.gather(*(tasks[dependency] for dependency in stage.depends_on))
+            return await self.run_stage(stage.name, stage.run)
+
+        # tasks only start running at the next await, so every task exists before any dependency lookup
+        for stage in self.stages.values():
+            tasks[stage.name] = asyncio.create_task(run_when_ready(stage), name=stage.name)
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        return {name: task.result() for name, task in tasks.items()}
+
+    def breakdown(self) -> str:
+        """A per-stage timing report, comparing wall-clock time with the sequential total."""
+        if not self.timings:
+            return "No stages have run"
+        lines = [
+            f"{name}: started at {start:.2f}s, took {end - start:.2f}s"
+            for name, (start, end) in sorted(self.timings.items(), key=lambda item: item[1][0])
+        ]
+        wall_clock = max(end for _, end in self.timings.values())
+        sequential = sum(end - start for start, end in self.timings.values())
+        lines.append(f"Total: {wall_clock:.2f}s wall clock vs {sequential:.2f}s if run sequentially")
+        return "\n".join(lines)
@@ -140,4 +140,10 @@ SUMMARIZER_PROMPT = """
 You are a helpful assistant who will produce a detailed report to directly address the user's query. You will use ONLY the following data that has been gathered from slack.
 Where possible, identify names of channels and names of users, not just their IDs.
 If you are unable to answer or only able to partially answer due to missing information or a specific error, please give detail to this.
-"""
\ No newline at end of file
+"""
+CHUNK_SUMMARIZER_PROMPT = """
+You are a helpful assistant condensing one part of the data gathered from slack, so that a later step can write a report from all parts.
+Keep ONLY the information that is relevant to the user's query. Be concise, but do not drop facts that could answer the query.
+Always keep channel names, user names or IDs, dates and links for the facts you keep.
+If nothing in this part is relevant to the query, reply with "No relevant information" and the channel names covered.
+"""
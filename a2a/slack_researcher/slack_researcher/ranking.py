@@ -0,0 +1,91 @@
+import json
+from datetime import datetime, timezone
+from typing import Optional
+
+from slack_researcher.channels import parse_json_objects
+from slack_researcher.lexical import BM25
+from slack_researcher.summarize import estimate_tokens
+
+############
+# Query-relevant selection of channel messages before summarization
+############
+
+
+def parse_messages(channel_data: str) -> list[dict]:
+    """Returns the slack messages in get_channel_history output, or an empty list if there are none."""
+    return [obj for obj in parse_json_objects(channel_data or "") if isinstance(obj, dict) and obj.get("text")]
+
+
+def _timestamp(message: dict) -> float:
+    try:
+        return float(message.get("ts", 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def compact_message(message: dict) -> dict:
+    """Keeps only the fields the report needs, with the slack timestamp rendered as a UTC time."""
+    row = {"user": message.get("user") or message.get("username") or message.get("bot_id")}
+    timestamp = _timestamp(message)
+    if timestamp:
+        row["time"] = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    row["text"] = message["text"]
+    if message.get("reply_count"):
+        row["replies"] = message["reply_count"]
+    return row
+
+
+def rank_messages(
+    messages: list[dict], query: str, recency_weight: float = 0.3, half_life_hours: float = 72
+) -> list[tuple[float, dict]]:
+    """
+    Scores messages by BM25 relevance to the query (normalized to [0, 1] within the channel)
+    plus an exponentially decaying recency bonus relative to the newest message.
+    With no matching terms the ranking degrades to most-recent-first.
+    """
+    bm25 = BM25([message["text"] for message in messages])
+    relevance = bm25.scores(query)
+    best = max(relevance, default=0) or 1
+    newest = max((_timestamp(message) for message in messages), default=0)
+    half_life = half_life_hours * 3600
+    ranked = []
+    for score, message in zip(relevance, messages):
+        age = max(newest - _timestamp(message), 0)
+        recency = 0.5 ** (age / half_life) if half_life > 0 else 0
+        ranked.append(((1 - recency_weight) * score / best + recency_weight * recency, message))
+    ranked.sort(key=lambda item: item[0], reverse=True)
+    return ranked
+
+
+def select_messages(
+    channel_data: str,
+    query: str,
+    top_k: int = 15,
+    token_budget: int = 1500,
+    recency_weight: float = 0.3,
+    half_life_hours: float = 72,
+) -> Optional[tuple[str, int, int]]:
+    """
+    Keeps the top-K messages most relevant to the query that fit in the token budget, in
+    chronological order. Returns (selected messages, kept, total), or None if the channel
+    data does not contain messages.
+    """
+    messages = parse_messages(channel_data)
+    if not messages:
+        return None
+
+    selected = []
+    remaining = token_budget
+    for _, message in rank_messages(messages, query, recency_weight, half_life_hours):
+        if len(selected) == top_k:
+            break
+        row = compact_message(message)
+        cost = estimate_tokens(json.dumps(row))
+        if cost > remaining:
+            continue
+        selected.append((_timestamp(message), row))
+        remaining -= cost
+
+    selected.sort(key=lambda item: item[0])
+    lines = "\n".join(json.dumps(row) for _, row in selected)
+    return lines, len(selected), len(messages)
@@ -0,0 +1,88 @@
+import json
+
+from slack_researcher.data_types import ChannelList
+
+############
+# Token-aware chunking of gathered slack data for map-reduce summarization
+############
+
+# Rough token estimate used for budgeting; good enough for English text and JSON
+CHARS_PER_TOKEN = 4
+# Preferred split points inside a single long section, best first
+BREAK_POINTS = ("\n", "}, ", ". ", " ")
+# Largest share of a chunk the header repeated on each part of a split section may take
+HEADER_SHARE = 0.25
+# Tokens reserved for the "(part i of n)" label of a split section
+PART_LABEL_TOKENS = 10
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def format_channel_output(output: dict) -> str:
+    """Renders one query_channel result as a labelled text section."""
+    header = f"Channel {output.get('channel_name')} ({output.get('channel_id')})"
+    if output.get("error"):
+        return f"{header}: could not be queried: {output['error']}"
+    if output.get("summary"):
+        return f"{header}, condensed findings:\n{output['summary']}"
+    data = output.get("output")
+    if not isinstance(data, str):
+        data = json.dumps(data)
+    return f"{header}:\n{data}"
+
+
+def format_channel_list(channel_list: ChannelList) -> list[str]:
+    """Renders a channel listing as one section per channel, so a long listing can be chunked between channels."""
+    sections = [f"Reason for this selection: {channel_list.explanation}"] if channel_list.explanation else []
+    sections += [f"Channel {channel.name} ({channel.id}): {channel.description}" for channel in channel_list.channels]
+    return sections
+
+
+def split_text(text: str, max_tokens: int) -> list[str]:
+    """Splits text into pieces of at most `max_tokens`, breaking at a line, object, sentence or word boundary."""
+    max_chars = max(1, max_tokens * CHARS_PER_TOKEN)
+    pieces = []
+    while len(text) > max_chars:
+        cut = max_chars
+        for separator in BREAK_POINTS:
+            index = text.rfind(separator, max_chars // 2, max_chars)
+            if index != -1:
+                cut = index + len(separator)
+                break
+        # every piece takes at least one character, so the loop always ends
+        cut = max(1, cut)
+        pieces.append(text[:cut])
+        text = text[cut:]
+    if text:
+        pieces.append(text)
+    return pieces
+
+
+def pack_chunks(sections: list[str], chunk_tokens: int) -> list[str]:
+    """
+    Greedily packs sections into chunks of at most `chunk_tokens`. Small sections (e.g. quiet
+    channels) share a chunk; a section larger than a chunk is split into labelled parts.
+    """
+    chunks: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+    for section in sections:
+        tokens = estimate_tokens(section)
+        if tokens > chunk_tokens:
+            # the first line may itself be huge, e.g. a listing on one line
+            header = section.split("\n", 1)[0].rstrip(":")[:int(chunk_tokens * HEADER_SHARE) * CHARS_PER_TOKEN]
+            parts = split_text(section, max(1, chunk_tokens - estimate_tokens(header) - PART_LABEL_TOKENS))
+            for number, part in enumerate(parts, 1):
+                body = part if number == 1 else f"{header} (part {number} of {len(parts)}):\n{part}"
+                chunks.append(body)
+            continue
+        if current and current_tokens + tokens > chunk_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(section)
+        current_tokens += tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
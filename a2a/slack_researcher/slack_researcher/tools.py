@@ -0,0 +1,26 @@
+from typing import Any
+
+from mcp import ClientSession
+
+############
+# Direct MCP tool invocation for steps whose arguments are already known
+############
+
+GET_CHANNELS_TOOL = "get_channels"
+GET_CHANNEL_HISTORY_TOOL = "get_channel_history"
+
+
+async def call_mcp_tool(session: ClientSession, name: str, arguments: dict[str, Any] = None) -> str:
+    """
+    Calls an MCP tool without going through an LLM and returns its text output.
+
+    FastMCP returns a list result as one text item per element, so multiple items
+    are joined back into a JSON array.
+    """
+    result = await session.call_tool(name, arguments or {})
+    texts = [content.text for content in result.content if getattr(content, "type", None) == "text"]
+    if result.isError:
+        raise RuntimeError(f"MCP tool {name} failed: {' '.join(texts)}")
+    if len(texts) == 1:
+        return texts[0]
+    return "[" + ", ".join(texts) + "]"
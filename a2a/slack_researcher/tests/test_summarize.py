@@ -0,0 +1,52 @@
+from slack_researcher.data_types import ChannelInfo, ChannelList
+from slack_researcher.summarize import estimate_tokens, format_channel_list, pack_chunks, split_text
+
+
+def channel_list(count: int) -> ChannelList:
+    return ChannelList(
+        channels=[ChannelInfo(name=f"team-channel-{number}", id=f"C{number:08d}",
+                              description=f"Discussions of team {number} about releases, incidents and planning")
+                  for number in range(count)],
+        explanation="All channels were requested",
+    )
+
+
+def test_split_text_respects_the_budget():
+    text = "word " * 1000
+    pieces = split_text(text, 50)
+    assert "".join(pieces) == text
+    assert all(estimate_tokens(piece) <= 51 for piece in pieces)
+
+
+def test_split_text_always_advances():
+    assert split_text("abc", 0) == ["a", "b", "c"]
+    assert split_text("abc", -5) == ["a", "b", "c"]
+
+
+def test_pack_chunks_splits_a_single_oversized_line():
+    # a whole channel listing rendered on one line, far larger than a chunk
+    section = str(channel_list(300))
+    assert "\n" not in section and estimate_tokens(section) > 5000
+
+    chunks = pack_chunks([section], 500)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 500 for chunk in chunks)
+    assert "part 2 of" in chunks[1]
+
+
+def test_pack_chunks_with_a_chunk_smaller_than_the_label():
+    chunks = pack_chunks(["x" * 200], 5)
+    assert all(estimate_tokens(chunk) <= 15 for chunk in chunks)
+
+
+def test_channel_list_is_chunked_between_channels():
+    sections = format_channel_list(channel_list(300))
+    assert len(sections) == 301
+    assert sections[0] == "Reason for this selection: All channels were requested"
+
+    chunks = pack_chunks(sections, 500)
+
+    assert all(estimate_tokens(chunk) <= 500 for chunk in chunks)
+    assert sum(chunk.count("Channel team-channel-") for chunk in chunks) == 300
+    assert not any("(part " in chunk for chunk in chunks)
@@ -0,0 +1,110 @@
+"""
+Benchmark for the weather graph's assistant node: synchronous invoke vs async ainvoke with token streaming.
+
+Runs N concurrent weather questions through each graph against the stub OpenAI server
+(benchmarks/stub_openai.py) with a local get_weather tool, and reports wall time,
+throughput and time to first answer text. For the sync baseline, the first answer text
+is the final graph update; for the async node it is the first streamed token.
+
+Usage (from a2a/weather_service):
+
+    uv run python -m benchmarks.assistant_node --concurrency 1 8 32
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, SystemMessage
+from langchain_core.tools import tool
+from langchain_openai import ChatOpenAI
+from langgraph.graph import START, StateGraph
+from langgraph.prebuilt import ToolNode, tools_condition
+
+from benchmarks.stub_openai import StubOpenAI, start_stub_server
+from weather_service.graph import ExtendedMessagesState, build_graph
+
+
+@tool
+async def get_weather(city: str) -> str:
+    """Get the current weather for a city."""
+    await asyncio.sleep(0.05)
+    return json.dumps({"temperature": 21.5, "windspeed": 8.3})
+
+
+def build_sync_graph(llm: ChatOpenAI, tools) -> StateGraph:
+    """The previous assistant node, calling the LLM synchronously, as the baseline."""
+    llm_with_tools = llm.bind_tools(tools)
+    sys_msg = SystemMessage(content="You are a helpful assistant tasked with providing weather information.")
+
+    def assistant(state: ExtendedMessagesState) -> ExtendedMessagesState:
+        result = llm_with_tools.invoke([sys_msg] + state["messages"])
+        state["messages"].append(result)
+        if isinstance(result, AIMessage) and not result.tool_calls:
+            state["final_answer"] = result.content
+        return state
+
+    builder = StateGraph(ExtendedMessagesState)
+    builder.add_node("assistant", assistant)
+    builder.add_node("tools", ToolNode(tools))
+    builder.add_edge(START, "assistant")
+    builder.add_conditional_edges("assistant", tools_condition)
+    builder.add_edge("tools", "assistant")
+    return builder.compile()
+
+
+async def run_request(graph, streaming: bool) -> tuple[float, float]:
+    """Returns (time to first answer text, total time) for one question."""
+    start = time.monotonic()
+    first_text = None
+    stream_mode = ["updates", "messages"] if streaming else ["updates"]
+    input = {"messages": [HumanMessage(content="What is the weather in Rome?")]}
+    async for mode, event in graph.astream(input, stream_mode=stream_mode):
+        if first_text is not None:
+            continue
+        if mode == "messages":
+            message, _ = event
+            if isinstance(message, AIMessageChunk) and message.content:
+                first_text = time.monotonic() - start
+        elif event.get("assistant", {}).get("final_answer"):
+            first_text = time.monotonic() - start
+    return first_text, time.monotonic() - start
+
+
+async def run_batch(graph, concurrency: int, streaming: bool) -> dict:
+    start = time.monotonic()
+    results = await asyncio.gather(*(run_request(graph, streaming) for _ in range(concurrency)))
+    wall = time.monotonic() - start
+    return {
+        "wall": wall,
+        "throughput": concurrency / wall,
+        "ttft": statistics.median(first for first, _ in results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--port", type=int, default=18095)
+    parser.add_argument("--first-token-latency", type=float, default=0.5)
+    parser.add_argument("--token-latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    start_stub_server(StubOpenAI(args.first_token_latency, args.token_latency), args.port)
+    llm = ChatOpenAI(model="stub", openai_api_key="stub", openai_api_base=f"http://127.0.0.1:{args.port}/v1", temperature=0)
+    graphs = {
+        "sync invoke": (build_sync_graph(llm, [get_weather]), False),
+        "async + tokens": (build_graph(llm, [get_weather]), True),
+    }
+
+    print(f"{'node':<16} {'concurrency':>11} {'wall s':>8} {'req/s':>8} {'p50 first text s':>17}")
+    for concurrency in args.concurrency:
+        for name, (graph, streaming) in graphs.items():
+            result = asyncio.run(run_batch(graph, concurrency, streaming))
+            print(f"{name:<16} {concurrency:>11} {result['wall']:>8.2f} {result['throughput']:>8.2f} {result['ttft']:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark for bounded conversation history in multi-turn mode.
+
+Holds one long conversation (a weather question per turn, each answered with a tool
+call) on a checkpointed graph against the stub OpenAI server (benchmarks/stub_openai.py),
+whose first-token latency grows with the prompt size. Compares an effectively unbounded
+history with the token-budgeted one, and reports the largest assistant prompt (the
+summarizer's own requests left out) and the latency of each turn. With the budget, both
+should level off below the budget instead of growing.
+
+Usage (from a2a/weather_service):
+
+    uv run python -m benchmarks.conversation_history --turns 30 --budget 1000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from langchain_core.messages import HumanMessage
+from langchain_core.tools import tool
+from langchain_openai import ChatOpenAI
+from langgraph.checkpoint.memory import MemorySaver
+
+from benchmarks.stub_openai import CITIES, StubOpenAI, start_stub_server
+from weather_service.graph import build_graph, config
+
+
+@tool
+async def get_weather(city: str) -> str:
+    """Get the current weather for a city."""
+    return json.dumps({"time": "2025-06-01T12:00", "interval": 900, "temperature": 70.7, "windspeed": 8.3,
+                       "winddirection": 240, "is_day": 1, "weathercode": 2})
+
+
+async def run_conversation(graph, stub: StubOpenAI, turns: int) -> list[tuple[int, float]]:
+    """Returns (largest assistant prompt in characters, latency) per turn."""
+    run_config = {"configurable": {"thread_id": "benchmark"}}
+    results = []
+    for turn in range(turns):
+        question = f"And what is the weather in {CITIES[turn % len(CITIES)]}?"
+        calls = len(stub.prompt_chars)
+        start = time.monotonic()
+        async for _ in graph.astream({"messages": [HumanMessage(content=question)]}, run_config, stream_mode="updates"):
+            pass
+        prompts = [chars for chars, tools in zip(stub.prompt_chars[calls:], stub.with_tools[calls:]) if tools]
+        results.append((max(prompts), time.monotonic() - start))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=30)
+    parser.add_argument("--budget", type=int, default=1000, help="HISTORY_TOKEN_BUDGET of the bounded run")
+    parser.add_argument("--recent-turns", type=int, default=3)
+    parser.add_argument("--port", type=int, default=18099)
+    parser.add_argument("--prompt-token-latency", type=float, default=0.001, help="Seconds of first-token latency per prompt token")
+    args = parser.parse_args()
+
+    stub = StubOpenAI(first_token_latency=0.1, token_latency=0, prompt_token_latency=args.prompt_token_latency)
+    start_stub_server(stub, args.port)
+    llm = ChatOpenAI(model="stub", openai_api_key="stub", openai_api_base=f"http://127.0.0.1:{args.port}/v1", temperature=0)
+
+    config.history_recent_turns = args.recent_turns
+    results = {}
+    for name, budget in (("unbounded", 10 ** 9), (f"budget {args.budget}", args.budget)):
+        # the history node reads its budget when the graph is built
+        config.history_token_budget = budget
+        graph = build_graph(llm, [get_weather], checkpointer=MemorySaver())
+        results[name] = asyncio.run(run_conversation(graph, stub, args.turns))
+
+    names = list(results)
+    print(f"{'turn':>5} " + " ".join(f"{name + ' chars':>20} {name + ' s':>16}" for name in names))
+    for turn in range(args.turns):
+        if turn < 5 or (turn + 1) % 5 == 0:
+            print(f"{turn + 1:>5} " + " ".join(f"{results[name][turn][0]:>20} {results[name][turn][1]:>16.2f}" for name in names))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark for the template fast path for single-city weather questions.
+
+Runs a mix of simple and complex questions against the stub OpenAI server
+(benchmarks/stub_openai.py) with a local get_weather tool. Questions the fast path
+recognises are answered with one direct tool call and a template; the rest, and any
+fast path miss, go through the full graph. Reports the fast path rate and the mean
+latency of each path, and the latency saved against sending everything through the graph.
+
+Usage (from a2a/weather_service):
+
+    uv run python -m benchmarks.fast_path --first-token-latency 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from langchain_core.messages import HumanMessage
+from langchain_core.tools import tool
+from langchain_openai import ChatOpenAI
+
+from benchmarks.stub_openai import StubOpenAI, start_stub_server
+from weather_service.fast_path import FastPathStats, match_simple_query, render_weather
+from weather_service.graph import build_graph
+
+QUESTIONS = [
+    "What is the weather in Rome?",
+    "weather in Paris?",
+    "What's the weather like in Berlin today?",
+    "Madrid weather",
+    "How is the weather in Vienna right now?",
+    "Compare the weather in Lisbon and Prague",
+    "Should I bring an umbrella in Dublin tomorrow?",
+    "Is it warmer in Oslo or in Athens?",
+    "weather: Warsaw",
+    "What should I wear in Zurich this weekend?",
+]
+
+
+@tool
+async def get_weather(city: str) -> str:
+    """Get the current weather for a city."""
+    await asyncio.sleep(0.05)
+    return json.dumps({"temperature": 70.7, "windspeed": 8.3, "weathercode": 2})
+
+
+async def run_graph(graph, question: str) -> float:
+    start = time.monotonic()
+    async for _ in graph.astream({"messages": [HumanMessage(content=question)]}, stream_mode="updates"):
+        pass
+    return time.monotonic() - start
+
+
+async def run_fast_path(graph, question: str, stats: FastPathStats) -> float:
+    """Mirrors WeatherExecutor: the template answer if possible, else the graph."""
+    start = time.monotonic()
+    city = match_simple_query(question)
+    if city is not None:
+        answer = render_weather(city, await get_weather.ainvoke({"city": city}))
+        if answer is not None:
+            elapsed = time.monotonic() - start
+            stats.record("fast_path", elapsed)
+            return elapsed
+        stats.record("fallback")
+    elapsed = time.monotonic() - start + await run_graph(graph, question)
+    stats.record("graph", elapsed)
+    return elapsed
+
+
+async def run(graph, rounds: int) -> tuple[list[float], list[float], FastPathStats]:
+    stats = FastPathStats()
+    baseline, fast = [], []
+    for _ in range(rounds):
+        for question in QUESTIONS:
+            baseline.append(await run_graph(graph, question))
+            fast.append(await run_fast_path(graph, question, stats))
+    return baseline, fast, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--port", type=int, default=18096)
+    parser.add_argument("--first-token-latency", type=float, default=0.5)
+    parser.add_argument("--token-latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    start_stub_server(StubOpenAI(args.first_token_latency, args.token_latency), args.port)
+    llm = ChatOpenAI(model="stub", openai_api_key="stub", openai_api_base=f"http://127.0.0.1:{args.port}/v1", temperature=0)
+    baseline, fast, stats = asyncio.run(run(build_graph(llm, [get_weather]), args.rounds))
+
+    print(f"{'mode':<22} {'mean s':>8} {'p50 s':>8} {'total s':>8}")
+    for name, latencies in (("graph only", baseline), ("fast path + fallback", fast)):
+        print(f"{name:<22} {statistics.mean(latencies):>8.2f} {statistics.median(latencies):>8.2f} {sum(latencies):>8.2f}")
+    print(stats.summary())
+    print(f"Saved against graph only: {sum(baseline) - sum(fast):.1f}s over {len(fast)} requests")
+
+
+if __name__ == "__main__":
+    main()
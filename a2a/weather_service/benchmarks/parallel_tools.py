@@ -0,0 +1,94 @@
+"""
+Benchmark for concurrent tool calls in the weather graph.
+
+Asks for the weather in 1..N cities. The stub OpenAI server (benchmarks/stub_openai.py)
+answers with one get_weather call per city in a single turn. A stub MCP server with
+injected latency serves get_weather over streamable HTTP, and the real MCP adapter
+tools are used. Compares the graph's tools node limited to one call at a time (what
+a sequential tools step costs) with the configured concurrency. The parallel wall
+time should stay flat as the number of cities grows, up to the concurrency limit.
+
+Usage (from a2a/weather_service):
+
+    uv run python -m benchmarks.parallel_tools --tool-latency 1.0 --cities 1 2 4 8 16
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+
+import uvicorn
+from langchain_core.messages import HumanMessage
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_openai import ChatOpenAI
+from mcp.server.fastmcp import FastMCP
+
+from benchmarks.stub_openai import CITIES, StubOpenAI, start_stub_server
+from weather_service.graph import build_graph
+
+
+def start_stub_mcp_server(latency: float, port: int) -> uvicorn.Server:
+    mcp = FastMCP("Weather")
+
+    @mcp.tool()
+    async def get_weather(city: str) -> str:
+        """Get weather info for a city"""
+        await asyncio.sleep(latency)
+        return json.dumps({"temperature": 70.7, "windspeed": 8.3, "weathercode": 2})
+
+    server = uvicorn.Server(uvicorn.Config(mcp.streamable_http_app(), host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def run_question(graph, cities: int) -> float:
+    question = f"What is the weather in {', '.join(CITIES[:cities])}?"
+    start = time.monotonic()
+    async for _ in graph.astream({"messages": [HumanMessage(content=question)]}, stream_mode="updates"):
+        pass
+    return time.monotonic() - start
+
+
+async def run(args) -> None:
+    client = MultiServerMCPClient({
+        "weather": {"url": f"http://127.0.0.1:{args.mcp_port}/mcp", "transport": "streamable_http"},
+    })
+    tools = await client.get_tools()
+    llm = ChatOpenAI(model="stub", openai_api_key="stub", openai_api_base=f"http://127.0.0.1:{args.llm_port}/v1", temperature=0)
+    graphs = {
+        "sequential": build_graph(llm, tools, max_parallel_tools=1),
+        f"parallel ({args.max_parallel})": build_graph(llm, tools, max_parallel_tools=args.max_parallel),
+    }
+
+    print(f"{'tools node':<16} {'cities':>6} {'p50 wall s':>11} {'max wall s':>11}")
+    for cities in args.cities:
+        for name, graph in graphs.items():
+            timings = [await run_question(graph, cities) for _ in range(args.runs)]
+            print(f"{name:<16} {cities:>6} {statistics.median(timings):>11.2f} {max(timings):>11.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cities", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-parallel", type=int, default=16)
+    parser.add_argument("--tool-latency", type=float, default=1.0, help="Seconds per get_weather call")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Seconds before the stub LLM's first token")
+    parser.add_argument("--llm-port", type=int, default=18097)
+    parser.add_argument("--mcp-port", type=int, default=18098)
+    args = parser.parse_args()
+    if max(args.cities) > len(CITIES):
+        parser.error(f"at most {len(CITIES)} cities")
+
+    start_stub_server(StubOpenAI(args.llm_latency, token_latency=0), args.llm_port)
+    start_stub_mcp_server(args.tool_latency, args.mcp_port)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
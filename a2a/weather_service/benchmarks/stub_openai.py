@@ -0,0 +1,104 @@
+"""
+A stub OpenAI-compatible chat completions server for the weather_service benchmarks.
+
+The first call for a user message answers with one get_weather tool call per city
+mentioned in it; once tool results follow the message, it answers
+with a fixed sentence, streamed token by token if requested. Requests without tools
+(e.g. summaries) get the sentence as well. Latency is injected as a delay before the
+first token, optionally growing with the prompt size, plus a delay per token.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+
+CITIES = ["Rome", "Paris", "Berlin", "Madrid", "Vienna", "Lisbon", "Prague", "Dublin",
+          "Oslo", "Athens", "Warsaw", "Zurich", "Helsinki", "Brussels", "Budapest", "Amsterdam"]
+ANSWER = "It is currently 21.5°C with a light breeze of 8 km/h, a pleasant day to be outside."
+
+
+class StubOpenAI:
+    def __init__(self, first_token_latency: float = 0.5, token_latency: float = 0.02, prompt_token_latency: float = 0):
+        self.first_token_latency = first_token_latency
+        self.token_latency = token_latency
+        self.prompt_token_latency = prompt_token_latency
+        self.calls = 0
+        # characters of the prompt of each request, in order
+        self.prompt_chars: list[int] = []
+        # whether each request offered tools, i.e. came from the assistant rather than e.g. the summarizer
+        self.with_tools: list[bool] = []
+        self._lock = threading.Lock()
+
+    def _tool_calls(self, messages: list[dict], tools: list) -> list[dict]:
+        last_user = max((index for index, m in enumerate(messages) if m.get("role") == "user"), default=-1)
+        # a turn is over once tool results follow the user's latest question
+        if not tools or last_user == -1 or any(m.get("role") == "tool" for m in messages[last_user:]):
+            return []
+        question = messages[last_user].get("content") or ""
+        cities = [city for city in CITIES if city.lower() in str(question).lower()] or ["Rome"]
+        return [
+            {"id": f"call_{index}", "type": "function",
+             "function": {"name": "get_weather", "arguments": json.dumps({"city": city})}}
+            for index, city in enumerate(cities)
+        ]
+
+    async def chat_completions(self, request: Request):
+        body = await request.json()
+        prompt_chars = sum(len(str(message.get("content") or "")) for message in body.get("messages", []))
+        with self._lock:
+            self.calls += 1
+            self.prompt_chars.append(prompt_chars)
+            self.with_tools.append(bool(body.get("tools")))
+        first_token_latency = self.first_token_latency + self.prompt_token_latency * prompt_chars / 4
+        tool_calls = self._tool_calls(body.get("messages", []), body.get("tools"))
+        tokens = [] if tool_calls else [word + " " for word in ANSWER.split(" ")]
+        if body.get("stream"):
+            return StreamingResponse(self._stream(body, tool_calls, tokens, first_token_latency), media_type="text/event-stream")
+
+        await asyncio.sleep(first_token_latency + self.token_latency * len(tokens))
+        message = {"role": "assistant", "content": "".join(tokens) or None}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        return JSONResponse({
+            "id": "chatcmpl-stub", "object": "chat.completion", "created": int(time.time()), "model": body.get("model"),
+            "choices": [{"index": 0, "message": message, "finish_reason": "tool_calls" if tool_calls else "stop"}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": len(tokens), "total_tokens": len(tokens)},
+        })
+
+    async def _stream(self, body: dict, tool_calls: list[dict], tokens: list[str], first_token_latency: float):
+        def chunk(delta: dict, finish_reason: str = None) -> str:
+            return "data: " + json.dumps({
+                "id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": body.get("model"),
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }) + "\n\n"
+
+        await asyncio.sleep(first_token_latency)
+        if tool_calls:
+            yield chunk({"role": "assistant", "tool_calls": [
+                {"index": index, **call} for index, call in enumerate(tool_calls)
+            ]})
+            yield chunk({}, "tool_calls")
+        else:
+            yield chunk({"role": "assistant", "content": ""})
+            for token in tokens:
+                yield chunk({"content": token})
+                await asyncio.sleep(self.token_latency)
+            yield chunk({}, "stop")
+        yield "data: [DONE]\n\n"
+
+
+def start_stub_server(stub: StubOpenAI, port: int) -> uvicorn.Server:
+    app = Starlette()
+    app.add_route("/v1/chat/completions", stub.chat_completions, methods=["POST"])
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
@@ -1,6 +1,8 @@
 import logging
 import os
+import time
 import uvicorn
+from contextlib import asynccontextmanager
 from textwrap import dedent
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
@@ -11,9 +13,11 @@ from a2a.server.tasks import InMemoryTaskStore, TaskUpdater
 from a2a.types import AgentCapabilities, AgentCard, AgentSkill, TaskState, TextPart
 from a2a.utils import new_agent_text_message, new_task
 from openinference.instrumentation.langchain import LangChainInstrumentor
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
 
-from weather_service.graph import get_graph, get_mcpclient
+from weather_service.events import EventCoalescer, format_update, truncate
+from weather_service.fast_path import WEATHER_TOOL, FastPathStats, match_simple_query, render_weather
+from weather_service.graph import GraphManager, config
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -90,6 +94,36 @@ class WeatherExecutor(AgentExecutor):
     """
     A class to handle weather assistant execution for A2A Agent.
     """
+    def __init__(self):
+        # The LLM client, MCP tools and compiled graph are built once and reused across requests
+        self.graph_manager = GraphManager()
+        self.fast_path_stats = FastPathStats()
+
+    async def answer_from_template(self, question: str, event_emitter: A2AEvent) -> str:
+        """
+        Answers a single-city weather question with one direct tool call and a template.
+
+        Returns None when the question isn't a simple one or the tool output can't be
+        rendered, in which case the full graph handles it.
+        """
+        city = match_simple_query(question)
+        tool = self.graph_manager.get_tool(WEATHER_TOOL)
+        if city is None or tool is None:
+            return None
+        try:
+            output = str(await tool.ainvoke({"city": city}))
+        except Exception as e:
+            logger.warning(f"Fast path tool call failed for {city}, falling back to the graph: {e}")
+            self.fast_path_stats.record("fallback")
+            return None
+        answer = render_weather(city, output)
+        if answer is None:
+            logger.info(f"Fast path could not render the weather for {city}, falling back to the graph")
+            self.fast_path_stats.record("fallback")
+            return None
+        await event_emitter.emit_event(f"🚶‍♂️{WEATHER_TOOL}: {truncate(output)}\n")
+        return answer
+
     async def execute(self, context: RequestContext, event_queue: EventQueue):
         """
         The agent allows to retrieve weather info through a natural language conversational interface
@@ -102,45 +136,68 @@ class WeatherExecutor(AgentExecutor):
             await event_queue.enqueue_event(task)
         task_updater = TaskUpdater(event_queue, task.id, task.context_id)
         event_emitter = A2AEvent(task_updater)
+        # rapid status updates and tokens are batched into fewer, size-bounded events
+        status = EventCoalescer(event_emitter.emit_event, config.status_event_window, config.max_event_chars)
 
         # Parse Messages
-        messages = [HumanMessage(content=context.get_user_input())]
+        question = context.get_user_input()
+        messages = [HumanMessage(content=question)]
         input = {"messages": messages}
+        # in multi-turn mode the checkpointed conversation is keyed by the A2A context
+        run_config = {"configurable": {"thread_id": task.context_id}} if config.multi_turn else None
         logger.info(f'Processing messages: {input}')
+        if run_config is not None:
+            await self.graph_manager.track_conversation(task.context_id)
 
         task_updater = TaskUpdater(event_queue, task.id, task.context_id)
 
         try:
             output = None
-            # Test MCP connection first
-            logger.info(f'Attempting to connect to MCP server at: {os.getenv("MCP_URL", "http://localhost:8000/sse")}')
-
-            mcpclient = get_mcpclient()
-
-            # Try to get tools to verify connection
+            # Connects to the MCP server on the first request, later requests reuse the graph
             try:
-                tools = await mcpclient.get_tools()
-                logger.info(f'Successfully connected to MCP server. Available tools: {[tool.name for tool in tools]}')
+                graph = await self.graph_manager.get_graph()
             except Exception as tool_error:
                 logger.error(f'Failed to connect to MCP server: {tool_error}')
                 await event_emitter.emit_event(f"Error: Cannot connect to MCP weather service at {os.getenv('MCP_URL', 'http://localhost:8000/sse')}. Please ensure the weather MCP server is running. Error: {tool_error}", failed=True)
                 return
 
-            graph = await get_graph(mcpclient)
-            async for event in graph.astream(input, stream_mode="updates"):
-                await event_emitter.emit_event(
-                    "\n".join(
-                        f"🚶‍♂️{key}: {str(value)[:100] + '...' if len(str(value)) > 100 else str(value)}"
-                        for key, value in event.items()
-                    )
-                    + "\n"
-                )
+            start = time.monotonic()
+            if config.fast_path:
+                answer = await self.answer_from_template(question, event_emitter)
+                if answer is not None:
+                    self.fast_path_stats.record("fast_path", time.monotonic() - start)
+                    logger.info(f"Answered from template: {self.fast_path_stats.summary()}")
+                    if run_config is not None:
+                        # so follow-up questions see this turn too
+                        await graph.aupdate_state(run_config, {"messages": messages + [AIMessage(content=answer)]}, as_node="assistant")
+                    await event_emitter.emit_event(answer, final=True)
+                    return
+
+            stream_mode = ["updates", "messages"] if config.stream_tokens else ["updates"]
+            async for mode, event in graph.astream(input, run_config, stream_mode=stream_mode):
+                if mode == "messages":
+                    # answer tokens from the assistant node, forwarded as they arrive
+                    message, metadata = event
+                    if (metadata.get("langgraph_node") == "assistant" and isinstance(message, AIMessageChunk)
+                            and isinstance(message.content, str) and message.content and not message.tool_call_chunks):
+                        await status.add(message.content)
+                    continue
+                text = format_update(event)
+                if text:
+                    await status.add(text, line=True)
                 output = event
                 logger.info(f'event: {event}')
             output =  output.get("assistant", {}).get("final_answer")
+            self.fast_path_stats.record("graph", time.monotonic() - start)
+            if config.fast_path:
+                logger.info(f"Answered through the graph: {self.fast_path_stats.summary()}")
+            await status.flush()
             await event_emitter.emit_event(str(output), final=True)
         except Exception as e:
             logger.error(f'Graph execution error: {e}')
+            # the MCP server may have been redeployed with different tools
+            self.graph_manager.refresh_soon()
+            await status.flush()
             await event_emitter.emit_event(f"Error: Failed to process weather request. {str(e)}", failed=True)
             raise Exception(str(e))
 
@@ -156,14 +213,20 @@ def run():
     """
     agent_card = get_agent_card(host="0.0.0.0", port=8000)
 
+    executor = WeatherExecutor()
     request_handler = DefaultRequestHandler(
-        agent_executor=WeatherExecutor(),
+        agent_executor=executor,
         task_store=InMemoryTaskStore(),
     )
 
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await executor.graph_manager.close()
+
     server = A2AStarletteApplication(
         agent_card=agent_card,
         http_handler=request_handler,
     )
 
-    uvicorn.run(server.build(), host="0.0.0.0", port=8000)
+    uvicorn.run(server.build(lifespan=lifespan), host="0.0.0.0", port=8000)
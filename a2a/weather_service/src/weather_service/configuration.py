@@ -4,3 +4,25 @@ class Configuration(BaseSettings):
     llm_model: str = "llama3.1"
     llm_api_base: str = "http://localhost:11434/v1"
     llm_api_key: str = "dummy"
+    # seconds between checks of the MCP server's tool list; 0 disables background refresh
+    tool_refresh_interval: float = 300
+    # forward the assistant's answer tokens as status events while they are generated
+    stream_tokens: bool = True
+    # answer single-city questions by calling the weather tool directly, without the LLM
+    fast_path: bool = True
+    # tool calls of one model turn run concurrently, at most this many at a time
+    max_parallel_tools: int = 8
+    # seconds before a single tool call is abandoned and reported to the model as an error; 0 waits forever
+    tool_timeout: float = 30
+    # status updates arriving within this many seconds of the last event are sent together; 0 sends each at once
+    status_event_window: float = 0.25
+    # upper bound on the text of one status event
+    max_event_chars: int = 2000
+    # keep the conversation of each A2A context across requests; off answers every message on its own
+    multi_turn: bool = False
+    # approximate tokens of each assistant prompt: system prompt, conversation summary and verbatim turns
+    history_token_budget: int = 2000
+    # most recent turns kept verbatim once older ones are summarized
+    history_recent_turns: int = 3
+    # conversations kept in memory; the least recently used one is dropped beyond this
+    max_conversations: int = 1000
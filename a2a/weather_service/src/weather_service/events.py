@@ -0,0 +1,111 @@
+import asyncio
+import reprlib
+import time
+from typing import Awaitable, Callable
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+# Characters shown per state key in a status event
+SUMMARY_CHARS = 100
+
+# Bounded repr for anything that isn't a message, so huge values are never stringified in full
+_repr = reprlib.Repr()
+_repr.maxstring = SUMMARY_CHARS
+_repr.maxother = SUMMARY_CHARS
+_repr.maxlist = _repr.maxtuple = _repr.maxdict = 4
+_repr.maxlevel = 3
+
+
+def truncate(text: str, limit: int = SUMMARY_CHARS) -> str:
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def summarize_message(message: BaseMessage, limit: int = SUMMARY_CHARS) -> str:
+    """One short line per message: the tool calls of an AI message, or the start of its content."""
+    if isinstance(message, AIMessage) and message.tool_calls:
+        return truncate(", ".join(f"{call['name']}({call['args']})" for call in message.tool_calls), limit)
+    content = message.content if isinstance(message.content, str) else str(message.content[:1])
+    if isinstance(message, ToolMessage):
+        return f"{message.name}: {truncate(content, limit)}"
+    return truncate(content, limit)
+
+
+def summarize(value, limit: int = SUMMARY_CHARS) -> str:
+    """A summary of a state value of at most about `limit` characters, computed without stringifying all of it."""
+    if isinstance(value, str):
+        return truncate(value, limit)
+    if isinstance(value, BaseMessage):
+        return summarize_message(value, limit)
+    if isinstance(value, dict):
+        return truncate("; ".join(f"{key}: {summarize(item, limit)}" for key, item in value.items()), limit)
+    if isinstance(value, (list, tuple)) and value and all(isinstance(item, BaseMessage) for item in value):
+        return truncate(" | ".join(summarize_message(message, limit) for message in value), limit)
+    return truncate(_repr.repr(value), limit)
+
+
+def format_update(update: dict) -> str:
+    """
+    The status event text for one "updates" event of the graph, one line per node.
+
+    Nodes that changed nothing, like the history node while the conversation fits its
+    budget, are left out; the text is empty if no node changed anything.
+    """
+    lines = [f"🚶‍♂️{key}: {summarize(value)}" for key, value in update.items() if value]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+class EventCoalescer:
+    """
+    Batches status texts emitted in quick succession into fewer, size-bounded events.
+
+    The first text after a quiet period is emitted right away; texts arriving within
+    `window` seconds of the last event are buffered and emitted together when the window
+    ends. An event never exceeds `max_chars`: the buffer is emitted early instead, so
+    streamed tokens are never cut. `flush()` must be awaited before the final event.
+    """
+
+    def __init__(self, emit: Callable[[str], Awaitable[None]], window: float, max_chars: int):
+        self.emit = emit
+        self.window = window
+        self.max_chars = max_chars
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._last_emit = float("-inf")
+        self._lock = asyncio.Lock()
+        self._flush_task: asyncio.Task = None
+
+    async def add(self, text: str, line: bool = False) -> None:
+        """Queues a text; `line` texts start on a new line even after streamed tokens."""
+        text = truncate(text, self.max_chars)
+        if line and self._pending and not self._pending[-1].endswith("\n"):
+            text = "\n" + text
+        if self._pending_chars + len(text) > self.max_chars:
+            await self.flush()
+        self._pending.append(text)
+        self._pending_chars += len(text)
+
+        delay = self._last_emit + self.window - time.monotonic()
+        if delay <= 0:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later(delay))
+
+    async def flush(self) -> None:
+        if self._flush_task is not None:
+            # still sleeping: a timed flush clears the task before it emits
+            self._flush_task.cancel()
+            self._flush_task = None
+        # the lock keeps events in order when a timed flush is still emitting
+        async with self._lock:
+            if not self._pending:
+                return
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._pending_chars = 0
+            self._last_emit = time.monotonic()
+            await self.emit(text)
+
+    async def _flush_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self.flush()
@@ -0,0 +1,142 @@
+import json
+import re
+import threading
+from typing import Optional
+
+# Simple questions about the current weather in a single city, e.g. "weather in Rome?",
+# "What's the weather like in New York today?" or "Paris weather". Anything else
+# (several cities, forecasts, advice, follow-ups) goes through the full graph.
+CITY = r"(?P<city>[^\W\d_][\w.'’ -]{0,40}?)"
+NOW = r"(?:\s+(?:today|now|right now|currently|at the moment))?"
+SIMPLE_QUERIES = [
+    re.compile(rf"^(?:(?:what|how)(?:'s|’s| is)\s+)?(?:the\s+)?(?:current\s+)?weather(?:\s+like)?(?:\s+(?:in|for|at))\s+{CITY}{NOW}\s*[?.!]*$", re.IGNORECASE),
+    re.compile(rf"^(?:current\s+)?weather\s*[:-]\s*{CITY}\s*[?.!]*$", re.IGNORECASE),
+    re.compile(rf"^{CITY}\s+weather{NOW}\s*[?.!]*$", re.IGNORECASE),
+]
+# Words that turn a matching sentence into more than a single-city lookup: several places,
+# another time or a unit ("Rome on Monday", "Rome in celsius", "my trip to Rome"), or a question
+NOT_A_CITY = re.compile(
+    r"\b(?:and|or|vs|versus|compared?|how|what|is|are|will|should|does?|like"
+    r"|on|this|next|last|at|in|for|to|from|my|during|trip|before|after|until"
+    r"|tomorrow|tonight|yesterday|forecast|morning|afternoon|evening|night|day|days|week|weekend"
+    r"|month|year|hour|hours|monday|tuesday|wednesday|thursday|friday|saturday|sunday"
+    r"|celsius|fahrenheit|kelvin|degrees|metric|imperial|units?)\b|[,&/°]|\d",
+    re.IGNORECASE,
+)
+# Longer captures are sentences rather than city names
+MAX_CITY_WORDS = 4
+
+WEATHER_TOOL = "get_weather"
+# The weather MCP tool asks open-meteo for fahrenheit; wind speed is open-meteo's default unit
+TEMPERATURE_UNIT = "°F"
+WINDSPEED_UNIT = "km/h"
+
+# WMO weather interpretation codes, as returned by open-meteo
+WEATHER_CODES = {
+    0: "clear sky", 1: "mainly clear", 2: "partly cloudy", 3: "overcast",
+    45: "fog", 48: "depositing rime fog",
+    51: "light drizzle", 53: "moderate drizzle", 55: "dense drizzle",
+    56: "light freezing drizzle", 57: "dense freezing drizzle",
+    61: "slight rain", 63: "moderate rain", 65: "heavy rain",
+    66: "light freezing rain", 67: "heavy freezing rain",
+    71: "slight snowfall", 73: "moderate snowfall", 75: "heavy snowfall", 77: "snow grains",
+    80: "slight rain showers", 81: "moderate rain showers", 82: "violent rain showers",
+    85: "slight snow showers", 86: "heavy snow showers",
+    95: "thunderstorm", 96: "thunderstorm with slight hail", 99: "thunderstorm with heavy hail",
+}
+
+
+def match_simple_query(text: str) -> Optional[str]:
+    """
+    Returns the city if the text only asks for the current weather in one city, else None.
+
+    >>> match_simple_query("weather in Rome?")
+    'Rome'
+    >>> match_simple_query("What's the weather like in New York today?")
+    'New York'
+    >>> match_simple_query("Rio de Janeiro weather")
+    'Rio de Janeiro'
+    >>> match_simple_query("weather in Rome on Monday")
+    >>> match_simple_query("weather in Rome this afternoon")
+    >>> match_simple_query("weather in Rome last year")
+    >>> match_simple_query("weather in Rome in celsius")
+    >>> match_simple_query("weather for my trip to Rome")
+    >>> match_simple_query("weather in Rome and Paris?")
+    >>> match_simple_query("weather in Rome tomorrow?")
+    >>> match_simple_query("How is the weather?")
+    >>> match_simple_query("weather in 2024")
+    """
+    text = " ".join((text or "").split())
+    for pattern in SIMPLE_QUERIES:
+        match = pattern.match(text)
+        if match:
+            city = match.group("city").strip(" .'’-")
+            if city and len(city.split()) <= MAX_CITY_WORDS and not NOT_A_CITY.search(city):
+                return city
+            return None
+    return None
+
+
+def render_weather(city: str, tool_output: str) -> Optional[str]:
+    """Phrases the weather tool's JSON output as an answer, or returns None if it can't be read."""
+    try:
+        weather = json.loads(tool_output)
+        temperature = float(weather["temperature"])
+    except (TypeError, ValueError, KeyError):
+        # e.g. "City X not found": the full graph can ask back or try another spelling
+        return None
+
+    answer = f"The current weather in {city}"
+    description = WEATHER_CODES.get(weather.get("weathercode"))
+    answer += f": {description}, {temperature:g}{TEMPERATURE_UNIT}" if description else f": {temperature:g}{TEMPERATURE_UNIT}"
+    if weather.get("windspeed") is not None:
+        answer += f", with wind at {float(weather['windspeed']):g} {WINDSPEED_UNIT}"
+    return answer + "."
+
+
+class FastPathStats:
+    """
+    Running counts and latencies of requests answered by the fast path and by the full graph.
+
+    The latency saved is estimated as the difference between the mean graph latency and the
+    mean fast path latency, multiplied by the number of fast path answers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {"fast_path": 0, "fallback": 0, "graph": 0}
+        self.seconds = {"fast_path": 0.0, "graph": 0.0}
+
+    def record(self, path: str, seconds: float = None) -> None:
+        """`path` is "fast_path", "graph", or "fallback" for a fast path attempt that fell back to the graph."""
+        with self._lock:
+            self.counts[path] += 1
+            if seconds is not None and path in self.seconds:
+                self.seconds[path] += seconds
+
+    def mean(self, path: str) -> Optional[float]:
+        return self.seconds[path] / self.counts[path] if self.counts[path] else None
+
+    @property
+    def total(self) -> int:
+        return self.counts["fast_path"] + self.counts["graph"]
+
+    @property
+    def rate(self) -> float:
+        return self.counts["fast_path"] / self.total if self.total else 0.0
+
+    def saved_seconds(self) -> Optional[float]:
+        fast, graph = self.mean("fast_path"), self.mean("graph")
+        if fast is None or graph is None:
+            return None
+        return (graph - fast) * self.counts["fast_path"]
+
+    def summary(self) -> str:
+        fast, graph, saved = self.mean("fast_path"), self.mean("graph"), self.saved_seconds()
+        return (
+            f"fast path {self.counts['fast_path']}/{self.total} requests ({self.rate:.0%}), "
+            f"{self.counts['fallback']} fell back to the graph; "
+            f"mean latency fast path {'n/a' if fast is None else f'{fast:.2f}s'}, "
+            f"graph {'n/a' if graph is None else f'{graph:.2f}s'}; "
+            f"estimated latency saved {'n/a' if saved is None else f'{saved:.1f}s'}"
+        )
@@ -1,16 +1,32 @@
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+import logging
 from langgraph.graph import StateGraph, MessagesState, START
 from langchain_mcp_adapters.client import MultiServerMCPClient
-from langchain_core.messages import SystemMessage,  AIMessage
-from langgraph.prebuilt import tools_condition, ToolNode
+from langchain_core.messages import SystemMessage,  AIMessage, HumanMessage, RemoveMessage, ToolMessage
+from langchain_core.tools import BaseTool
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.prebuilt import tools_condition
 from langchain_openai import ChatOpenAI
 import os
 from weather_service.configuration import Configuration
+from weather_service.history import (
+    CHARS_PER_TOKEN, SUMMARY_BUDGET_SHARE, SUMMARY_PREFIX, SUMMARY_PROMPT, interrupted_tool_calls, select_history, transcript,
+)
+
+logger = logging.getLogger(__name__)
 
 config = Configuration()
 
-# Extend MessagesState to include a final answer
+SYSTEM_PROMPT = "You are a helpful assistant tasked with providing weather information. You must use the provided tools to complete your task. When asked about several cities, call the tool for all of them at once."
+
+# Extend MessagesState to include a final answer, and the summary of older turns in multi-turn mode
 class ExtendedMessagesState(MessagesState):
      final_answer: str = ""
+     summary: str = ""
 
 def get_mcpclient():
     return MultiServerMCPClient({
@@ -20,47 +36,244 @@ def get_mcpclient():
         }
     })
 
-async def get_graph(client) -> StateGraph:
-    llm = ChatOpenAI(
+def get_llm() -> ChatOpenAI:
+    return ChatOpenAI(
         model=config.llm_model,
         openai_api_key=config.llm_api_key,
         openai_api_base=config.llm_api_base,
         temperature=0,
     )
 
-    # Get tools asynchronously
-    tools = await client.get_tools()
+def tools_node(tools: list[BaseTool], max_parallel: int = None, timeout: float = None):
+    """
+    A graph node running all tool calls of the last AI message concurrently.
+
+    At most `max_parallel` calls of one turn run at a time, and a call taking longer than
+    `timeout` seconds is abandoned; failures are returned to the model as error tool
+    messages, so one slow or broken city does not fail the whole answer.
+    """
+    tools_by_name = {tool.name: tool for tool in tools}
+    max_parallel = config.max_parallel_tools if max_parallel is None else max_parallel
+    timeout = config.tool_timeout if timeout is None else timeout
+
+    async def run_tools(state: ExtendedMessagesState) -> dict:
+        semaphore = asyncio.Semaphore(max(1, max_parallel))
+
+        async def run_tool(call: dict) -> ToolMessage:
+            tool = tools_by_name.get(call["name"])
+            if tool is None:
+                return ToolMessage(content=f"Error: {call['name']} is not a valid tool, try one of {list(tools_by_name)}.",
+                                   name=call["name"], tool_call_id=call["id"], status="error")
+            async with semaphore:
+                try:
+                    # invoked with the whole tool call, a tool returns a ToolMessage
+                    return await asyncio.wait_for(tool.ainvoke({**call, "type": "tool_call"}), timeout or None)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Tool call {call['name']}({call['args']}) timed out after {timeout}s")
+                    content = f"Error: {call['name']} did not answer within {timeout} seconds."
+                except Exception as e:
+                    logger.warning(f"Tool call {call['name']}({call['args']}) failed: {e}")
+                    content = f"Error: {e}"
+            return ToolMessage(content=content, name=call["name"], tool_call_id=call["id"], status="error")
+
+        tool_calls = state["messages"][-1].tool_calls
+        return {"messages": await asyncio.gather(*(run_tool(call) for call in tool_calls))}
+
+    return run_tools
+
+def history_node(llm: ChatOpenAI, token_budget: int = None, recent_turns: int = None):
+    """
+    A graph node keeping the assistant's prompts within `token_budget` tokens.
+
+    It runs before every assistant call, including those after tool results. Recent turns
+    stay verbatim; once the prompt would outgrow the budget, the older turns are merged
+    into the running summary by one LLM call and removed from the state, so each message
+    is summarized only once. The budget covers the system prompt, the summary (capped at
+    a quarter of the budget) and the kept turns, so every assistant prompt stays within
+    it unless the current turn alone is larger than what remains; a turn is never split.
+    Tokens are estimated from the message text at 4 characters per token; the tool
+    definitions sent along are not counted.
+    """
+    token_budget = config.history_token_budget if token_budget is None else token_budget
+    recent_turns = config.history_recent_turns if recent_turns is None else recent_turns
+    max_summary_tokens = int(token_budget * SUMMARY_BUDGET_SHARE)
+    max_summary_chars = max_summary_tokens * CHARS_PER_TOKEN - len(SUMMARY_PREFIX)
+    conversation_budget = token_budget - len(SYSTEM_PROMPT) // CHARS_PER_TOKEN
+    # about 1.3 tokens per word
+    prompt = SUMMARY_PROMPT.format(words=max(20, int(max_summary_tokens / 1.3)))
+
+    async def compact_history(state: ExtendedMessagesState) -> dict:
+        summary = state.get("summary", "")
+        # LLM APIs reject tool calls without results, so those of an interrupted request are dropped
+        dangling = {message.id for message in interrupted_tool_calls(state["messages"])}
+        messages = [message for message in state["messages"] if message.id not in dangling]
+        removed = [RemoveMessage(id=message_id) for message_id in dangling]
+        old, _ = select_history(messages, summary, conversation_budget, recent_turns, max_summary_tokens)
+        if not old:
+            return {"messages": removed} if removed else {}
+        result = await llm.ainvoke([
+            SystemMessage(content=prompt),
+            HumanMessage(content=f"Summary so far:\n{summary or '(empty)'}\n\nNew conversation lines:\n{transcript(old)}"),
+        ])
+        logger.info(f"Folded {len(old)} older messages into the conversation summary")
+        # the prompt asks for a short summary; the cut keeps the budget even if it isn't
+        summary = str(result.content)[:max_summary_chars]
+        return {"summary": summary, "messages": removed + [RemoveMessage(id=message.id) for message in old]}
+
+    return compact_history
+
+def build_graph(llm: ChatOpenAI, tools: list[BaseTool], max_parallel_tools: int = None, tool_timeout: float = None,
+                checkpointer: BaseCheckpointSaver = None) -> StateGraph:
+    """With a checkpointer, the graph keeps the conversation of each thread_id, bounded by the history node."""
     llm_with_tools = llm.bind_tools(tools)
 
     # System message
-    sys_msg = SystemMessage(content="You are a helpful assistant tasked with providing weather information. You must use the provided tools to complete your task.")
+    sys_msg = SystemMessage(content=SYSTEM_PROMPT)
 
     # Node
-    def assistant(state: ExtendedMessagesState) -> ExtendedMessagesState:
-        result = llm_with_tools.invoke([sys_msg] + state["messages"])
-        state["messages"].append(result)
+    # Async, so a slow LLM call never holds up other requests; when the graph is streamed
+    # with stream_mode "messages", LangGraph streams the tokens of this call as they arrive.
+    async def assistant(state: ExtendedMessagesState) -> dict:
+        context = [sys_msg]
+        if state.get("summary"):
+            context.append(SystemMessage(content=SUMMARY_PREFIX + state["summary"]))
+        result = await llm_with_tools.ainvoke(context + state["messages"])
+        update = {"messages": [result]}
         # Set the final answer only if the result is an AIMessage (i.e., not a tool call)
         # and it's meant to be the final response to the user.
         # This logic might need refinement based on when you truly consider the answer "final".
         if isinstance(result, AIMessage) and not result.tool_calls:
-            state["final_answer"] = result.content
-        return state
+            update["final_answer"] = result.content
+        return update
 
     # Build graph
     builder = StateGraph(ExtendedMessagesState)
     builder.add_node("assistant", assistant)
-    builder.add_node("tools", ToolNode(tools))
-    builder.add_edge(START, "assistant")
+    builder.add_node("tools", tools_node(tools, max_parallel_tools, tool_timeout))
+    if checkpointer is not None:
+        builder.add_node("history", history_node(llm))
+        builder.add_edge(START, "history")
+        builder.add_edge("history", "assistant")
+    else:
+        builder.add_edge(START, "assistant")
     builder.add_conditional_edges(
         "assistant",
         tools_condition,
     )
-    builder.add_edge("tools", "assistant")
+    # with history, the prompt is checked again once the tool results are in
+    builder.add_edge("tools", "history" if checkpointer is not None else "assistant")
 
     # Compile graph
-    graph = builder.compile()
+    graph = builder.compile(checkpointer=checkpointer)
     return graph
 
+async def get_graph(client) -> StateGraph:
+    # Get tools asynchronously
+    tools = await client.get_tools()
+    return build_graph(get_llm(), tools)
+
+def tools_signature(tools: list[BaseTool]) -> str:
+    """A fingerprint of the tool names, descriptions and argument schemas."""
+    catalog = sorted(
+        (tool.name, tool.description or "", json.dumps(tool.args, sort_keys=True, default=str)) for tool in tools
+    )
+    return hashlib.sha256(json.dumps(catalog).encode()).hexdigest()
+
+class GraphManager:
+    """
+    Builds the LLM client, MCP tool bindings and compiled graph once and shares them across requests.
+
+    The compiled graph is stateless between invocations, and the MCP tools open their own
+    session per call, so one instance can serve concurrent requests. The tool list is
+    re-fetched every `refresh_interval` seconds in the background; the graph is only
+    rebuilt when the tools actually changed.
+
+    In multi-turn mode the conversations live in memory. Each one is bounded by the history
+    node, but its checkpoints grow with every turn until it is dropped, so at most
+    `max_conversations` are kept and the least recently used one is deleted beyond that.
+    """
+
+    def __init__(self, client: MultiServerMCPClient = None, refresh_interval: float = None, max_conversations: int = None):
+        self.client = client or get_mcpclient()
+        self.refresh_interval = config.tool_refresh_interval if refresh_interval is None else refresh_interval
+        self.llm = get_llm()
+        # in memory like the task store; kept across graph rebuilds so conversations survive them
+        self.checkpointer = MemorySaver() if config.multi_turn else None
+        self.max_conversations = config.max_conversations if max_conversations is None else max_conversations
+        # thread ids of the kept conversations, least recently used first
+        self._conversations: OrderedDict[str, None] = OrderedDict()
+        self.tools: list[BaseTool] = []
+        self.graph = None
+        self._signature: str = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task = None
+        # the event loop only keeps weak references to tasks
+        self._background_tasks: set[asyncio.Task] = set()
+
+    async def get_graph(self):
+        """Returns the shared graph, connecting to the MCP server on first use."""
+        if self.graph is None:
+            async with self._lock:
+                if self.graph is None:
+                    await self._load_tools()
+        if self.refresh_interval > 0 and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._refresh_periodically())
+        return self.graph
+
+    def get_tool(self, name: str) -> BaseTool:
+        """Returns the loaded MCP tool with this name, or None."""
+        return next((tool for tool in self.tools if tool.name == name), None)
+
+    async def refresh(self) -> bool:
+        """Re-fetches the tool list and rebuilds the graph if it changed. Returns whether it changed."""
+        async with self._lock:
+            return await self._load_tools()
+
+    async def track_conversation(self, thread_id: str) -> None:
+        """Marks a conversation as used, deleting the least recently used ones beyond `max_conversations`."""
+        self._conversations[thread_id] = None
+        self._conversations.move_to_end(thread_id)
+        while len(self._conversations) > self.max_conversations:
+            oldest, _ = self._conversations.popitem(last=False)
+            await self.checkpointer.adelete_thread(oldest)
+            logger.info(f"Dropped conversation {oldest}, more than {self.max_conversations} kept")
+
+    async def close(self) -> None:
+        """Stops the background refreshes, on application shutdown."""
+        for task in [self._refresh_task, *self._background_tasks]:
+            if task is not None:
+                task.cancel()
+
+    async def _load_tools(self) -> bool:
+        tools = await self.client.get_tools()
+        signature = tools_signature(tools)
+        if signature == self._signature and self.graph is not None:
+            return False
+        self.graph = build_graph(self.llm, tools, checkpointer=self.checkpointer)
+        self.tools = tools
+        self._signature = signature
+        logger.info(f"Built weather graph with MCP tools: {[tool.name for tool in tools]}")
+        return True
+
+    def refresh_soon(self) -> None:
+        """Schedules a refresh without waiting for it, e.g. after a request failed mid-graph."""
+        task = asyncio.create_task(self._safe_refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _safe_refresh(self) -> None:
+        try:
+            if await self.refresh():
+                logger.info("MCP tool list changed, weather graph rebuilt")
+        except Exception as e:
+            # keep serving the last known graph; the next refresh tries again
+            logger.warning(f"Failed to refresh MCP tools: {e}")
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self._safe_refresh()
+
 # async def main():
 #     from langchain_core.messages import HumanMessage
 #     client = get_mcpclient()
@@ -0,0 +1,85 @@
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+# Rough size of a token in characters, good enough to keep prompts under a budget
+CHARS_PER_TOKEN = 4
+# Characters of each message shown to the summarizer
+TRANSCRIPT_CHARS = 500
+# Share of the token budget the running summary may take up
+SUMMARY_BUDGET_SHARE = 0.25
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+SUMMARY_PROMPT = (
+    "You maintain a running summary of a conversation with a weather assistant. "
+    "Merge the new conversation lines into the summary so far. Keep the cities, dates and "
+    "weather figures the user may refer back to, and the user's preferences; drop small talk. "
+    "Answer with the updated summary only, in at most {words} words."
+)
+
+
+def estimate_tokens(messages: list[BaseMessage]) -> int:
+    return sum(len(str(message.content)) for message in messages) // CHARS_PER_TOKEN
+
+
+def split_turns(messages: list[BaseMessage]) -> list[list[BaseMessage]]:
+    """Groups messages into turns, each starting at a user message, so tool calls stay with their results."""
+    turns = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+def interrupted_tool_calls(messages: list[BaseMessage]) -> list[BaseMessage]:
+    """AI messages whose tool calls didn't all get results, e.g. left behind by a failed request, and their partial results."""
+    answered = {message.tool_call_id for message in messages if isinstance(message, ToolMessage)}
+    interrupted = [
+        message for message in messages
+        if isinstance(message, AIMessage) and message.tool_calls
+        and any(call["id"] not in answered for call in message.tool_calls)
+    ]
+    call_ids = {call["id"] for message in interrupted for call in message.tool_calls}
+    return interrupted + [message for message in messages if isinstance(message, ToolMessage) and message.tool_call_id in call_ids]
+
+
+def summary_tokens(summary: str) -> int:
+    """Tokens of the summary as sent to the assistant, including its prefix."""
+    return len(SUMMARY_PREFIX + summary) // CHARS_PER_TOKEN if summary else 0
+
+
+def select_history(messages: list[BaseMessage], summary: str, budget: int, recent_turns: int,
+                   max_summary_tokens: int) -> tuple[list, list]:
+    """
+    Splits the conversation into (messages to fold into the summary, messages kept verbatim).
+
+    `budget` is what is left for the conversation once the system prompt is accounted for.
+    Nothing is folded while the conversation and the current summary fit it. Otherwise the
+    last `recent_turns` turns are kept, fewer if even they don't fit next to a summary of
+    `max_summary_tokens`, but always the current one.
+    """
+    if estimate_tokens(messages) + summary_tokens(summary) <= budget:
+        return [], messages
+
+    turns = split_turns(messages)
+    keep = max(1, min(recent_turns, len(turns)))
+    while keep > 1 and estimate_tokens([m for turn in turns[-keep:] for m in turn]) + max_summary_tokens > budget:
+        keep -= 1
+    old = [message for turn in turns[:-keep] for message in turn]
+    recent = [message for turn in turns[-keep:] for message in turn]
+    return old, recent
+
+
+def transcript(messages: list[BaseMessage]) -> str:
+    """The messages as plain conversation lines for the summarizer."""
+    lines = []
+    for message in messages:
+        content = str(message.content)[:TRANSCRIPT_CHARS]
+        if isinstance(message, HumanMessage):
+            lines.append(f"User: {content}")
+        elif isinstance(message, ToolMessage):
+            lines.append(f"Tool {message.name}: {content}")
+        elif isinstance(message, AIMessage) and message.tool_calls:
+            lines.append("Assistant called: " + ", ".join(f"{call['name']}({call['args']})" for call in message.tool_calls))
+        elif content:
+            lines.append(f"Assistant: {content}")
+    return "\n".join(lines)